@@ -0,0 +1,116 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark the latency of ``Connection.connect``.
+
+The connection is made to a local HTTP server that adds a fixed latency to every response and
+serves an API definition of configurable size. The ``sequential`` case reproduces the previous
+connection check, which downloaded the full API definition before checking the server version.
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import tempfile
+import threading
+import time
+
+from ansys.grantami.jobqueue import Connection, ServerVersionCache
+from ansys.grantami.jobqueue._connection import API_DEFINITION_PATH, _get_mi_server_version
+from common import measure, parse_args, report
+
+MIB = 1024 * 1024
+
+
+class _ServerApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+    definition_size = 0
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency)
+        if self.path.endswith(API_DEFINITION_PATH):
+            body = b" " * self.definition_size
+        elif self.path.endswith("/schema/mi-version"):
+            body = json.dumps({"version": "25.2.0.0", "majorMinorVersion": "25.2"}).encode()
+        else:
+            body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            # The API definition probe closes the connection without reading the body
+            pass
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _SequentialConnection(Connection):
+    """Connection that downloads the full API definition, then checks the server version."""
+
+    @staticmethod
+    def _test_connection(client, version_cache=None):
+        client.call_api(resource_path=API_DEFINITION_PATH, method="GET")
+        _get_mi_server_version(client)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Server latency per request in seconds."
+    )
+    parser.add_argument(
+        "--definition-size", type=int, default=4, help="Size of the API definition in MiB."
+    )
+
+
+def main() -> None:
+    args = parse_args(__doc__, _add_arguments)
+    _ServerApiHandler.latency = args.latency
+    _ServerApiHandler.definition_size = args.definition_size * MIB
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ServerApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/mi_servicelayer"
+
+    with tempfile.TemporaryDirectory() as folder:
+        cache = ServerVersionCache(f"{folder}/versions.json")
+        Connection(url, version_cache=cache).with_anonymous().connect()
+        results = {
+            "sequential": measure(
+                lambda: _SequentialConnection(url).with_anonymous().connect(), args.repeat
+            ),
+            "concurrent": measure(lambda: Connection(url).with_anonymous().connect(), args.repeat),
+            "cached": measure(
+                lambda: Connection(url, version_cache=cache).with_anonymous().connect(),
+                args.repeat,
+            ),
+        }
+    server.shutdown()
+    report("Connection.connect latency", results, args.json, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
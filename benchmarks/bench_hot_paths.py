@@ -0,0 +1,113 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark the in-memory code paths that run for every job in every polling cycle.
+
+Each case runs over synthetic job models, with no HTTP requests, at 1,000, 10,000, and 100,000
+jobs. Per-job costs are small, so the cases are timed over the whole collection.
+
+Cases:
+
+* ``_update_job``: update every job with an unchanged model, and with a model whose status changed.
+* ``create_job``: create the ``AsyncJob`` subclass for every job model through the registry.
+* ``status``: read the ``JobStatus`` of every job.
+* ``jobs sort``: sort the tracked jobs by queue position, as ``JobQueueApiClient.jobs`` does.
+* ``_render_job_parameters``: serialize an export job request with one record per job.
+
+Baselines are checked in to ``baselines/hot_paths.json``. Compare against them with
+``--baseline baselines/hot_paths.json``, and regenerate them with
+``--json baselines/hot_paths.json`` on the same machine after an intended change. Absolute
+timings depend on the machine, so only compare runs made on the same machine.
+"""
+
+import copy
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+
+from ansys.grantami.jobqueue import AsyncJob, ExcelExportJobRequest, ExportRecord
+from common import build_client, build_gsa_jobs, measure, parse_args, report
+
+SIZES = [1_000, 10_000, 100_000]
+TEMPLATE_FILE = "ExcelExportTemplateFile.xlsx"
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    results = {}
+    job_queue_api = Mock(spec=api.JobQueueApi)
+    for size in SIZES:
+        job_objs = build_gsa_jobs(size, pending=size // 10)
+        jobs = [AsyncJob.create_job(job_obj, job_queue_api) for job_obj in job_objs]
+
+        results[f"_update_job unchanged ({size})"] = measure(
+            lambda: [job._update_job(job_obj) for job, job_obj in zip(jobs, job_objs)],
+            repeat=args.repeat,
+        )
+        running = []
+        for job_obj in job_objs:
+            changed = copy.copy(job_obj)
+            changed.status = models.GsaJobStatus.RUNNING
+            running.append(changed)
+        # Alternate between two states, so that every call applies a change
+        states = [running, job_objs]
+
+        def update_changed() -> None:
+            states.reverse()
+            for job, job_obj in zip(jobs, states[0]):
+                job._update_job(job_obj)
+
+        results[f"_update_job changed ({size})"] = measure(update_changed, repeat=args.repeat)
+
+        results[f"create_job ({size})"] = measure(
+            lambda: [AsyncJob.create_job(job_obj, job_queue_api) for job_obj in job_objs],
+            repeat=args.repeat,
+        )
+        results[f"status ({size})"] = measure(
+            lambda: [job.status for job in jobs], repeat=args.repeat
+        )
+
+        client = build_client()
+        client._reconcile_jobs(job_objs)
+        # Skip the request for the job list, so that only the sort is timed
+        client._refetch_jobs = lambda: None
+        results[f"jobs sort ({size})"] = measure(lambda: client.jobs, repeat=args.repeat)
+
+        job_request = ExcelExportJobRequest(
+            name="Export",
+            description=None,
+            template_file=TEMPLATE_FILE,
+            database_key="MI_Training",
+            records=[
+                ExportRecord(record_history_identity=index, record_version=1)
+                for index in range(size)
+            ],
+        )
+        results[f"_render_job_parameters ({size})"] = measure(
+            job_request._render_job_parameters, repeat=args.repeat
+        )
+    report("hot paths", results, args.json, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark the time taken to import the package, using ``python -X importtime``.
+
+Each import runs in a new interpreter, so that no module is already cached. The reported time is
+the cumulative import time of the top-level module, as measured by the interpreter itself. Use
+``--max-ms`` to fail with a non-zero exit code if importing the package becomes slower, for
+example in a CI job.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+from common import parse_args, report
+
+PACKAGE = "ansys.grantami.jobqueue"
+
+CASES = {
+    "package": f"import {PACKAGE}",
+    "version": f"from {PACKAGE} import __version__",
+    "upload-cache": f"from {PACKAGE} import UploadCache",
+    "connection": f"from {PACKAGE} import Connection",
+}
+
+
+def _import_time(statement: str) -> float:
+    """Run a statement in a new interpreter and return the import time of the package in seconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines have the form "import time: self [us] | cumulative [us] | module", and nested imports
+    # are indented. Names imported lazily are loaded after the package itself, so also add every
+    # top-level import that happens after the package.
+    total = 0
+    found = False
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2]
+        if name.strip() == PACKAGE:
+            found = True
+        if found and not name.startswith("  "):
+            total += int(fields[1])
+    return total / 1e6
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Exit with an error if the median time to import the package exceeds this value.",
+    )
+
+
+def main() -> None:
+    args = parse_args(__doc__, _add_arguments)
+    results: Dict[str, Dict[str, float]] = {}
+    for case, statement in CASES.items():
+        timings = [_import_time(statement) for _ in range(args.repeat)]
+        results[case] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "max": max(timings),
+            "repeat": args.repeat,
+        }
+    report("Import time", results, args.json, args.baseline)
+    if args.max_ms is not None and results["package"]["median"] * 1000 > args.max_ms:
+        sys.exit(
+            f"Importing {PACKAGE} took {results['package']['median'] * 1000:.1f} ms, which "
+            f"exceeds the limit of {args.max_ms} ms."
+        )
+
+
+if __name__ == "__main__":
+    main()
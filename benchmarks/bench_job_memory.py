@@ -0,0 +1,75 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark the memory retained for each job tracked by the client.
+
+The job models are built and reconciled while memory allocations are traced, then discarded, so
+the result includes every object retained by the tracked jobs, such as strings and dates that
+were deserialized from the server response.
+"""
+
+import gc
+import tracemalloc
+
+from ansys.grantami.serverapi_openapi.v2025r2 import models
+
+from common import build_client, build_gsa_jobs, parse_args, report
+
+SIZES = [10_000, 100_000]
+
+
+def _deserialized_copy(job_obj: models.GsaJob) -> models.GsaJob:
+    """
+    Give a job model its own string objects.
+
+    Deserializing a server response creates new string objects for every job, even if the values
+    are identical, whereas the synthetic models share string constants.
+    """
+    job_obj.type = job_obj.type.encode().decode()
+    job_obj.submitter_name = job_obj.submitter_name.encode().decode()
+    job_obj.submitter_roles = [role.encode().decode() for role in job_obj.submitter_roles]
+    return job_obj
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    results = {}
+    for size in SIZES:
+        client = build_client()
+        gc.collect()
+        tracemalloc.start()
+        remote = [_deserialized_copy(job) for job in build_gsa_jobs(size, pending=size // 100)]
+        client._reconcile_jobs(remote, flush_jobs=True)
+        del remote
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f"tracked jobs ({size})"] = {
+            "bytes per job": round(retained / size),
+            "total KiB": retained // 1024,
+        }
+    report("job memory", results, args.json, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
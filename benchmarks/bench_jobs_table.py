@@ -0,0 +1,95 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark queue and run time statistics over all jobs, computed from job objects and from a table.
+
+The job object loop is the one that :meth:`.JobQueueApiClient.jobs_table` replaces. Building a
+table converts each job once and keeps the converted values until the job changes, so the
+"cold" cases also parse the import job summaries and convert every date.
+"""
+
+import statistics
+
+from common import build_client, build_gsa_jobs, measure, parse_args, report
+
+SIZES = [10_000, 100_000]
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    results = {}
+    for size in SIZES:
+        client = build_client()
+        client._reconcile_jobs(build_gsa_jobs(size, pending=size // 100), flush_jobs=True)
+        jobs = list(client._jobs.values())
+
+        def from_job_objects() -> None:
+            queue_times = []
+            run_times = []
+            for job in jobs:
+                started = job.execution_date_time
+                if started is None:
+                    continue
+                submitted = job.submitter_information["date_time"]
+                queue_times.append((started - submitted).total_seconds())
+                completed = job.completion_date_time
+                if completed is not None:
+                    run_times.append((completed - started).total_seconds())
+            statistics.median(queue_times)
+            statistics.median(run_times)
+
+        def clear_cached_values() -> None:
+            client._last_jobs_table = None
+            for job in jobs:
+                job._output_information_view = None
+
+        results[f"job objects ({size})"] = measure(from_job_objects, repeat=args.repeat)
+        results[f"build table, cold ({size})"] = measure(
+            lambda: client.jobs_table(refresh=False),
+            repeat=args.repeat,
+            setup=clear_cached_values,
+        )
+        results[f"build table ({size})"] = measure(
+            lambda: client.jobs_table(refresh=False), repeat=args.repeat
+        )
+        try:
+            import numpy
+        except ImportError:
+            continue
+
+        def from_table() -> None:
+            columns = client.jobs_table(refresh=False).to_numpy()
+            numpy.nanmedian(columns["execution_time"] - columns["submission_time"])
+            numpy.nanmedian(columns["completion_time"] - columns["execution_time"])
+
+        results[f"build table and NumPy ({size})"] = measure(from_table, repeat=args.repeat)
+        columns = client.jobs_table(refresh=False).to_numpy()
+        results[f"NumPy on existing table ({size})"] = measure(
+            lambda: numpy.nanmedian(columns["completion_time"] - columns["execution_time"]),
+            repeat=args.repeat,
+        )
+    report("jobs table", results, args.json, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
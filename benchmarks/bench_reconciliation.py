@@ -0,0 +1,63 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark reconciliation of the local job registry against a server job list."""
+
+from common import build_client, build_gsa_jobs, measure, parse_args, report
+
+SIZES = [10_000, 100_000]
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    results = {}
+    for size in SIZES:
+        remote = build_gsa_jobs(size, pending=size // 100)
+        client = build_client()
+
+        results[f"initial load ({size})"] = measure(
+            lambda: client._reconcile_jobs(remote, flush_jobs=True),
+            repeat=args.repeat,
+            setup=client._jobs.clear,
+        )
+        results[f"unchanged refresh ({size})"] = measure(
+            lambda: client._reconcile_jobs(remote, flush_jobs=True), repeat=args.repeat
+        )
+
+        # Every run removes 1% of the jobs from the response and renames another 1%.
+        def churn() -> None:
+            client._jobs.clear()
+            client._reconcile_jobs(remote)
+            for job_obj in remote[size // 100 : size // 50]:
+                job_obj.name = f"{job_obj.name} (renamed)"
+
+        results[f"1% changed, 1% removed ({size})"] = measure(
+            lambda: client._reconcile_jobs(remote[size // 100 :], flush_jobs=True),
+            repeat=args.repeat,
+            setup=churn,
+        )
+    report("reconciliation", results, args.json, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark end-to-end client throughput against a simulated Job Queue server.
+
+Every case runs the public client API over HTTP against a ``SimulatedJobQueueServer`` in the same
+process, so the results include serialization, the HTTP stack, and the client's own bookkeeping,
+but not the latency of a real network or Granta MI server. Use ``--latency`` to add a fixed delay
+to every response.
+
+Cases:
+
+* ``create_job``: jobs submitted per second, each with two small input files.
+* ``_post_files``: upload throughput for a job request with several large input files.
+* ``jobs`` and ``jobs_where``: latency of listing the queue as it grows.
+* ``wait``: time from a job completing on the server to ``wait_for_jobs`` returning.
+* ``get_file_content``: download throughput for a large output file.
+
+Run with ``--json results.json`` to save the results, and with ``--baseline results.json`` to
+compare a later run against them.
+"""
+
+import argparse
+import os
+import pathlib
+import tempfile
+import time
+from typing import List
+
+from ansys.grantami.jobqueue import ExcelImportJobRequest, FixedPollingStrategy, JobType
+from ansys.grantami.jobqueue._simulator import SimulatedJobQueueServer
+from common import measure, parse_args, report
+
+MIB = 1024 * 1024
+QUEUE_SIZES = [1_000, 10_000]
+WAIT_JOB_NAME = "Wait"
+
+
+def _write_file(path: pathlib.Path, size: int) -> pathlib.Path:
+    """Write a file of random bytes, so that uploads cannot be compressed or deduplicated."""
+    with open(path, "wb") as f:
+        for offset in range(0, size, MIB):
+            f.write(os.urandom(min(MIB, size - offset)))
+    return path
+
+
+def _build_requests(
+    count: int, template: pathlib.Path, data: List[pathlib.Path], name: str = "Job"
+) -> List[ExcelImportJobRequest]:
+    return [
+        ExcelImportJobRequest(
+            name=f"{name} {index}", description=None, template_file=template, data_files=data
+        )
+        for index in range(count)
+    ]
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--jobs", type=int, default=100, help="Jobs submitted per create_job run.")
+    parser.add_argument(
+        "--upload-size", type=int, default=16, help="Size of each uploaded file in MiB."
+    )
+    parser.add_argument("--upload-files", type=int, default=4, help="Number of uploaded files.")
+    parser.add_argument(
+        "--download-size", type=int, default=64, help="Size of the output file in MiB."
+    )
+    parser.add_argument(
+        "--job-duration", type=float, default=0.5, help="Duration of the jobs waited for, in s."
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Latency added to every response, in s."
+    )
+
+
+def main() -> None:
+    args = parse_args(__doc__, _add_arguments)
+    results = {}
+
+    def job_duration(job) -> float:
+        return args.job_duration if job.name.startswith(WAIT_JOB_NAME) else 0.0
+
+    server = SimulatedJobQueueServer(
+        concurrency=4,
+        job_duration=job_duration,
+        latency=args.latency,
+        output_file_size=args.download_size * MIB,
+    )
+    with server, tempfile.TemporaryDirectory() as directory:
+        folder = pathlib.Path(directory)
+        client = server.connect()
+        template = _write_file(folder / "template.xlsx", 1024)
+        data = _write_file(folder / "data.xlsx", 1024)
+
+        job_requests: List[ExcelImportJobRequest] = []
+
+        def build_job_requests() -> None:
+            job_requests[:] = _build_requests(args.jobs, template, [data])
+
+        stats = measure(
+            lambda: [client.create_job(job_request) for job_request in job_requests],
+            repeat=args.repeat,
+            setup=build_job_requests,
+        )
+        stats["jobs/s"] = int(args.jobs / stats["median"])
+        results[f"create_job ({args.jobs} jobs)"] = stats
+
+        large_files = [
+            _write_file(folder / f"large_{index}.xlsx", args.upload_size * MIB)
+            for index in range(args.upload_files)
+        ]
+        upload_requests: List[ExcelImportJobRequest] = []
+
+        def build_upload_request() -> None:
+            upload_requests[:] = _build_requests(1, template, large_files)
+
+        stats = measure(
+            lambda: client._post_files(upload_requests[0]),
+            repeat=args.repeat,
+            setup=build_upload_request,
+        )
+        uploaded = args.upload_files * args.upload_size
+        stats["MiB/s"] = int(uploaded / stats["median"])
+        results[f"_post_files ({args.upload_files} x {args.upload_size} MiB)"] = stats
+
+        for size in QUEUE_SIZES:
+            server.add_jobs(size - len(client.jobs))
+            results[f"jobs ({size} jobs)"] = measure(lambda: client.jobs, repeat=args.repeat)
+            results[f"jobs_where ({size} jobs)"] = measure(
+                lambda: client.jobs_where(job_type=JobType.ExcelImportJob, name="Job 1"),
+                repeat=args.repeat,
+            )
+
+        # Poll at a fixed interval, so that the overhead does not depend on the backoff schedule
+        polling_strategy = FixedPollingStrategy(interval=0.1)
+        overheads = []
+        polls_before = server.request_counts.get("GET /v1alpha/job-queue/jobs/{id}", 0)
+        for job_request in _build_requests(args.repeat, template, [data], name=WAIT_JOB_NAME):
+            job = client.create_job(job_request)
+            client.wait_for_jobs([job], polling_strategy=polling_strategy)
+            overheads.append(time.time() - server.get_job(job.id).completion_time)
+        polls = server.request_counts["GET /v1alpha/job-queue/jobs/{id}"] - polls_before
+        results[f"wait ({args.job_duration} s jobs)"] = {
+            "min": min(overheads),
+            "median": sorted(overheads)[len(overheads) // 2],
+            "max": max(overheads),
+            "repeat": args.repeat,
+            "polls/job": round(polls / args.repeat),
+        }
+
+        job = client.create_job_and_wait(_build_requests(1, template, [data])[0])
+        stats = measure(lambda: job.get_file_content(job.output_file_names[0]), repeat=args.repeat)
+        stats["MiB/s"] = int(args.download_size / stats["median"])
+        results[f"get_file_content ({args.download_size} MiB)"] = stats
+
+    report("throughput", results, args.json, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
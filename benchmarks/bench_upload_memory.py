@@ -0,0 +1,128 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Benchmark peak memory usage and throughput when uploading a large file.
+
+Each upload mode runs in a separate process against a local HTTP server that discards the request
+body, so the reported peak resident set size only includes memory used by that mode. Use
+``--size`` to upload a multi-GB file. The file is created sparse, so it does not use disk space.
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from ansys.grantami.jobqueue._streaming import _StreamingUpload
+from common import build_client, parse_args, report
+
+MODES = ["buffered", "streaming", "streaming-mmap"]
+MIB = 1024 * 1024
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        remaining = int(self.headers["Content-Length"])
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, MIB)))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", "7")
+        self.end_headers()
+        self.wfile.write(b"file-id")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _peak_rss() -> int:
+    """Peak resident set size of the current process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _upload(mode: str, url: str, path: pathlib.Path) -> None:
+    """Upload a file with a single mode and print the results as JSON."""
+    client = build_client()
+    client.api_url = url
+    baseline = _peak_rss()
+    start = time.perf_counter()
+    if mode == "buffered":
+        client.job_queue_api.upload_file(file=path)
+    else:
+        _StreamingUpload(memory_map=mode == "streaming-mmap").upload_file(client, path)
+    elapsed = time.perf_counter() - start
+    size = path.stat().st_size
+    print(
+        json.dumps(
+            {
+                "seconds": elapsed,
+                "MiB/s": int(size / MIB / elapsed),
+                "peak RSS MiB": round(_peak_rss() / MIB),
+                "RSS growth MiB": round((_peak_rss() - baseline) / MIB),
+            }
+        )
+    )
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--size", type=int, default=1024, help="File size in MiB.")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    parser.add_argument("--file", type=pathlib.Path, help=argparse.SUPPRESS)
+
+
+def main() -> None:
+    args = parse_args(__doc__, _add_arguments)
+    if args.mode is not None:
+        _upload(args.mode, args.url, args.file)
+        return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UploadHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory, "upload.bin")
+        with open(path, "wb") as f:
+            f.truncate(args.size * MIB)
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--url", url, "--file", str(path)],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            results[f"{mode} ({args.size} MiB)"] = json.loads(output)
+    server.shutdown()
+    report("upload memory", results, args.json, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
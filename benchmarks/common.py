@@ -0,0 +1,147 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Shared helpers for the benchmark scripts."""
+
+import argparse
+import datetime
+import json
+import pathlib
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+import uuid
+
+from ansys.grantami.serverapi_openapi.v2025r2 import models
+from ansys.openapi.common import SessionConfiguration
+import requests
+
+from ansys.grantami.jobqueue import JobQueueApiClient
+
+SERVICE_LAYER_URL = "http://my_mi_server/mi_servicelayer"
+
+
+def build_gsa_jobs(count: int, pending: int = 0) -> List[models.GsaJob]:
+    """Build ``count`` synthetic job models, the first ``pending`` of which are queued."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    jobs = []
+    for index in range(count):
+        is_pending = index < pending
+        jobs.append(
+            models.GsaJob(
+                id=str(uuid.uuid4()),
+                name=f"Job {index}",
+                description=None,
+                status=models.GsaJobStatus.PENDING if is_pending else models.GsaJobStatus.SUCCEEDED,
+                type="ExcelImportJob" if index % 2 else "ExcelExportJob",
+                position=index + 1 if is_pending else None,
+                submitter_name="User_1",
+                submission_date=now - datetime.timedelta(seconds=count - index),
+                submitter_roles=["Role1"],
+                execution_date=None if is_pending else now,
+                completion_date=None if is_pending else now,
+                job_specific_outputs=(
+                    None if is_pending else {"summary": json.dumps({"FinishedSuccessfully": True})}
+                ),
+                output_file_names=None if is_pending else [f"Job {index}.log"],
+            )
+        )
+    return jobs
+
+
+def build_client() -> JobQueueApiClient:
+    """Build a client that is not connected to a server."""
+    return JobQueueApiClient(requests.Session(), SERVICE_LAYER_URL, SessionConfiguration())
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, setup: Optional[Callable[[], Any]] = None):
+    """Run ``func`` ``repeat`` times and return timing statistics in seconds."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "repeat": repeat,
+    }
+
+
+def parse_args(
+    description: str, add_arguments: Optional[Callable[[argparse.ArgumentParser], None]] = None
+) -> argparse.Namespace:
+    """Parse the command-line arguments shared by all benchmark scripts, plus any extra ones."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--json", type=pathlib.Path, default=None, help="Write results to this JSON file."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per case.")
+    parser.add_argument(
+        "--baseline",
+        type=pathlib.Path,
+        default=None,
+        help="Compare the median of each case with a JSON file written by --json.",
+    )
+    if add_arguments is not None:
+        add_arguments(parser)
+    return parser.parse_args()
+
+
+def report(
+    name: str,
+    results: Dict[str, Dict[str, Any]],
+    json_path: Optional[pathlib.Path],
+    baseline_path: Optional[pathlib.Path] = None,
+):
+    """
+    Print the results as a table, and optionally write them to a JSON file.
+
+    If ``baseline_path`` is provided, the median of each case is compared with the same case in a
+    previous JSON file, and the ratio is printed. Ratios above 1 are slower than the baseline.
+    """
+    print(f"{name}")
+    baseline = json.loads(baseline_path.read_text())["results"] if baseline_path else {}
+    width = max(len(case) for case in results)
+    for case, stats in results.items():
+        values = ", ".join(
+            f"{key}: {value * 1000:.3f} ms" if isinstance(value, float) else f"{key}: {value}"
+            for key, value in stats.items()
+        )
+        previous = baseline.get(case, {}).get("median")
+        if previous and "median" in stats:
+            values += f", vs baseline: {stats['median'] / previous:.2f}x"
+        print(f"  {case:<{width}}  {values}")
+    if json_path is not None:
+        document = {
+            "benchmark": name,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "results": results,
+        }
+        json_path.write_text(json.dumps(document, indent=2))
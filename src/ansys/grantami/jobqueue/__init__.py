@@ -22,38 +22,111 @@
 
 """Python client for Granta MI Server API Job Queue."""
 
-import importlib.metadata as importlib_metadata
-
-from ._connection import Connection, JobQueueApiClient
-from ._models import (
-    AsyncJob,
-    ExcelExportJobRequest,
-    ExcelImportJobRequest,
-    ExportJob,
-    ExportRecord,
-    ImportJob,
-    JobFile,
-    JobQueueProcessingConfiguration,
-    JobRequest,
-    JobStatus,
-    JobType,
-    TextImportJobRequest,
-)
-
-__all__ = [
-    "AsyncJob",
-    "Connection",
-    "ExcelExportJobRequest",
-    "ExcelImportJobRequest",
-    "ExportJob",
-    "ExportRecord",
-    "ImportJob",
-    "JobFile",
-    "JobQueueApiClient",
-    "JobQueueProcessingConfiguration",
-    "JobRequest",
-    "JobStatus",
-    "JobType",
-    "TextImportJobRequest",
-]
-__version__ = importlib_metadata.version(__name__.replace(".", "-"))
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from ._connection import Connection, JobQueueApiClient
+    from ._instrumentation import (
+        EndpointStatistics,
+        LatencyAggregator,
+        OpenTelemetryHook,
+        RequestEvent,
+    )
+    from ._metrics import JobMetrics, MetricsServer
+    from ._models import (
+        AsyncJob,
+        ExcelExportJobRequest,
+        ExcelImportJobRequest,
+        ExportJob,
+        ExportRecord,
+        FileDownloadError,
+        FileUploadError,
+        ImportJob,
+        JobFile,
+        JobQueueProcessingConfiguration,
+        JobRequest,
+        JobStatus,
+        JobType,
+        OutputFileDownload,
+        SubmissionResult,
+        TextImportJobRequest,
+        WaitCondition,
+    )
+    from ._polling import BackoffPollingStrategy, FixedPollingStrategy, PollingStrategy
+    from ._pooling import ConnectionPoolConfiguration, ConnectionPoolStatistics
+    from ._retry import CircuitOpenError, RetryPolicy
+    from ._streaming import OutputFileStream, TransferProgress
+    from ._table import JobTable
+    from ._upload_cache import UploadCache, UploadCacheStatistics
+    from ._version_cache import ServerVersionCache
+    from ._watcher import JobEvent, JobEventType, JobWatcher
+
+# Public names are imported from their module on first access, so that importing the package
+# does not import the Server API client and its models. Names defined in modules that do not
+# depend on the job models, such as RetryPolicy or UploadCache, can also be used without importing
+# the Server API client. The names must also be imported above for type checkers.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AsyncJob": "._models",
+    "BackoffPollingStrategy": "._polling",
+    "CircuitOpenError": "._retry",
+    "Connection": "._connection",
+    "ConnectionPoolConfiguration": "._pooling",
+    "ConnectionPoolStatistics": "._pooling",
+    "EndpointStatistics": "._instrumentation",
+    "ExcelExportJobRequest": "._models",
+    "ExcelImportJobRequest": "._models",
+    "ExportJob": "._models",
+    "ExportRecord": "._models",
+    "FileDownloadError": "._models",
+    "FileUploadError": "._models",
+    "FixedPollingStrategy": "._polling",
+    "ImportJob": "._models",
+    "JobEvent": "._watcher",
+    "JobEventType": "._watcher",
+    "JobFile": "._models",
+    "JobMetrics": "._metrics",
+    "JobQueueApiClient": "._connection",
+    "JobQueueProcessingConfiguration": "._models",
+    "JobRequest": "._models",
+    "JobStatus": "._models",
+    "JobTable": "._table",
+    "JobType": "._models",
+    "JobWatcher": "._watcher",
+    "LatencyAggregator": "._instrumentation",
+    "MetricsServer": "._metrics",
+    "OpenTelemetryHook": "._instrumentation",
+    "OutputFileDownload": "._models",
+    "OutputFileStream": "._streaming",
+    "PollingStrategy": "._polling",
+    "RequestEvent": "._instrumentation",
+    "RetryPolicy": "._retry",
+    "ServerVersionCache": "._version_cache",
+    "SubmissionResult": "._models",
+    "TextImportJobRequest": "._models",
+    "TransferProgress": "._streaming",
+    "UploadCache": "._upload_cache",
+    "UploadCacheStatistics": "._upload_cache",
+    "WaitCondition": "._models",
+}
+
+__all__ = sorted(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name, or resolve the package version, on first access."""
+    if name == "__version__":
+        import importlib.metadata as importlib_metadata
+
+        value = importlib_metadata.version(__name__.replace(".", "-"))
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the attributes of the package, including names that have not been imported yet."""
+    return sorted({*globals(), *__all__, "__version__"})
@@ -22,9 +22,27 @@
 
 """Module for connections."""
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import fnmatch
+import math
+import pathlib
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Tuple, cast
-import warnings
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ansys.grantami.serverapi_openapi.v2025r2 import api, models
 from ansys.openapi.common import (
@@ -32,13 +50,52 @@ from ansys.openapi.common import (
     ApiClientFactory,
     ApiException,
     SessionConfiguration,
-    UndefinedObjectWarning,
     generate_user_agent,
 )
 import requests  # type: ignore[import-untyped]
+from requests.adapters import DEFAULT_POOLSIZE
 
+from ._instrumentation import RequestHook, _get_request_hooks, _get_request_size, _RequestTimer
 from ._logger import logger
-from ._models import AsyncJob, JobQueueProcessingConfiguration, JobRequest, JobStatus, JobType
+from ._metrics import JobMetrics
+from ._models import (
+    AsyncJob,
+    ExcelExportJobRequest,
+    FileDownloadError,
+    JobQueueProcessingConfiguration,
+    JobRequest,
+    JobStatus,
+    JobType,
+    OutputFileDownload,
+    SubmissionResult,
+    TextImportJobRequest,
+    WaitCondition,
+    _FileType,
+    _JobFile,
+)
+from ._polling import BackoffPollingStrategy, PollingStrategy
+from ._pooling import (
+    ConnectionPoolConfiguration,
+    ConnectionPoolStatistics,
+    _configure_connection_pool,
+    _get_connection_pool_statistics,
+    _resize_connection_pool,
+)
+from ._retry import RetryPolicy, _call_with_retry
+from ._sharding import (
+    _get_template_file,
+    _merge_export_outputs,
+    _merge_job_summaries,
+    _split_export_request,
+    _split_text_import_request,
+)
+from ._streaming import DEFAULT_CHUNK_SIZE, ProgressCallback, _StreamingUpload
+from ._table import JobTable
+from ._upload_cache import UploadCache
+from ._version_cache import ServerVersionCache
+
+if TYPE_CHECKING:
+    from ._watcher import JobWatcher
 
 PROXY_PATH = "/proxy/v1.svc/mi"
 AUTH_PATH = "/Health/v2.svc"
@@ -47,6 +104,15 @@ GRANTA_APPLICATION_NAME_HEADER = "PyGranta JobQueue"
 
 MINIMUM_GRANTA_MI_VERSION = (24, 2)
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_UPLOAD_WORKERS = 4
+
+_INCOMPLETE_STATUSES = {JobStatus.Pending, JobStatus.Running}
+_FAILED_STATUSES = {JobStatus.Failed, JobStatus.Cancelled}
+
+# Status codes returned by the server when a job request refers to an unknown file ID
+_REJECTED_FILE_ID_STATUSES = {400, 404}
+
 _ArgNotProvided = "_ArgNotProvided"
 
 
@@ -76,6 +142,94 @@ def _get_mi_server_version(client: ApiClient) -> Tuple[int, ...]:
     return server_version
 
 
+def _probe_api_definition(client: ApiClient) -> None:
+    """
+    Check that the Server API definition exists, without downloading it.
+
+    Only the response headers are read. The connection is released before the body is received.
+    The request is retried according to the retry policy of the client, and reported to its
+    request hooks.
+
+    Parameters
+    ----------
+    client : :class:`~.JobQueueApiClient`
+        Client object.
+
+    Raises
+    ------
+    ApiException
+        If the server returns an error response.
+    """
+
+    def probe_api_definition() -> None:
+        hooks = _get_request_hooks(client)
+        timer = _RequestTimer(hooks, "GET", API_DEFINITION_PATH) if hooks else None
+        try:
+            response = client.rest_client.get(client.api_url + API_DEFINITION_PATH, stream=True)
+        except Exception as e:
+            if timer is not None:
+                timer.finish(None, 0, 0, e)
+            raise
+        with response:
+            if timer is not None:
+                timer.finish(response.status_code, 0, 0)
+            if not 200 <= response.status_code <= 299:
+                raise ApiException.from_response(response)
+
+    _call_with_retry(client, "GET", API_DEFINITION_PATH, probe_api_definition)
+
+
+def _get_output_path(job_id: str, file_name: str) -> pathlib.PurePath:
+    r"""
+    Get the path to save a job output file to, relative to the destination folder.
+
+    Folders in the output file name are preserved, so that output files with the same name in
+    different folders are saved to different paths.
+
+    Parameters
+    ----------
+    job_id : str
+        ID of the job.
+    file_name : str
+        Name of the output file, which may include folders separated by ``/`` or ``\``.
+
+    Returns
+    -------
+    pathlib.PurePath
+        Relative path to save the output file to.
+
+    Raises
+    ------
+    ValueError
+        If the output file name is absolute or refers to a parent folder.
+    """
+    # Output file names are generated on a Windows server, so accept both separators
+    name = pathlib.PureWindowsPath(file_name)
+    if name.anchor or not name.parts or ".." in name.parts:
+        raise ValueError(f"Output file {file_name!r} of job {job_id} cannot be saved locally.")
+    return pathlib.PurePath(job_id, *name.parts)
+
+
+@dataclass
+class _JobListDelta:
+    """
+    Describes the changes applied to the local job registry by a single reconciliation.
+
+    Parameters
+    ----------
+    added : list of AsyncJob
+        Jobs that were not previously known to the client.
+    changed : list of AsyncJob
+        Known jobs with at least one field that differs from the server response.
+    removed : list of AsyncJob
+        Known jobs that are no longer present on the server.
+    """
+
+    added: List[AsyncJob] = field(default_factory=list)
+    changed: List[AsyncJob] = field(default_factory=list)
+    removed: List[AsyncJob] = field(default_factory=list)
+
+
 class JobQueueApiClient(ApiClient):
     """
     Communicates with Granta MI.
@@ -97,309 +251,1657 @@ class JobQueueApiClient(ApiClient):
         logger.debug(f"Base Service Layer URL: {self._service_layer_url}")
         logger.debug(f"Service URL: {api_url}")
 
-        super().__init__(session, api_url, configuration)
-        self.job_queue_api = api.JobQueueApi(self)
+        super().__init__(session, api_url, configuration)
+        self.job_queue_api = api.JobQueueApi(self)
+
+        self._user: Optional[models.GsaCurrentUser] = None
+        self._processing_configuration: Optional[JobQueueProcessingConfiguration] = None
+
+        self._jobs: Dict[str, AsyncJob] = {}
+        self._jobs_lock = threading.Lock()
+        self._last_jobs_table: Optional[JobTable] = None
+
+        self._polling_strategy: PollingStrategy = BackoffPollingStrategy()
+        self._max_upload_workers = DEFAULT_MAX_UPLOAD_WORKERS
+        self._upload_cache: Optional[UploadCache] = None
+        self._upload_chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE
+        self._upload_memory_map = False
+        self._upload_progress_callback: Optional[ProgressCallback] = None
+        self._connection_pool: Optional[ConnectionPoolConfiguration] = None
+        self._connection_pool_size = 0
+        self._connection_pool_lock = threading.Lock()
+        self._retry_policy: Optional[RetryPolicy] = RetryPolicy()
+        self._request_hooks: Tuple[RequestHook, ...] = ()
+        self._job_metrics: Optional[JobMetrics] = None
+        self._job_watchers: "Tuple[JobWatcher, ...]" = ()
+        self._job_watchers_lock = threading.Lock()
+        self._request_context = threading.local()
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{self.__class__.__name__} url: {self._service_layer_url}>"
+
+    def call_api(self, resource_path: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Make an HTTP request to the Server API, retrying it according to :attr:`retry_policy`.
+
+        Parameters
+        ----------
+        resource_path : str
+            Path of the endpoint, relative to the Server API URL.
+        method : str
+            HTTP method.
+        *args
+            Positional arguments passed to :meth:`ansys.openapi.common.ApiClient.call_api`.
+        **kwargs
+            Keyword arguments passed to :meth:`ansys.openapi.common.ApiClient.call_api`.
+
+        Returns
+        -------
+        Any
+            Value returned by :meth:`ansys.openapi.common.ApiClient.call_api`.
+        """
+
+        def call_api() -> Any:
+            self._request_context.endpoint = resource_path
+            try:
+                return super(JobQueueApiClient, self).call_api(
+                    resource_path, method, *args, **kwargs
+                )
+            finally:
+                self._request_context.endpoint = None
+
+        return _call_with_retry(self, method, resource_path, call_api)
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        """
+        Send an HTTP request and report it to the registered request hooks.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method.
+        url : str
+            Absolute URL of the endpoint.
+        *args
+            Positional arguments passed to :meth:`ansys.openapi.common.ApiClient.request`.
+        **kwargs
+            Keyword arguments passed to :meth:`ansys.openapi.common.ApiClient.request`.
+
+        Returns
+        -------
+        requests.Response
+            Response from the server.
+        """
+        hooks = self._request_hooks
+        if not hooks:
+            return super().request(method, url, *args, **kwargs)
+        endpoint = getattr(self._request_context, "endpoint", None)
+        if endpoint is None:
+            endpoint = url[len(self.api_url) :] if url.startswith(self.api_url) else url
+        timer = _RequestTimer(hooks, method, endpoint)
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except Exception as e:
+            timer.finish(None, 0, 0, e)
+            raise
+        timer.finish(response.status_code, _get_request_size(response), len(response.content))
+        return response
+
+    def _ApiClient__deserialize(self, data: Any, klass_name: str) -> Any:
+        """
+        Deserialize data into an object of the named type.
+
+        Overrides the private deserialization method of :class:`ansys.openapi.common.ApiClient`,
+        so that values with no defined type, such as job-specific outputs, are returned unchanged
+        without issuing an :class:`~ansys.openapi.common.UndefinedObjectWarning`. Warning filters
+        are shared by all threads, so the warning cannot be suppressed safely with
+        :func:`warnings.catch_warnings` while job watchers update jobs in the background.
+
+        Parameters
+        ----------
+        data : Any
+            Serialized data.
+        klass_name : str
+            Name of the type to deserialize the data to.
+
+        Returns
+        -------
+        Any
+            Deserialized object.
+        """
+        if klass_name == "object":
+            return data
+        return super()._ApiClient__deserialize(data, klass_name)  # type: ignore[misc]
+
+    @property
+    def processing_configuration(self) -> JobQueueProcessingConfiguration:
+        """
+        Current job queue configuration information from the server.
+
+        Performs an HTTP request against the Granta MI Server API.
+
+        Returns
+        -------
+        JobQueueProcessingConfiguration
+            Current job queue processing configuration on the server.
+        """
+        if self._processing_configuration is None:
+            processing_config = self.job_queue_api.get_processing_config()
+            self._processing_configuration = JobQueueProcessingConfiguration(
+                purge_job_age_in_milliseconds=cast(
+                    int, processing_config.purge_job_age_in_milliseconds
+                ),
+                purge_interval_in_milliseconds=cast(
+                    int, processing_config.purge_interval_in_milliseconds
+                ),
+                polling_interval_in_milliseconds=cast(
+                    int, processing_config.polling_interval_in_milliseconds
+                ),
+                concurrency=cast(int, processing_config.concurrency),
+            )
+            self._grow_connection_pool(self._processing_configuration.concurrency)
+        return self._processing_configuration
+
+    @property
+    def polling_strategy(self) -> PollingStrategy:
+        """
+        Default strategy that controls how often the server is polled while waiting for jobs.
+
+        Used by :meth:`create_job_and_wait`, :meth:`wait_for_jobs`, and :meth:`as_completed` if
+        no strategy is provided. Defaults to a :class:`~.BackoffPollingStrategy` with no timeout.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        PollingStrategy
+            Default polling strategy.
+        """
+        return self._polling_strategy
+
+    @polling_strategy.setter
+    def polling_strategy(self, value: PollingStrategy) -> None:
+        """
+        Set the default polling strategy.
+
+        Parameters
+        ----------
+        value : PollingStrategy
+            Default polling strategy.
+        """
+        self._polling_strategy = value
+
+    @property
+    def max_upload_workers(self) -> int:
+        """
+        Maximum number of files to upload concurrently when creating a job.
+
+        Defaults to ``4``. Set to ``1`` to upload files one at a time.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        int
+            Maximum number of concurrent file uploads.
+        """
+        return self._max_upload_workers
+
+    @max_upload_workers.setter
+    def max_upload_workers(self, value: int) -> None:
+        """
+        Set the maximum number of files to upload concurrently when creating a job.
+
+        Parameters
+        ----------
+        value : int
+            Maximum number of concurrent file uploads.
+        """
+        if value < 1:
+            raise ValueError("max_upload_workers must be at least 1.")
+        self._max_upload_workers = value
+        self._grow_connection_pool(value)
+
+    @property
+    def upload_cache(self) -> Optional[UploadCache]:
+        """
+        Cache used to reuse previously uploaded files when creating jobs.
+
+        Defaults to ``None``, in which case every file is uploaded for every job. Assign an
+        :class:`~.UploadCache` object to avoid uploading identical files more than once.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        UploadCache or None
+            Upload cache, or ``None`` if caching is disabled.
+        """
+        return self._upload_cache
+
+    @upload_cache.setter
+    def upload_cache(self, value: Optional[UploadCache]) -> None:
+        """
+        Set the cache used to reuse previously uploaded files.
+
+        Parameters
+        ----------
+        value : UploadCache or None
+            Upload cache, or ``None`` to disable caching.
+        """
+        self._upload_cache = value
+
+    @property
+    def upload_chunk_size(self) -> Optional[int]:
+        """
+        Number of bytes read from disk at a time when uploading files.
+
+        Files larger than this size are streamed to the server in chunks, so memory usage does not
+        depend on the size of the file. Defaults to 1 MiB. Set to ``None`` to read each file into
+        memory before it is uploaded.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        int or None
+            Upload chunk size in bytes, or ``None`` if streaming uploads are disabled.
+        """
+        return self._upload_chunk_size
+
+    @upload_chunk_size.setter
+    def upload_chunk_size(self, value: Optional[int]) -> None:
+        """
+        Set the number of bytes read from disk at a time when uploading files.
+
+        Parameters
+        ----------
+        value : int or None
+            Upload chunk size in bytes, or ``None`` to disable streaming uploads.
+        """
+        if value is not None and value < 1:
+            raise ValueError("upload_chunk_size must be at least 1.")
+        self._upload_chunk_size = value
+
+    @property
+    def upload_memory_map(self) -> bool:
+        """
+        Whether streamed files are read through a memory map.
+
+        Memory-mapped reads avoid a copy through the file object's buffer, and can be faster for
+        very large files on local disks. Defaults to ``False``.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        bool
+            ``True`` if streamed files are memory-mapped.
+        """
+        return self._upload_memory_map
+
+    @upload_memory_map.setter
+    def upload_memory_map(self, value: bool) -> None:
+        """
+        Set whether streamed files are read through a memory map.
+
+        Parameters
+        ----------
+        value : bool
+            ``True`` to memory-map streamed files.
+        """
+        self._upload_memory_map = value
+
+    @property
+    def upload_progress_callback(self) -> Optional[ProgressCallback]:
+        """
+        Function called to report the progress of streamed file uploads.
+
+        The function is called with a :class:`~.TransferProgress` object each time a chunk of a
+        file is read. If files are uploaded concurrently, the function is called from multiple
+        threads. Defaults to ``None``.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        callable or None
+            Progress callback, or ``None`` if progress is not reported.
+        """
+        return self._upload_progress_callback
+
+    @upload_progress_callback.setter
+    def upload_progress_callback(self, value: Optional[ProgressCallback]) -> None:
+        """
+        Set the function called to report the progress of streamed file uploads.
+
+        Parameters
+        ----------
+        value : callable or None
+            Progress callback, or ``None`` to disable progress reporting.
+        """
+        self._upload_progress_callback = value
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        Policy used to retry failed requests to the Server API.
+
+        The policy applies to every request sent by this client, including file uploads and
+        downloads. Defaults to a :class:`~.RetryPolicy` with default parameters. Set to ``None``
+        to send each request only once.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        RetryPolicy or None
+            Retry policy, or ``None`` if requests are not retried.
+        """
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value: Optional[RetryPolicy]) -> None:
+        """
+        Set the policy used to retry failed requests to the Server API.
+
+        Parameters
+        ----------
+        value : RetryPolicy or None
+            Retry policy, or ``None`` to send each request only once.
+        """
+        self._retry_policy = value
+
+    def add_request_hook(self, hook: RequestHook) -> None:
+        """
+        Register a function to call after each request to the Server API.
+
+        The function is called with a :class:`~.RequestEvent` for every HTTP request sent by this
+        client, including file uploads, file downloads, and each retry of a failed request. It is
+        called on the thread that sent the request, so it must be thread-safe and fast. Exceptions
+        raised by the function are logged and otherwise ignored.
+
+        Use a :class:`~.LatencyAggregator` to collect latency percentiles for each endpoint, or an
+        :class:`~.OpenTelemetryHook` to emit OpenTelemetry spans.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        hook : callable
+            Function that takes a :class:`~.RequestEvent` object.
+        """
+        self._request_hooks = self._request_hooks + (hook,)
+
+    def remove_request_hook(self, hook: RequestHook) -> None:
+        """
+        Unregister a function registered with :meth:`add_request_hook`.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        hook : callable
+            Function to unregister.
+
+        Raises
+        ------
+        ValueError
+            If the function is not registered.
+        """
+        hooks = list(self._request_hooks)
+        try:
+            hooks.remove(hook)
+        except ValueError:
+            raise ValueError(f"Request hook {hook!r} is not registered.") from None
+        self._request_hooks = tuple(hooks)
+
+    @property
+    def job_metrics(self) -> Optional[JobMetrics]:
+        """
+        Metrics updated as this client observes jobs changing state.
+
+        Defaults to ``None``, in which case no metrics are collected. Set to a
+        :class:`~.JobMetrics` object to collect queue wait and run durations of the jobs returned
+        by this client.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        JobMetrics or None
+            Job metrics, or ``None`` if metrics are not collected.
+        """
+        return self._job_metrics
+
+    @job_metrics.setter
+    def job_metrics(self, value: Optional[JobMetrics]) -> None:
+        """
+        Set the metrics updated as this client observes jobs changing state.
+
+        Parameters
+        ----------
+        value : JobMetrics or None
+            Job metrics, or ``None`` to stop collecting metrics.
+        """
+        self._job_metrics = value
+        if value is not None:
+            for job in self._get_known_jobs():
+                value.observe(job)
+
+    def _get_known_jobs(self) -> "List[AsyncJob]":
+        """
+        Get the jobs currently held by the client, without sending a request.
+
+        Returns
+        -------
+        list of AsyncJob
+            Snapshot of the internal job list.
+        """
+        with self._jobs_lock:
+            return list(self._jobs.values())
+
+    @property
+    def connection_pool_statistics(self) -> ConnectionPoolStatistics:
+        """
+        Current usage statistics of the HTTP connection pool.
+
+        .. versionadded:: 1.4
+
+        Returns
+        -------
+        ConnectionPoolStatistics
+            Snapshot of the connection pool usage.
+        """
+        return _get_connection_pool_statistics(
+            self.rest_client, self._connection_pool_size or DEFAULT_POOLSIZE
+        )
+
+    def _configure_connection_pool(self, configuration: ConnectionPoolConfiguration) -> None:
+        """
+        Configure the HTTP connection pool of the client.
+
+        Parameters
+        ----------
+        configuration : ConnectionPoolConfiguration
+            Connection pool configuration. If the maximum number of connections per host is not
+            specified, the pool is sized to the default number of worker threads, and grows when
+            more worker threads are used.
+        """
+        self._connection_pool = configuration
+        self._connection_pool_size = configuration.max_connections_per_host or max(
+            DEFAULT_MAX_WORKERS, self._max_upload_workers
+        )
+        _configure_connection_pool(self.rest_client, configuration, self._connection_pool_size)
+        logger.debug(f"Connection pool size set to {self._connection_pool_size}")
+
+    def _grow_connection_pool(self, workers: int) -> None:
+        """
+        Grow the HTTP connection pool so that each worker thread can keep a connection open.
+
+        The pool is only resized if it was configured to be sized automatically. Requests in
+        progress on other threads keep using the previous pool.
+
+        Parameters
+        ----------
+        workers : int
+            Number of threads that send requests concurrently.
+        """
+        configuration = self._connection_pool
+        if configuration is None or configuration.max_connections_per_host is not None:
+            return
+        with self._connection_pool_lock:
+            if workers > self._connection_pool_size:
+                _resize_connection_pool(self.rest_client, configuration, workers)
+                self._connection_pool_size = workers
+                logger.debug(f"Connection pool size increased to {workers}")
+
+    def _get_streaming_upload(self) -> Optional[_StreamingUpload]:
+        """
+        Get the settings used to stream files to the server.
+
+        Returns
+        -------
+        _StreamingUpload or None
+            Streaming settings, or ``None`` if streaming uploads are disabled.
+        """
+        if self._upload_chunk_size is None:
+            return None
+        return _StreamingUpload(
+            chunk_size=self._upload_chunk_size,
+            memory_map=self._upload_memory_map,
+            progress_callback=self._upload_progress_callback,
+        )
+
+    @property
+    def is_admin_user(self) -> bool:
+        """
+        Flag indicating if the current user is an administrator of the job queue.
+
+        Administrators can promote jobs to the top of the queue and interact with other users' jobs.
+
+        Performs an HTTP request against the Granta MI Server API.
+
+        Returns
+        -------
+        bool
+            ``True`` if the user is an administrator, ``False`` otherwise.
+        """
+        if self._user is None:
+            self._refetch_user()
+        assert self._user
+        return cast(bool, self._user.is_admin)
+
+    @property
+    def can_write_job(self) -> bool:
+        """
+        Flag indicating if the current user can create jobs.
+
+        Performs an HTTP request against the Granta MI Server API.
+
+        Returns
+        -------
+        bool
+            ``True`` if the user can create jobs, ``False`` otherwise.
+        """
+        if self._user is None:
+            self._refetch_user()
+        assert self._user
+        return cast(bool, self._user.has_write_access)
+
+    @property
+    def num_jobs(self) -> int:
+        """
+        Number of jobs in the job queue, including completed and failed jobs.
+
+        Performs an HTTP request against the Granta MI Server API.
+
+        Returns
+        -------
+        int
+            Number of jobs in the job queue.
+        """
+        jobs = self.job_queue_api.get_jobs()
+        return len(cast(List[models.GsaJob], jobs.results))
+
+    def _refetch_user(self) -> None:
+        """Refetch the current user information from the server."""
+        self._user = self.job_queue_api.get_current_user()
+        assert self._user
+
+    @property
+    def jobs(self) -> "List[AsyncJob]":
+        """
+        List of all jobs on the server visible to the current user.
+
+        Running or pending jobs are sorted according to their positions in the queue.
+        Completed or failed jobs are returned last.
+
+        Performs an HTTP request against the Granta MI Server API.
+
+        Returns
+        -------
+        list[AsyncJob]
+            List of all jobs on the server visible to the current user.
+        """
+        self._refetch_jobs()
+        return sorted(self._get_known_jobs(), key=lambda x: (x.position is None, x.position))
+
+    def jobs_table(self, refresh: bool = True) -> JobTable:
+        """
+        Columnar snapshot of all jobs on the server visible to the current user.
+
+        Jobs are in the same order as :attr:`jobs`. Use this method instead of :attr:`jobs` to
+        compute statistics over many jobs, such as queue and run times.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        refresh : bool, default: True
+            Whether to fetch the list of jobs from the server first. If ``False``, the table is
+            built from the jobs currently held by the client.
+
+        Returns
+        -------
+        JobTable
+            Snapshot of the jobs.
+        """
+        if refresh:
+            self._refetch_jobs()
+        # Sort with a numeric key, because a tuple key allocates an object per job
+        table = JobTable(
+            sorted(
+                self._get_known_jobs(),
+                key=lambda x: math.inf if x._position is None else x._position,
+            ),
+            self._last_jobs_table,
+        )
+        self._last_jobs_table = table
+        return table
+
+    def jobs_where(
+        self,
+        name: Optional[str] = None,
+        job_type: Optional[JobType] = None,
+        description: Optional[str] = None,
+        submitter_name: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+    ) -> "List[AsyncJob]":
+        """
+        Get a list of jobs on the server matching a query.
+
+        Running or queued jobs are sorted according to their positions in the queue.
+        Completed or failed jobs are returned last.
+
+        Performs an HTTP request against the Granta MI Server API.
+
+        Parameters
+        ----------
+        name : str, default: None
+            Text that must appear in the job name.
+        job_type : JobType, default: None
+            Type of job to search for.
+        description : str, default: None
+            Text that must appear in the job description.
+        submitter_name : str, default: None
+            Text that must equal the name of the user who submitted the job.
+        status : JobStatus, default: None
+            Status of the job.
+
+        Returns
+        -------
+        list of AsyncJob
+            List of jobs on the server matching the query.
+        """
+        filtered_job_resp = self.job_queue_api.get_jobs(
+            name_filter=name,
+            job_type=job_type.value if job_type else None,
+            status=status.value if status else None,
+            description_filter=description,
+            submitter_name_filter=submitter_name,
+        )
+
+        job_list = filtered_job_resp.results
+        assert isinstance(job_list, list)
+        self._reconcile_jobs(job_resp=job_list)
+        filtered_ids = {job.id for job in job_list}
+        with self._jobs_lock:
+            return [job for id_, job in self._jobs.items() if id_ in filtered_ids]
+
+    def get_job_by_id(self, job_id: str) -> "AsyncJob":
+        """
+        Get the job with a given job ID.
+
+        Parameters
+        ----------
+        job_id : str
+            Job ID.
+
+        Returns
+        -------
+        AsyncJob
+            Job with the given ID.
+
+        Raises
+        ------
+        KeyError
+            If no job with the given ID is known to the client.
+        """
+        with self._jobs_lock:
+            return self._jobs[job_id]
+
+    def delete_jobs(self, jobs: "List[AsyncJob]") -> None:
+        """
+        Delete one or more jobs from the server.
+
+        Parameters
+        ----------
+        jobs : list of AsyncJob
+            List of jobs to delete from the server.
+        """
+        for job in jobs:
+            self.job_queue_api.delete_job(id=job.id)
+            job._is_deleted = True
+        self._refetch_jobs()
+
+    def _refetch_jobs(self) -> None:
+        """Refetch the list of jobs from the server."""
+        job_resp = self.job_queue_api.get_jobs()
+        job_list = job_resp.results
+        assert isinstance(job_list, list)
+        self._reconcile_jobs(job_resp=job_list, flush_jobs=True)
+
+    def _reconcile_jobs(
+        self, job_resp: List[models.GsaJob], flush_jobs: bool = False
+    ) -> _JobListDelta:
+        """
+        Reconcile the internal job list with a list of job objects from the server.
+
+        Each job in the response is matched to the internal job list by ID. New jobs are added,
+        and existing jobs are only updated if at least one of their fields has changed. The
+        reconciliation runs in linear time in the size of the response and the internal job list.
+
+        Parameters
+        ----------
+        job_resp : List[models.GsaJob]
+            List of job objects from the server.
+        flush_jobs : bool, default: False
+            Whether to remove jobs from the internal list that are not in the ``job_resp`` list.
+            Removed jobs are marked as deleted.
+
+        Returns
+        -------
+        _JobListDelta
+            Jobs that were added, changed, or removed by the reconciliation.
+        """
+        delta = _JobListDelta()
+        remote_ids: Set[str] = set()
+        # The job list is also reconciled by job watcher threads
+        with self._jobs_lock:
+            for job_obj in job_resp:
+                job_id = cast(str, job_obj.id)
+                remote_ids.add(job_id)
+                job = self._jobs.get(job_id)
+                if job is None:
+                    job = AsyncJob.create_job(job_obj, self.job_queue_api)
+                    self._jobs[job_id] = job
+                    delta.added.append(job)
+                elif job._update_job(job_obj):
+                    delta.changed.append(job)
+            if flush_jobs and len(remote_ids) != len(self._jobs):
+                stale_ids = [job_id for job_id in self._jobs if job_id not in remote_ids]
+                for job_id in stale_ids:
+                    job = self._jobs.pop(job_id)
+                    job._is_deleted = True
+                    delta.removed.append(job)
+        if self._job_metrics is not None or self._job_watchers:
+            self._observe_job_changes(delta.added + delta.changed, delta.removed)
+        return delta
+
+    def _register_job_watcher(self, watcher: "JobWatcher") -> None:
+        """
+        Report changes to jobs to a job watcher.
+
+        Parameters
+        ----------
+        watcher : JobWatcher
+            Job watcher to report changes to.
+        """
+        with self._job_watchers_lock:
+            if watcher not in self._job_watchers:
+                self._job_watchers = self._job_watchers + (watcher,)
+
+    def _unregister_job_watcher(self, watcher: "JobWatcher") -> None:
+        """
+        Stop reporting changes to jobs to a job watcher.
+
+        Parameters
+        ----------
+        watcher : JobWatcher
+            Job watcher to stop reporting changes to.
+        """
+        with self._job_watchers_lock:
+            self._job_watchers = tuple(w for w in self._job_watchers if w is not watcher)
+
+    def _observe_job_changes(
+        self, updated: "Iterable[AsyncJob]", removed: "Iterable[AsyncJob]" = ()
+    ) -> None:
+        """
+        Report jobs that were added, changed, or deleted to the job metrics and job watchers.
+
+        Parameters
+        ----------
+        updated : iterable of AsyncJob
+            Jobs that were added or changed.
+        removed : iterable of AsyncJob, default: ()
+            Jobs that were deleted from the server.
+        """
+        metrics = self._job_metrics
+        watchers = self._job_watchers
+        if metrics is None and not watchers:
+            return
+        updated = list(updated)
+        removed = list(removed)
+        if metrics is not None:
+            for job in updated:
+                metrics.observe(job)
+            for job in removed:
+                metrics.forget(job.id)
+        for watcher in watchers:
+            watcher._observe(updated, removed)
+
+    def refresh_jobs(self, jobs: "List[AsyncJob]", max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Update several jobs from the server with as few HTTP requests as possible.
+
+        If more jobs are provided than ``max_workers``, a single request for the list of jobs is
+        made. The request is filtered by job type and submitter if all jobs share the same values.
+        Otherwise, each job is requested individually, with up to ``max_workers`` requests running
+        concurrently.
+
+        Jobs that no longer exist on the server are marked as deleted. Jobs that have already been
+        deleted are ignored.
+
+        Performs one or more HTTP requests against the Granta MI Server API.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        jobs : list of AsyncJob
+            Jobs to update.
+        max_workers : int, default: 8
+            Maximum number of concurrent requests if jobs are requested individually.
+        """
+        jobs = [job for job in jobs if not job._is_deleted]
+        if not jobs:
+            return
+        if len(jobs) > max_workers:
+            self._refresh_jobs_from_list(jobs)
+        else:
+            self._refresh_jobs_individually(jobs, max_workers)
+
+    def _refresh_jobs_from_list(self, jobs: "List[AsyncJob]") -> None:
+        """
+        Update jobs from the server with a single request for the list of jobs.
+
+        Parameters
+        ----------
+        jobs : list of AsyncJob
+            Jobs to update.
+        """
+        job_types = {job._type for job in jobs}
+        submitter_names = {job._submitter_name for job in jobs}
+        job_type = job_types.pop() if len(job_types) == 1 else None
+        submitter_name = submitter_names.pop() if len(submitter_names) == 1 else None
+        job_resp = self.job_queue_api.get_jobs(
+            job_type=job_type, submitter_name_filter=submitter_name
+        )
+        job_list = job_resp.results
+        assert isinstance(job_list, list)
+        self._reconcile_jobs(job_list, flush_jobs=job_type is None and submitter_name is None)
+        self._apply_refreshed_jobs(jobs, {cast(str, job_obj.id): job_obj for job_obj in job_list})
+
+    def _refresh_jobs_individually(self, jobs: "List[AsyncJob]", max_workers: int) -> None:
+        """
+        Update jobs from the server with one request per job.
+
+        Parameters
+        ----------
+        jobs : list of AsyncJob
+            Jobs to update.
+        max_workers : int
+            Maximum number of concurrent requests.
+        """
+        if len(jobs) == 1:
+            job_objs = [self._get_job_or_none(jobs[0].id)]
+        else:
+            self._grow_connection_pool(min(max_workers, len(jobs)))
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+                job_objs = list(executor.map(self._get_job_or_none, [job.id for job in jobs]))
+        found = [job_obj for job_obj in job_objs if job_obj is not None]
+        self._reconcile_jobs(found)
+        self._apply_refreshed_jobs(jobs, {cast(str, job_obj.id): job_obj for job_obj in found})
+
+    def _get_job_or_none(self, job_id: str) -> Optional[models.GsaJob]:
+        """
+        Get a single job from the server.
+
+        Parameters
+        ----------
+        job_id : str
+            ID of the job to get.
+
+        Returns
+        -------
+        models.GsaJob or None
+            Job object from the server, or ``None`` if the job does not exist.
+        """
+        try:
+            return self.job_queue_api.get_job(id=job_id)
+        except ApiException as e:
+            if e.status_code == 404:
+                return None
+            raise
+
+    def _apply_refreshed_jobs(
+        self, jobs: "List[AsyncJob]", job_objs: Dict[str, models.GsaJob]
+    ) -> None:
+        """
+        Update the provided jobs from a set of job objects from the server.
+
+        Jobs that are not included in the job objects are marked as deleted and removed from the
+        internal job list. Jobs in the internal job list have already been updated by
+        :meth:`_reconcile_jobs`, so only jobs that are not tracked by this client are updated here.
+
+        Parameters
+        ----------
+        jobs : list of AsyncJob
+            Jobs to update.
+        job_objs : dict of str to models.GsaJob
+            Job objects from the server indexed by job ID.
+        """
+        updated = []
+        removed = []
+        with self._jobs_lock:
+            for job in jobs:
+                job_obj = job_objs.get(job.id)
+                if job_obj is None:
+                    job._is_deleted = True
+                    removed.append(job)
+                    if self._jobs.get(job.id) is job:
+                        del self._jobs[job.id]
+                elif self._jobs.get(job.id) is not job and job._update_job(job_obj):
+                    updated.append(job)
+        self._observe_job_changes(updated, removed)
+
+    def download_outputs(
+        self,
+        jobs: "Iterable[AsyncJob]",
+        dest_dir: Union[str, pathlib.Path],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        include: Optional[str] = None,
+    ) -> List[OutputFileDownload]:
+        r"""
+        Download the output files of multiple jobs in parallel.
+
+        Performs HTTP requests against the Granta MI Server API. The output files of each job are
+        saved to a subfolder of ``dest_dir`` named after the job ID. Folders in output file names
+        are preserved. Files that already exist locally with the same size as the file on the
+        server are not downloaded again, so an interrupted download can be resumed by calling this
+        method again.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        jobs : iterable of AsyncJob
+            Jobs to download the output files of. Jobs with no output files are ignored.
+        dest_dir : str or pathlib.Path
+            Folder to save the output files to.
+        max_workers : int, default: 8
+            Maximum number of files to download concurrently.
+        include : str, default: None
+            Glob pattern that output file names must match to be downloaded, for example
+            ``"*.zip"``. If not provided, all output files are downloaded.
+
+        Returns
+        -------
+        list of OutputFileDownload
+            Manifest describing each saved file, in the order of ``jobs`` and their
+            :attr:`~.AsyncJob.output_file_names`.
+
+        Raises
+        ------
+        ValueError
+            If a job has been deleted from the server, or if two output files would be saved to
+            the same path.
+        FileDownloadError
+            If one or more files could not be downloaded. All other files are still downloaded.
+
+        Examples
+        --------
+        >>> finished = client.jobs_where(status=JobStatus.Succeeded, job_type=JobType.ExcelExportJob)
+        >>> manifest = client.download_outputs(finished, r"C:\path\to\archive", include="*.zip")
+        >>> sum(entry.size for entry in manifest if entry.downloaded)
+        1073741824
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        dest_dir = pathlib.Path(dest_dir)
+        downloads: List[Tuple[AsyncJob, str, pathlib.Path]] = []
+        # Local file systems may be case-insensitive, so compare paths ignoring case
+        saved_paths: Dict[str, Tuple[str, str]] = {}
+        for job in jobs:
+            if job._is_deleted:
+                raise ValueError(f"Job {job.id} has been deleted from the job queue.")
+            for file_name in job.output_file_names or []:
+                if include is None or fnmatch.fnmatch(file_name, include):
+                    relative_path = _get_output_path(job.id, file_name)
+                    key = str(relative_path).casefold()
+                    if key in saved_paths:
+                        if saved_paths[key] == (job.id, file_name):
+                            continue
+                        raise ValueError(
+                            f"Output files {saved_paths[key][1]!r} and {file_name!r} would both "
+                            f"be saved to {dest_dir / relative_path}."
+                        )
+                    saved_paths[key] = (job.id, file_name)
+                    downloads.append((job, file_name, dest_dir / relative_path))
+        if not downloads:
+            return []
+
+        self._grow_connection_pool(min(max_workers, len(downloads)))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(downloads))) as executor:
+            futures = [
+                executor.submit(job._download_output, file_name, path)
+                for job, file_name, path in downloads
+            ]
+        manifest: List[OutputFileDownload] = []
+        errors: Dict[pathlib.Path, Exception] = {}
+        for (_, _, path), future in zip(downloads, futures):
+            exception = future.exception()
+            if exception is not None:
+                errors[path] = cast(Exception, exception)
+            else:
+                manifest.append(future.result())
+        if errors:
+            raise FileDownloadError(errors, manifest) from next(iter(errors.values()))
+        logger.debug(
+            f"Downloaded {sum(entry.downloaded for entry in manifest)} of {len(manifest)} files"
+        )
+        return manifest
+
+    def wait_for_jobs(
+        self,
+        jobs: "Iterable[AsyncJob]",
+        timeout: Optional[float] = None,
+        return_when: WaitCondition = WaitCondition.AllCompleted,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> "Tuple[List[AsyncJob], List[AsyncJob]]":
+        """
+        Wait for one or more jobs to complete.
+
+        A job is complete when its status is no longer :enum:`JobStatus.Pending` or
+        :enum:`JobStatus.Running`. All jobs are updated together with
+        :meth:`refresh_jobs` at every polling interval, so waiting on many jobs does not
+        require one HTTP request per job.
+
+        Performs HTTP requests against the Granta MI Server API.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        jobs : iterable of AsyncJob
+            Jobs to wait for.
+        timeout : float, default: None
+            Maximum number of seconds to wait. If ``None``, the timeout of the polling strategy
+            is used.
+        return_when : WaitCondition, default: WaitCondition.AllCompleted
+            Condition under which this method returns.
+        polling_strategy : PollingStrategy, default: None
+            Strategy that controls how often the server is polled. If ``None``,
+            :attr:`polling_strategy` is used.
+
+        Returns
+        -------
+        tuple of (list of AsyncJob, list of AsyncJob)
+            Jobs that have completed and jobs that have not completed, each in the order in
+            which they were provided.
+        """
+        jobs = list(dict.fromkeys(jobs))
+        completed_ids: Set[str] = set()
+        for completed in self._iter_completed_jobs(jobs, timeout, polling_strategy):
+            completed_ids.update(job.id for job in completed)
+            if return_when is WaitCondition.FirstCompleted:
+                break
+            if return_when is WaitCondition.AnyFailed and any(
+                job.status in _FAILED_STATUSES for job in completed
+            ):
+                break
+        return (
+            [job for job in jobs if job.id in completed_ids],
+            [job for job in jobs if job.id not in completed_ids],
+        )
+
+    def as_completed(
+        self,
+        jobs: "Iterable[AsyncJob]",
+        timeout: Optional[float] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> "Iterator[AsyncJob]":
+        """
+        Iterate over jobs as they complete.
+
+        Jobs that have already completed are yielded first. All remaining jobs are then updated
+        together with :meth:`refresh_jobs` at every polling interval, and are yielded as soon as
+        they are found to be complete.
+
+        Performs HTTP requests against the Granta MI Server API.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        jobs : iterable of AsyncJob
+            Jobs to wait for.
+        timeout : float, default: None
+            Maximum number of seconds to wait for all jobs to complete. If ``None``, the timeout
+            of the polling strategy is used.
+        polling_strategy : PollingStrategy, default: None
+            Strategy that controls how often the server is polled. If ``None``,
+            :attr:`polling_strategy` is used.
+
+        Yields
+        ------
+        AsyncJob
+            Next job to complete.
+
+        Raises
+        ------
+        TimeoutError
+            If not all jobs have completed before the timeout expires.
+
+        Examples
+        --------
+        >>> jobs = [client.create_job(request) for request in job_requests]
+        >>> for job in client.as_completed(jobs):
+        ...     print(job.name, job.status)
+        """
+        jobs = list(dict.fromkeys(jobs))
+        remaining = len(jobs)
+        for completed in self._iter_completed_jobs(jobs, timeout, polling_strategy):
+            remaining -= len(completed)
+            yield from completed
+        if remaining:
+            raise TimeoutError(f"{remaining} of {len(jobs)} jobs did not complete in time.")
+
+    def _iter_completed_jobs(
+        self,
+        jobs: "List[AsyncJob]",
+        timeout: Optional[float],
+        polling_strategy: Optional[PollingStrategy],
+    ) -> "Iterator[List[AsyncJob]]":
+        """
+        Poll the server until all jobs have completed or the timeout expires.
+
+        Parameters
+        ----------
+        jobs : list of AsyncJob
+            Jobs to wait for.
+        timeout : float or None
+            Maximum number of seconds to wait, or ``None`` to use the timeout of the polling
+            strategy.
+        polling_strategy : PollingStrategy or None
+            Strategy that controls how often the server is polled, or ``None`` to use
+            :attr:`polling_strategy`.
+
+        Yields
+        ------
+        list of AsyncJob
+            Jobs that were found to be complete during a single polling cycle.
+        """
+        polling_strategy = polling_strategy or self.polling_strategy
+        if timeout is None:
+            timeout = polling_strategy.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending: List[AsyncJob] = []
+        completed: List[AsyncJob] = []
+        for job in jobs:
+            (pending if job.status in _INCOMPLETE_STATUSES else completed).append(job)
+        if completed:
+            yield completed
+        attempt = 0
+        while pending:
+            self.refresh_jobs(pending)
+            completed = [job for job in pending if job.status not in _INCOMPLETE_STATUSES]
+            if completed:
+                pending = [job for job in pending if job.status in _INCOMPLETE_STATUSES]
+                yield completed
+            if not pending:
+                return
+            delay = self._get_polling_delay(polling_strategy, attempt, pending, deadline)
+            if delay is None:
+                return
+            time.sleep(delay)
+            attempt += 1
+
+    def _get_polling_delay(
+        self,
+        polling_strategy: PollingStrategy,
+        attempt: int,
+        pending_jobs: "List[AsyncJob]",
+        deadline: Optional[float],
+    ) -> Optional[float]:
+        """
+        Get the number of seconds to wait before polling the server again.
 
-        self._user: Optional[models.GsaCurrentUser] = None
-        self._processing_configuration: Optional[JobQueueProcessingConfiguration] = None
+        Parameters
+        ----------
+        polling_strategy : PollingStrategy
+            Strategy that controls how often the server is polled.
+        attempt : int
+            Number of times the server has already been polled while waiting.
+        pending_jobs : list of AsyncJob
+            Jobs that have not yet completed.
+        deadline : float or None
+            Value of :func:`time.monotonic` after which to stop waiting, or ``None`` to wait
+            indefinitely.
 
-        self._jobs: Dict[str, AsyncJob] = {}
+        Returns
+        -------
+        float or None
+            Number of seconds to wait, or ``None`` if the deadline has passed.
+        """
+        delay = polling_strategy.next_interval(attempt, pending_jobs, self.processing_configuration)
+        if deadline is not None:
+            delay = min(delay, deadline - time.monotonic())
+            if delay <= 0:
+                return None
+        return delay
+
+    def create_job_and_wait(
+        self, job_request: "JobRequest", polling_strategy: Optional[PollingStrategy] = None
+    ) -> "AsyncJob":  # noqa: D205, D400
+        """
+        Create a job from an Excel import or export request or from a text import request.
 
-        self._wait_retries = 5
+        This method create a job from an :class:`~.ExcelImportJobRequest`, :class:`~.ExcelExportJobRequest`, or
+        :class:`~.TextImportJobRequest` object and waits until the job is complete.
 
-    def __repr__(self) -> str:
-        """Printable representation of the object."""
-        return f"<{self.__class__.__name__} url: {self._service_layer_url}>"
+        This method also uploads the files included in the job request as a part of the job
+        submission process.
 
-    @property
-    def processing_configuration(self) -> JobQueueProcessingConfiguration:
-        """
-        Current job queue configuration information from the server.
+        Parameters
+        ----------
+        job_request : JobRequest
+            Job request to submit to the job queue.
+        polling_strategy : PollingStrategy, default: None
+            Strategy that controls how often the server is polled. If ``None``,
+            :attr:`polling_strategy` is used. If the strategy has a timeout and the job has not
+            completed before it expires, the job is returned in its current state.
 
-        Performs an HTTP request against the Granta MI Server API.
+            .. versionadded:: 1.4
 
         Returns
         -------
-        JobQueueProcessingConfiguration
-            Current job queue processing configuration on the server.
+        AsyncJob
+            Object representing the completed job.
         """
-        if self._processing_configuration is None:
-            processing_config = self.job_queue_api.get_processing_config()
-            self._processing_configuration = JobQueueProcessingConfiguration(
-                purge_job_age_in_milliseconds=cast(
-                    int, processing_config.purge_job_age_in_milliseconds
-                ),
-                purge_interval_in_milliseconds=cast(
-                    int, processing_config.purge_interval_in_milliseconds
-                ),
-                polling_interval_in_milliseconds=cast(
-                    int, processing_config.polling_interval_in_milliseconds
-                ),
-                concurrency=cast(int, processing_config.concurrency),
-            )
-        return self._processing_configuration
+        job = self.create_job(job_request=job_request)
+        polling_strategy = polling_strategy or self.polling_strategy
+        timeout = polling_strategy.timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        attempt = 0
+        while True:
+            delay = self._get_polling_delay(polling_strategy, attempt, [job], deadline)
+            if delay is None:
+                return job
+            time.sleep(delay)
+            attempt += 1
+            # Failed requests are retried by the retry policy of the client
+            job.update()
+            if job.status not in _INCOMPLETE_STATUSES:
+                return job
 
-    @property
-    def is_admin_user(self) -> bool:
+    def create_job(self, job_request: "JobRequest") -> "AsyncJob":  # noqa: D205, D400
         """
-        Flag indicating if the current user is an administrator of the job queue.
+        Create a job from an Excel import or export request or from a text import request.
 
-        Administrators can promote jobs to the top of the queue and interact with other users' jobs.
+        This method creates a job from an :class:`~.ExcelImportJobRequest`, :class:`~.ExcelExportJobRequest`, or
+        :class:`~.TextImportJobRequest` object.
 
-        Performs an HTTP request against the Granta MI Server API.
+        This method also uploads the files included in the job request as a part of the job
+        submission process.
+
+        Parameters
+        ----------
+        job_request : JobRequest
+            Job request to submit to the server.
 
         Returns
         -------
-        bool
-            ``True`` if the user is an administrator, ``False`` otherwise.
+        AsyncJob
+            Object representing the in-progress job.
         """
-        if self._user is None:
-            self._refetch_user()
-        assert self._user
-        return cast(bool, self._user.is_admin)
+        reused_file_ids = self._post_files(job_request)
+        return self._create_uploaded_job(job_request, reused_file_ids)
 
-    @property
-    def can_write_job(self) -> bool:
+    def submit_many(
+        self,
+        job_requests: "Iterable[JobRequest]",
+        max_in_flight: int = DEFAULT_MAX_WORKERS,
+    ) -> List[SubmissionResult]:
         """
-        Flag indicating if the current user can create jobs.
+        Create jobs from several job requests, overlapping file uploads with job creation.
 
-        Performs an HTTP request against the Granta MI Server API.
+        The files of up to ``max_in_flight`` job requests are uploaded concurrently. Each job is
+        created as soon as the files of its request and of all earlier requests have been
+        uploaded, so jobs are added to the queue in the order of ``job_requests``. A failure for
+        one request does not prevent the other requests from being submitted.
+
+        Performs HTTP requests against the Granta MI Server API.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        job_requests : iterable of JobRequest
+            Job requests to submit to the server.
+        max_in_flight : int, default: 8
+            Maximum number of job requests whose files are uploaded concurrently. The files in
+            each request are uploaded with up to :attr:`max_upload_workers` concurrent uploads.
 
         Returns
         -------
-        bool
-            ``True`` if the user can create jobs, ``False`` otherwise.
+        list of SubmissionResult
+            Outcome of each submission, in the order of ``job_requests``.
+
+        Raises
+        ------
+        ValueError
+            If ``max_in_flight`` is less than 1.
+
+        Examples
+        --------
+        >>> results = client.submit_many(job_requests, max_in_flight=4)
+        >>> jobs = [result.job for result in results if result.succeeded]
+        >>> failed = [result.job_request for result in results if not result.succeeded]
         """
-        if self._user is None:
-            self._refetch_user()
-        assert self._user
-        return cast(bool, self._user.has_write_access)
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        job_requests = list(job_requests)
+        results: List[SubmissionResult] = []
+        # Each request in flight uploads its files concurrently, while jobs are created on this thread
+        self._grow_connection_pool(max_in_flight * self.max_upload_workers + 1)
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            uploads = [executor.submit(self._post_files, request) for request in job_requests]
+            # Create the jobs in order on this thread, while later uploads continue in the pool
+            for job_request, upload in zip(job_requests, uploads):
+                try:
+                    job = self._create_uploaded_job(job_request, upload.result())
+                except Exception as exception:
+                    logger.debug(
+                        f'Failed to submit job request "{job_request.name}": {exception!r}'
+                    )
+                    results.append(SubmissionResult(job_request, error=exception))
+                else:
+                    results.append(SubmissionResult(job_request, job=job))
+        logger.debug(
+            f"Submitted {sum(result.succeeded for result in results)} of {len(results)} jobs"
+        )
+        return results
 
-    @property
-    def num_jobs(self) -> int:
+    def _post_files(self, job_request: "JobRequest") -> Set[str]:
         """
-        Number of jobs in the job queue, including completed and failed jobs.
+        Upload the files in a job request with the upload settings of this client.
 
-        Performs an HTTP request against the Granta MI Server API.
+        Parameters
+        ----------
+        job_request : JobRequest
+            Job request to upload the files of.
 
         Returns
         -------
-        int
-            Number of jobs in the job queue.
+        set of str
+            IDs of the files that were reused from the upload cache instead of being uploaded.
         """
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UndefinedObjectWarning)
-            jobs = self.job_queue_api.get_jobs()
-        return len(cast(List[models.GsaJob], jobs.results))
-
-    def _refetch_user(self) -> None:
-        """Refetch the current user information from the server."""
-        self._user = self.job_queue_api.get_current_user()
-        assert self._user
+        return job_request._post_files(
+            api_client=self.job_queue_api,
+            max_workers=self.max_upload_workers,
+            upload_cache=self._upload_cache,
+            streaming=self._get_streaming_upload(),
+        )
 
-    @property
-    def jobs(self) -> "List[AsyncJob]":
+    def _upload_file(self, file: _JobFile) -> str:
         """
-        List of all jobs on the server visible to the current user.
+        Upload a single file with the upload settings of this client.
 
-        Running or pending jobs are sorted according to their positions in the queue.
-        Completed or failed jobs are returned last.
+        The upload cache is not used, so this method is intended for files that are not uploaded
+        again, such as temporary files.
 
-        Performs an HTTP request against the Granta MI Server API.
+        Parameters
+        ----------
+        file : _JobFile
+            File to upload.
 
         Returns
         -------
-        list[AsyncJob]
-            List of all jobs on the server visible to the current user.
+        str
+            ID of the uploaded file.
         """
-        self._refetch_jobs()
-        return sorted(self._jobs.values(), key=lambda x: (x.position is None, x.position))
+        file_id, _ = JobRequest._upload_file(
+            self.job_queue_api, file, None, self._get_streaming_upload()
+        )
+        return file_id
 
-    def jobs_where(
-        self,
-        name: Optional[str] = None,
-        job_type: Optional[JobType] = None,
-        description: Optional[str] = None,
-        submitter_name: Optional[str] = None,
-        status: Optional[JobStatus] = None,
-    ) -> "List[AsyncJob]":
+    def _create_uploaded_job(
+        self, job_request: "JobRequest", reused_file_ids: Set[str]
+    ) -> "AsyncJob":
         """
-        Get a list of jobs on the server matching a query.
-
-        Running or queued jobs are sorted according to their positions in the queue.
-        Completed or failed jobs are returned last.
+        Create a job from a job request whose files have been uploaded with :meth:`_post_files`.
 
-        Performs an HTTP request against the Granta MI Server API.
+        If some files were reused from the upload cache and the server rejects the request because
+        it does not recognize a file ID, the server may have removed the files. In this case, the
+        files are uploaded again and job creation is retried. Other errors are raised unchanged,
+        because the server may have created the job.
 
         Parameters
         ----------
-        name : str, default: None
-            Text that must appear in the job name.
-        job_type : JobType, default: None
-            Type of job to search for.
-        description : str, default: None
-            Text that must appear in the job description.
-        submitter_name : str, default: None
-            Text that must equal the name of the user who submitted the job.
-        status : JobStatus, default: None
-            Status of the job.
+        job_request : JobRequest
+            Job request to submit to the server.
+        reused_file_ids : set of str
+            IDs of the files that were reused from the upload cache.
 
         Returns
         -------
-        list of AsyncJob
-            List of jobs on the server matching the query.
+        AsyncJob
+            Object representing the in-progress job.
         """
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UndefinedObjectWarning)
-            filtered_job_resp = self.job_queue_api.get_jobs(
-                name_filter=name,
-                job_type=job_type.value if job_type else None,
-                status=status.value if status else None,
-                description_filter=description,
-                submitter_name_filter=submitter_name,
+        try:
+            return self._submit_job(job_request)
+        except ApiException as e:
+            if not reused_file_ids or e.status_code not in _REJECTED_FILE_ID_STATUSES:
+                raise
+            assert self._upload_cache is not None
+            self._upload_cache._invalidate(reused_file_ids)
+            logger.debug(
+                f"Job creation failed with {len(reused_file_ids)} cached file IDs, retrying"
             )
+            self._post_files(job_request)
+            return self._submit_job(job_request)
 
-        job_list = filtered_job_resp.results
-        assert isinstance(job_list, list)
-        self._update_job_list_from_resp(job_resp=job_list)
-        if not filtered_job_resp.results:
-            return []
-        filtered_ids = [job.id for job in filtered_job_resp.results]
-        return [job for id_, job in self._jobs.items() if id_ in filtered_ids]
-
-    def get_job_by_id(self, job_id: str) -> "AsyncJob":
+    def _submit_job(self, job_request: "JobRequest") -> "AsyncJob":
         """
-        Get the job with a given job ID.
+        Create a job from a job request whose files have already been uploaded.
 
         Parameters
         ----------
-        job_id : str
-            Job ID.
+        job_request : JobRequest
+            Job request to submit to the server.
 
         Returns
         -------
         AsyncJob
-            Job with the given ID.
+            Object representing the in-progress job.
         """
-        return next(job for id_, job in self._jobs.items() if id_ == job_id)
+        job_response = self.job_queue_api.create_job(body=job_request._get_job_for_submission())
+        self._reconcile_jobs([job_response])
+        return self.get_job_by_id(cast(str, job_response.id))
 
-    def delete_jobs(self, jobs: "List[AsyncJob]") -> None:
+    def create_sharded_export_and_wait(
+        self,
+        job_request: ExcelExportJobRequest,
+        output_path: Union[str, pathlib.Path],
+        max_records_per_job: Optional[int] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> "List[AsyncJob]":
         """
-        Delete one or more jobs from the server.
+        Export records using several jobs in parallel, and merge their outputs into one archive.
 
-        Parameters
-        ----------
-        jobs : list of AsyncJob
-            List of jobs to delete from the server.
-        """
-        for job in jobs:
-            self.job_queue_api.delete_job(id=job.id)
-            self._jobs.pop(job.id, None)
-            job._is_deleted = True
-        self._refetch_jobs()
+        The records in the job request are split into groups of consecutive records, and one job
+        is created for each group. The template file is only uploaded once. When all jobs have
+        succeeded, the exported data from every job is merged into a single ZIP archive. Output
+        files that are ZIP archives are unpacked into the merged archive. Files with the same name
+        in more than one output are renamed with the number of the job they came from, for
+        example ``Export (part 2).xlsx``.
 
-    def _refetch_jobs(self) -> None:
-        """Refetch the list of jobs from the server."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UndefinedObjectWarning)
-            job_resp = self.job_queue_api.get_jobs()
-        job_list = job_resp.results
-        assert isinstance(job_list, list)
-        self._update_job_list_from_resp(job_resp=job_list, flush_jobs=True)
+        Performs HTTP requests against the Granta MI Server API.
 
-    def _update_job_list_from_resp(
-        self, job_resp: List[models.GsaJob], flush_jobs: bool = False
-    ) -> None:
-        """
-        Update the internal job list with a list of job objects from the server.
+        .. versionadded:: 1.4
 
         Parameters
         ----------
-        job_resp : List[models.GsaJob]
-            List of job objects from the server.
-        flush_jobs : bool, default: False
-            Whether to remove jobs from the internal list that are not in
-            the ``job_resp`` list.
-        """
-        remote_ids = [remote_job.id for remote_job in job_resp]
-        if flush_jobs:
-            for job_id in self._jobs:
-                if job_id not in remote_ids:
-                    self._jobs.pop(job_id)
-        for job_obj in job_resp:
-            job_id = cast(str, job_obj.id)
-            if job_id not in self._jobs:
-                self._jobs[job_id] = AsyncJob.create_job(job_obj, self.job_queue_api)
-            else:
-                self._jobs[job_id]._update_job(job_obj)
+        job_request : ExcelExportJobRequest
+            Export job request to split. Each job is named after the request, with a suffix such
+            as ``(part 1 of 4)``.
+        output_path : str or pathlib.Path
+            Path to save the merged ZIP archive to.
+        max_records_per_job : int, default: None
+            Maximum number of records to export in each job. If ``None``, one job is created for
+            each job the server can process concurrently, as given by
+            :attr:`processing_configuration`.
+        polling_strategy : PollingStrategy, default: None
+            Strategy that controls how often the server is polled. If ``None``,
+            :attr:`polling_strategy` is used.
+
+        Returns
+        -------
+        list of AsyncJob
+            Completed export jobs, in the order of the records they exported.
 
-    def create_job_and_wait(self, job_request: "JobRequest") -> "AsyncJob":  # noqa: D205, D400
+        Raises
+        ------
+        TimeoutError
+            If the polling strategy timeout expires before all jobs complete.
+        ValueError
+            If the job request does not contain exactly one template file, or if any of the jobs
+            did not succeed. The merged archive is not created.
         """
-        Create a job from an Excel import or export request or from a text import request.
+        if max_records_per_job is not None:
+            if max_records_per_job < 1:
+                raise ValueError("max_records_per_job must be at least 1.")
+            shard_count = math.ceil(len(job_request._records) / max_records_per_job)
+        else:
+            shard_count = self.processing_configuration.concurrency
+        shards = _split_export_request(job_request, shard_count)
+
+        # The template is only uploaded with the first job, and reused by the others
+        jobs = [self.create_job(shards[0])]
+        template_file_id = _get_template_file(shards[0]).file_id
+        for shard in shards[1:]:
+            _get_template_file(shard).file_id = template_file_id
+            jobs.append(self._submit_job(shard))
+        logger.debug(f"Created {len(jobs)} export jobs for {len(job_request._records)} records")
+
+        _, not_done = self.wait_for_jobs(jobs, polling_strategy=polling_strategy)
+        if not_done:
+            raise TimeoutError(
+                f"{len(not_done)} of {len(jobs)} export jobs did not complete in time."
+            )
+        failed = [job for job in jobs if job.status != JobStatus.Succeeded]
+        if failed:
+            names = ", ".join(f'"{job.name}"' for job in failed)
+            raise ValueError(f"{len(failed)} of {len(jobs)} export jobs did not succeed: {names}")
+        _merge_export_outputs(jobs, pathlib.Path(output_path))
+        return jobs
+
+    def create_split_text_import_and_wait(
+        self,
+        job_request: TextImportJobRequest,
+        max_jobs: Optional[int] = None,
+        header_lines: int = 1,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> "List[AsyncJob]":
+        """
+        Import a large text data file using several jobs in parallel.
 
-        This method create a job from an :class:`~.ExcelImportJobRequest`, :class:`~.ExcelExportJobRequest`, or
-        :class:`~.TextImportJobRequest` object and waits until the job is complete.
+        The data file is read in fixed-size chunks and split into parts of similar size. Parts are
+        only split between lines, so each record is imported by exactly one job. The header lines
+        of the data file are repeated at the start of every part. One job is created for each
+        part, and all jobs share the template and attachment files, which are only uploaded once.
 
-        This method also uploads the files included in the job request as a part of the job
-        submission process.
+        Use :meth:`merge_import_summaries` to combine the summaries of the completed jobs into a
+        single report.
+
+        Performs HTTP requests against the Granta MI Server API.
+
+        .. versionadded:: 1.4
 
         Parameters
         ----------
-        job_request : JobRequest
-            Job request to submit to the job queue.
+        job_request : TextImportJobRequest
+            Import job request to split. The request must contain exactly one data file, with one
+            record on each line. Each job is named after the request, with a suffix such as
+            ``(part 1 of 4)``.
+        max_jobs : int, default: None
+            Maximum number of jobs to create. If ``None``, one job is created for each job the
+            server can process concurrently, as given by :attr:`processing_configuration`.
+        header_lines : int, default: 1
+            Number of lines at the start of the data file to include in every part.
+        polling_strategy : PollingStrategy, default: None
+            Strategy that controls how often the server is polled. If ``None``,
+            :attr:`polling_strategy` is used.
 
         Returns
         -------
-        AsyncJob
-            Object representing the completed job.
+        list of AsyncJob
+            Completed import jobs, in the order of the data they imported.
+
+        Raises
+        ------
+        ValueError
+            If the job request does not contain exactly one data file, or if ``max_jobs`` or
+            ``header_lines`` is invalid.
+        TimeoutError
+            If the polling strategy timeout expires before all jobs complete.
         """
-        job = self.create_job(job_request=job_request)
-        request_count = 0
-        last_exception: Optional[Exception] = None
-        time.sleep(1)
-        while request_count < self._wait_retries:
-            try:
-                job.update()
-                status = job.status
-                if status not in [JobStatus.Pending, JobStatus.Running]:
-                    return job
-            except ApiException as exception_info:
-                request_count += 1
-                last_exception = exception_info
-            except Exception as exception_info:
-                last_exception = exception_info
-                break
-            time.sleep(1)
-        if last_exception:
-            raise last_exception
-        else:
-            return job
+        if max_jobs is None:
+            max_jobs = self.processing_configuration.concurrency
+        elif max_jobs < 1:
+            raise ValueError("max_jobs must be at least 1.")
+        if header_lines < 0:
+            raise ValueError("header_lines must not be negative.")
+
+        with tempfile.TemporaryDirectory() as folder:
+            shards = _split_text_import_request(
+                job_request, max_jobs, header_lines, pathlib.Path(folder)
+            )
+            jobs = [self.create_job(shards[0])]
+
+            # Reuse the template and attachments, and only upload the data file of each shard
+            data_files = []
+            for shard in shards[1:]:
+                for file, first_file in zip(shard._files, shards[0]._files):
+                    if file.file_type == _FileType.Data:
+                        data_files.append(file)
+                    else:
+                        file.file_id = first_file.file_id
+            if data_files:
+                max_workers = min(self.max_upload_workers, len(data_files))
+                self._grow_connection_pool(max_workers)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    file_ids = executor.map(self._upload_file, data_files)
+                    for file, file_id in zip(data_files, file_ids):
+                        file.file_id = file_id
+            jobs.extend(self._submit_job(shard) for shard in shards[1:])
+        logger.debug(f"Created {len(jobs)} text import jobs")
+
+        _, not_done = self.wait_for_jobs(jobs, polling_strategy=polling_strategy)
+        if not_done:
+            raise TimeoutError(
+                f"{len(not_done)} of {len(jobs)} import jobs did not complete in time."
+            )
+        return jobs
 
-    def create_job(self, job_request: "JobRequest") -> "AsyncJob":  # noqa: D205, D400
+    @staticmethod
+    def merge_import_summaries(jobs: "Iterable[AsyncJob]") -> Optional[Dict[str, Any]]:
         """
-        Create a job from an Excel import or export request or from a text import request.
+        Combine the summaries of several import jobs into a single report.
 
-        This method creates a job from an :class:`~.ExcelImportJobRequest`, :class:`~.ExcelExportJobRequest`, or
-        :class:`~.TextImportJobRequest` object.
+        The ``summary`` entries of the :attr:`.AsyncJob.output_information` of each job are merged
+        field by field. Boolean values are ``True`` only if they are ``True`` for every job,
+        numbers are added together, lists are concatenated, and nested dictionaries are merged in
+        the same way. Other values are kept if they are the same for every job, and are otherwise
+        returned as a list with one value for each job.
 
-        This method also uploads the files included in the job request as a part of the job
-        submission process.
+        .. versionadded:: 1.4
 
         Parameters
         ----------
-        job_request : JobRequest
-            Job request to submit to the server.
+        jobs : iterable of AsyncJob
+            Jobs to combine the summaries of, such as the jobs returned by
+            :meth:`create_split_text_import_and_wait`. Jobs without a summary are ignored.
 
         Returns
         -------
-        AsyncJob
-            Object representing the in-progress job.
+        dict or None
+            Combined summary, or ``None`` if none of the jobs has a summary.
         """
-        job_request._post_files(api_client=self.job_queue_api)
-
-        job_response = self.job_queue_api.create_job(body=job_request._get_job_for_submission())
-        self._update_job_list_from_resp([job_response])
-        return self._jobs[cast(str, job_response.id)]
+        return _merge_job_summaries(list(jobs))
 
 
 class Connection(ApiClientFactory):
@@ -418,6 +1920,17 @@ class Connection(ApiClientFactory):
        Additional configuration settings for the requests session. If ``None``, the
        :class:`~ansys.openapi.common.SessionConfiguration` class with default parameters
        is used.
+    version_cache : ServerVersionCache, default: None
+       Cache of Granta MI server versions. If provided, the connection is only checked if the
+       server version is not in the cache or has expired.
+
+       .. versionadded:: 1.4
+    connection_pool : ConnectionPoolConfiguration, default: None
+       Configuration of the pool of HTTP connections used by the client. If ``None``, the
+       :class:`~.ConnectionPoolConfiguration` class with default parameters is used, and the pool is
+       sized automatically.
+
+       .. versionadded:: 1.4
 
     Notes
     -----
@@ -449,13 +1962,19 @@ class Connection(ApiClientFactory):
     """
 
     def __init__(
-        self, servicelayer_url: str, session_configuration: Optional[SessionConfiguration] = None
+        self,
+        servicelayer_url: str,
+        session_configuration: Optional[SessionConfiguration] = None,
+        version_cache: Optional[ServerVersionCache] = None,
+        connection_pool: Optional[ConnectionPoolConfiguration] = None,
     ):
         from . import __version__
 
         auth_url = servicelayer_url.strip("/") + AUTH_PATH
         super().__init__(auth_url, session_configuration)
         self._base_service_layer_url = servicelayer_url
+        self._version_cache = version_cache
+        self._connection_pool = connection_pool or ConnectionPoolConfiguration()
         self._session_configuration.headers["X-Granta-ApplicationName"] = (
             GRANTA_APPLICATION_NAME_HEADER
         )
@@ -469,6 +1988,9 @@ class Connection(ApiClientFactory):
 
         Authentication must be configured for this method to succeed.
 
+        If a :class:`~.ServerVersionCache` was provided and contains an unexpired version for the
+        server, the connection check is skipped.
+
         Returns
         -------
         :class:`.JobQueueApiClient`
@@ -482,11 +2004,14 @@ class Connection(ApiClientFactory):
             self._session_configuration,
         )
         client.setup_client(models)
-        self._test_connection(client)
+        client._configure_connection_pool(self._connection_pool)
+        self._test_connection(client, self._version_cache)
         return client
 
     @staticmethod
-    def _test_connection(client: JobQueueApiClient) -> None:
+    def _test_connection(
+        client: JobQueueApiClient, version_cache: Optional[ServerVersionCache] = None
+    ) -> None:
         """
         Check if the created client can be used to perform a request.
 
@@ -495,6 +2020,11 @@ class Connection(ApiClientFactory):
 
         The first checks ensures that the Server API exists and is functional. The second check
         ensures that the Granta MI server version is compatible with this version of the package.
+        Both checks are performed concurrently. The API definition is only checked for existence,
+        and is not downloaded.
+
+        If a version cache is provided and contains a version for the server, both checks are
+        skipped. Otherwise, the version is added to the cache if both checks succeed.
 
         A failure at any point raises a ``ConnectionError``.
 
@@ -502,14 +2032,26 @@ class Connection(ApiClientFactory):
         ----------
         client : :class:`~.JobQueueApiClient`
             Client object to test.
+        version_cache : ServerVersionCache, default: None
+            Cache of Granta MI server versions.
 
         Raises
         ------
         ConnectionError
             Error raised if the connection test fails.
         """
+        if version_cache is not None:
+            cached_version = version_cache.get(client.api_url)
+            if cached_version is not None and cached_version >= MINIMUM_GRANTA_MI_VERSION:
+                logger.debug(f"Using cached Granta MI version {cached_version}")
+                return
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            definition_check = executor.submit(_probe_api_definition, client)
+            version_check = executor.submit(_get_mi_server_version, client)
+
         try:
-            client.call_api(resource_path=API_DEFINITION_PATH, method="GET")
+            definition_check.result()
         except ApiException as e:
             if e.status_code == 404:
                 raise ConnectionError(
@@ -530,7 +2072,7 @@ class Connection(ApiClientFactory):
             ) from e
 
         try:
-            server_version = _get_mi_server_version(client)
+            server_version = version_check.result()
         except ApiException as e:
             raise ConnectionError(
                 "Cannot check the Granta MI server version. Ensure that the Granta MI server version "
@@ -548,3 +2090,6 @@ class Connection(ApiClientFactory):
                 f"version is {'.'.join([str(e) for e in server_version])}, but this package "
                 f"requires at least {'.'.join([str(e) for e in MINIMUM_GRANTA_MI_VERSION])}."
             )
+
+        if version_cache is not None:
+            version_cache.set(client.api_url, server_version)
@@ -0,0 +1,459 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for request timing instrumentation."""
+
+from collections import deque
+from dataclasses import dataclass
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Optional, Tuple
+
+from ._logger import logger
+
+if TYPE_CHECKING:
+    import opentelemetry.trace
+    import requests  # type: ignore[import-untyped]
+
+
+@dataclass(frozen=True, slots=True)
+class RequestEvent:
+    """
+    Describes a single HTTP request sent to the Granta MI Server API.
+
+    An event is reported for every request sent by a :class:`~.JobQueueApiClient`, including each
+    retry of a failed request. Register a function with :meth:`.JobQueueApiClient.add_request_hook`
+    to receive events.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    method : str
+        HTTP method of the request.
+    endpoint : str
+        Path of the endpoint relative to the Server API URL, with unresolved path parameters. For
+        example, ``/v1alpha/job-queue/jobs/{id}``.
+    status_code : int or None
+        HTTP status code of the response, or ``None`` if no response was received.
+    bytes_sent : int
+        Size of the request body in bytes.
+    bytes_received : int
+        Size of the response body in bytes.
+    start_time : float
+        Time at which the request was sent, in seconds since the epoch.
+    elapsed_seconds : float
+        Wall time from sending the request to receiving the whole response body. For output files
+        opened with :meth:`.AsyncJob.open_output`, this is the time until the stream is closed.
+    error : Exception or None
+        Exception raised if no response was received.
+    """
+
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    bytes_sent: int
+    bytes_received: int
+    start_time: float
+    elapsed_seconds: float
+    error: Optional[Exception] = None
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the endpoint, made of the HTTP method and the endpoint path.
+
+        Returns
+        -------
+        str
+            Name of the endpoint, for example ``GET /v1alpha/job-queue/jobs/{id}``.
+        """
+        return f"{self.method} {self.endpoint}"
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Whether the server returned a successful response.
+
+        Returns
+        -------
+        bool
+            ``True`` if the status code is in the 2xx range, ``False`` otherwise.
+        """
+        return self.status_code is not None and 200 <= self.status_code <= 299
+
+
+RequestHook = Callable[[RequestEvent], None]
+"""Function called with a :class:`RequestEvent` after each request to the Server API."""
+
+
+@dataclass(frozen=True)
+class EndpointStatistics:
+    """
+    Provides a snapshot of the requests sent to one Server API endpoint.
+
+    Returned by :attr:`.LatencyAggregator.statistics`.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    count : int
+        Number of requests sent to the endpoint.
+    errors : int
+        Number of requests that did not receive a successful response.
+    bytes_sent : int
+        Total size of the request bodies in bytes.
+    bytes_received : int
+        Total size of the response bodies in bytes.
+    total_seconds : float
+        Total wall time of all requests.
+    p50 : float
+        Median wall time of a request, in seconds.
+    p95 : float
+        95th percentile of the wall time of a request, in seconds.
+    p99 : float
+        99th percentile of the wall time of a request, in seconds.
+    """
+
+    count: int
+    errors: int
+    bytes_sent: int
+    bytes_received: int
+    total_seconds: float
+    p50: float
+    p95: float
+    p99: float
+
+
+def _get_percentile(sorted_values: "list[float]", percentile: float) -> float:
+    """
+    Get a percentile of a sorted list of values with the nearest-rank method.
+
+    Parameters
+    ----------
+    sorted_values : list of float
+        Values in ascending order. Must not be empty.
+    percentile : float
+        Percentile to get, between 0 and 100.
+
+    Returns
+    -------
+    float
+        Smallest value that is greater than or equal to ``percentile`` percent of the values.
+    """
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _EndpointRecord:
+    """Running totals and recent wall times for one endpoint."""
+
+    __slots__ = ("count", "errors", "bytes_sent", "bytes_received", "total_seconds", "samples")
+
+    def __init__(self, max_samples: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_seconds = 0.0
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+
+class LatencyAggregator:
+    """
+    Collects the latency of requests to each Server API endpoint in memory.
+
+    Register an instance with :meth:`.JobQueueApiClient.add_request_hook`, and read
+    :attr:`statistics` to find which endpoints a batch of work spends its time in. Percentiles are
+    computed from the most recent ``max_samples`` requests to each endpoint. Counts and totals
+    include all requests.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    max_samples : int, default: 10000
+        Maximum number of wall times to keep for each endpoint.
+
+    Examples
+    --------
+    >>> latencies = LatencyAggregator()
+    >>> client.add_request_hook(latencies)
+    >>> client.submit_many(job_requests)
+    >>> for endpoint, stats in latencies.statistics.items():
+    ...     print(f"{endpoint}: {stats.count} requests, p95 {stats.p95 * 1000:.0f} ms")
+    POST /v1alpha/job-queue/files: 200 requests, p95 180 ms
+    POST /v1alpha/job-queue/jobs: 100 requests, p95 95 ms
+    """
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        if max_samples < 1:
+            raise ValueError("max_samples must be at least 1.")
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self._records: Dict[str, _EndpointRecord] = {}
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{type(self).__name__}: endpoints: {len(self._records)}>"
+
+    def __call__(self, event: RequestEvent) -> None:
+        """
+        Record a request.
+
+        Parameters
+        ----------
+        event : RequestEvent
+            Request to record.
+        """
+        with self._lock:
+            record = self._records.get(event.name)
+            if record is None:
+                record = self._records[event.name] = _EndpointRecord(self._max_samples)
+            record.count += 1
+            record.errors += not event.succeeded
+            record.bytes_sent += event.bytes_sent
+            record.bytes_received += event.bytes_received
+            record.total_seconds += event.elapsed_seconds
+            record.samples.append(event.elapsed_seconds)
+
+    @property
+    def statistics(self) -> Dict[str, EndpointStatistics]:
+        """
+        Statistics of the requests to each endpoint.
+
+        Returns
+        -------
+        dict of str to EndpointStatistics
+            Statistics indexed by endpoint name, for example ``GET /v1alpha/job-queue/jobs``.
+        """
+        with self._lock:
+            snapshot = [
+                (name, record, sorted(record.samples)) for name, record in self._records.items()
+            ]
+        return {
+            name: EndpointStatistics(
+                count=record.count,
+                errors=record.errors,
+                bytes_sent=record.bytes_sent,
+                bytes_received=record.bytes_received,
+                total_seconds=record.total_seconds,
+                p50=_get_percentile(samples, 50),
+                p95=_get_percentile(samples, 95),
+                p99=_get_percentile(samples, 99),
+            )
+            for name, record, samples in snapshot
+        }
+
+    def reset(self) -> None:
+        """Remove all recorded requests."""
+        with self._lock:
+            self._records.clear()
+
+
+class OpenTelemetryHook:
+    """
+    Emits an OpenTelemetry span for each request to the Server API.
+
+    Spans are named after the endpoint, for example ``GET /v1alpha/job-queue/jobs/{id}``, and use
+    the OpenTelemetry semantic conventions for HTTP client attributes. Register an instance with
+    :meth:`.JobQueueApiClient.add_request_hook`.
+
+    This class requires the ``opentelemetry-api`` package. Configure an OpenTelemetry SDK tracer
+    provider to export the spans.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    tracer : opentelemetry.trace.Tracer, default: None
+        Tracer used to create spans. If ``None``, a tracer named ``ansys.grantami.jobqueue`` is
+        obtained from the global tracer provider.
+
+    Raises
+    ------
+    ImportError
+        If the ``opentelemetry-api`` package is not installed.
+    """
+
+    def __init__(self, tracer: "Optional[opentelemetry.trace.Tracer]" = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetryHook requires the 'opentelemetry-api' package.") from e
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("ansys.grantami.jobqueue")
+
+    def __call__(self, event: RequestEvent) -> None:
+        """
+        Emit a span for a request.
+
+        Parameters
+        ----------
+        event : RequestEvent
+            Request to emit a span for.
+        """
+        start_ns = int(event.start_time * 1e9)
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.template": event.endpoint,
+            "http.request.body.size": event.bytes_sent,
+            "http.response.body.size": event.bytes_received,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        span = self._tracer.start_span(
+            event.name,
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=start_ns,
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+        if not event.succeeded:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=start_ns + int(event.elapsed_seconds * 1e9))
+
+
+def _emit_request_event(hooks: Tuple[RequestHook, ...], event: RequestEvent) -> None:
+    """
+    Call each request hook with an event.
+
+    Exceptions raised by hooks are logged and otherwise ignored, so that a faulty hook never causes
+    a request to fail.
+
+    Parameters
+    ----------
+    hooks : tuple of callable
+        Functions to call.
+    event : RequestEvent
+        Event to report.
+    """
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception as e:
+            logger.warning(f"Request hook {hook!r} raised an exception: {e!r}")
+
+
+def _get_request_hooks(api_client: Any) -> Tuple[RequestHook, ...]:
+    """
+    Get the request hooks registered on a client.
+
+    Parameters
+    ----------
+    api_client : Any
+        Client that sends requests.
+
+    Returns
+    -------
+    tuple of callable
+        Registered hooks, or an empty tuple if the client does not support hooks.
+    """
+    hooks = getattr(api_client, "_request_hooks", ())
+    return hooks if isinstance(hooks, tuple) else ()
+
+
+def _get_request_size(response: "requests.Response") -> int:
+    """
+    Get the size of the body of the request that produced a response.
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response to a request.
+
+    Returns
+    -------
+    int
+        Size of the request body in bytes, or ``0`` if the size is not known.
+    """
+    request = getattr(response, "request", None)
+    body = getattr(request, "body", None)
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body)
+    except TypeError:
+        content_length = request.headers.get("Content-Length")  # type: ignore[union-attr]
+        return int(content_length) if content_length else 0
+
+
+class _RequestTimer:
+    """
+    Measures a request and reports it to the request hooks of a client.
+
+    Parameters
+    ----------
+    hooks : tuple of callable
+        Functions to report the request to.
+    method : str
+        HTTP method of the request.
+    endpoint : str
+        Path of the endpoint, with unresolved path parameters.
+    """
+
+    __slots__ = ("_hooks", "_method", "_endpoint", "_start_time", "_start")
+
+    def __init__(self, hooks: Tuple[RequestHook, ...], method: str, endpoint: str) -> None:
+        self._hooks = hooks
+        self._method = method.upper()
+        self._endpoint = endpoint
+        self._start_time = time.time()
+        self._start = time.perf_counter()
+
+    def finish(
+        self,
+        status_code: Optional[int],
+        bytes_sent: int,
+        bytes_received: int,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """
+        Report the request.
+
+        Parameters
+        ----------
+        status_code : int or None
+            HTTP status code of the response, or ``None`` if no response was received.
+        bytes_sent : int
+            Size of the request body in bytes.
+        bytes_received : int
+            Size of the response body in bytes.
+        error : Exception, default: None
+            Exception raised if no response was received.
+        """
+        event = RequestEvent(
+            method=self._method,
+            endpoint=self._endpoint,
+            status_code=status_code,
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            start_time=self._start_time,
+            elapsed_seconds=time.perf_counter() - self._start,
+            error=error,
+        )
+        _emit_request_event(self._hooks, event)
@@ -0,0 +1,503 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for Prometheus-style job queue metrics."""
+
+import bisect
+import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import math
+import threading
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+if TYPE_CHECKING:
+    from ._models import AsyncJob
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    1.0,
+    5.0,
+    15.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    1800.0,
+    3600.0,
+    7200.0,
+    21600.0,
+    86400.0,
+)
+"""Default upper bounds of the histogram buckets, in seconds."""
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_COMPLETED_STATUSES = {"Succeeded": "succeeded", "Failed": "failed", "Cancelled": "cancelled"}
+
+_Labels = Tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    """
+    Escape a label value for the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    value : str
+        Label value.
+
+    Returns
+    -------
+    str
+        Value with backslashes, double quotes, and line feeds escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """
+    Format a set of labels for the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    names : sequence of str
+        Label names.
+    values : sequence of str
+        Label values, in the same order as ``names``.
+
+    Returns
+    -------
+    str
+        Labels enclosed in braces, or an empty string if there are no labels.
+    """
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value or bucket bound for the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    value : float
+        Value to format.
+
+    Returns
+    -------
+    str
+        Formatted value.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
+
+
+class _Histogram:
+    """
+    Histogram of observations, with one series per set of label values.
+
+    Each observation updates one bucket count in logarithmic time in the number of buckets.
+    Cumulative bucket counts are only computed when the histogram is rendered.
+
+    Parameters
+    ----------
+    name : str
+        Metric name.
+    help_text : str
+        Description of the metric.
+    label_names : tuple of str
+        Names of the labels of each series.
+    buckets : tuple of float
+        Upper bounds of the buckets, in increasing order. A bucket for all values is added.
+    """
+
+    def __init__(
+        self, name: str, help_text: str, label_names: _Labels, buckets: Tuple[float, ...]
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.bounds = [float(bound) for bound in buckets]
+        self.series: Dict[_Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, labels: _Labels, value: float) -> None:
+        """
+        Record an observation.
+
+        Parameters
+        ----------
+        labels : tuple of str
+            Label values of the series to update.
+        value : float
+            Observed value.
+        """
+        counts, totals = self.series.setdefault(labels, ([0] * (len(self.bounds) + 1), [0.0]))
+        counts[bisect.bisect_left(self.bounds, value)] += 1
+        totals[0] += value
+
+    def render(self) -> Iterable[str]:
+        """
+        Render the histogram in the Prometheus text exposition format.
+
+        Returns
+        -------
+        iterable of str
+            Lines of text, without line feeds.
+        """
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        names = (*self.label_names, "le")
+        for labels, (counts, totals) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip([*self.bounds, math.inf], counts):
+                cumulative += count
+                bucket_labels = _format_labels(names, (*labels, _format_value(bound)))
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            formatted_labels = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{formatted_labels} {_format_value(totals[0])}"
+            yield f"{self.name}_count{formatted_labels} {cumulative}"
+
+
+class _Counter:
+    """
+    Monotonic counter, with one series per set of label values.
+
+    Parameters
+    ----------
+    name : str
+        Metric name.
+    help_text : str
+        Description of the metric.
+    label_names : tuple of str
+        Names of the labels of each series.
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: _Labels) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.series: Dict[_Labels, int] = {}
+
+    def increment(self, labels: _Labels) -> None:
+        """
+        Add one to a series.
+
+        Parameters
+        ----------
+        labels : tuple of str
+            Label values of the series to update.
+        """
+        self.series[labels] = self.series.get(labels, 0) + 1
+
+    def render(self) -> Iterable[str]:
+        """
+        Render the counter in the Prometheus text exposition format.
+
+        Returns
+        -------
+        iterable of str
+            Lines of text, without line feeds.
+        """
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in sorted(self.series.items()):
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {value}"
+
+
+def _seconds_between(
+    start: Optional[datetime.datetime], end: Optional[datetime.datetime]
+) -> Optional[float]:
+    """
+    Get the number of seconds between two dates.
+
+    Parameters
+    ----------
+    start : datetime.datetime or None
+        Start date.
+    end : datetime.datetime or None
+        End date.
+
+    Returns
+    -------
+    float or None
+        Number of seconds, clamped to zero, or ``None`` if either date is missing.
+    """
+    if start is None or end is None:
+        return None
+    return max((end - start).total_seconds(), 0.0)
+
+
+class JobMetrics:
+    """
+    Collects Prometheus-style metrics of job queue wait and run durations.
+
+    Assign an instance to :attr:`.JobQueueApiClient.job_metrics`. The metrics are updated each time
+    the client observes a job for the first time or a job changes state, for example when
+    :attr:`.JobQueueApiClient.jobs` is read or :meth:`.JobQueueApiClient.wait_for_jobs` polls the
+    server. Each job contributes to each metric at most once, so repeatedly listing the same jobs
+    does not inflate the counts. Metrics are never recomputed from the full list of jobs.
+
+    The following metrics are collected, labeled by ``job_type`` and ``submitter``:
+
+    * ``<namespace>_jobs_observed_total``: Counter of jobs observed by the client.
+    * ``<namespace>_jobs_completed_total``: Counter of completed jobs, additionally labeled by
+      ``status``: ``succeeded``, ``failed``, or ``cancelled``.
+    * ``<namespace>_queue_wait_seconds``: Histogram of the time from submission to execution.
+    * ``<namespace>_run_seconds``: Histogram of the time from execution to completion.
+
+    Jobs that had already started or completed when they were first observed are included.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    buckets : sequence of float, default: DEFAULT_BUCKETS
+        Upper bounds of the histogram buckets, in seconds. The default buckets range from one
+        second to one day.
+    namespace : str, default: "grantami_jobqueue"
+        Prefix of the metric names.
+
+    Examples
+    --------
+    >>> metrics = JobMetrics()
+    >>> client.job_metrics = metrics
+    >>> server = metrics.start_http_server(port=9464)
+    >>> client.wait_for_jobs(jobs)
+    >>> print(metrics.render_text())
+    # HELP grantami_jobqueue_jobs_observed_total Number of jobs observed by the client.
+    # TYPE grantami_jobqueue_jobs_observed_total counter
+    grantami_jobqueue_jobs_observed_total{job_type="ExcelImportJob",submitter="User_1"} 10
+    ...
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "grantami_jobqueue"
+    ) -> None:
+        if not buckets:
+            raise ValueError("At least one bucket must be provided.")
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Bucket bounds must be unique and in ascending order.")
+        labels = ("job_type", "submitter")
+        self._lock = threading.Lock()
+        self._observed = _Counter(
+            f"{namespace}_jobs_observed_total", "Number of jobs observed by the client.", labels
+        )
+        self._completed = _Counter(
+            f"{namespace}_jobs_completed_total",
+            "Number of jobs that completed, by final status.",
+            (*labels, "status"),
+        )
+        self._queue_wait = _Histogram(
+            f"{namespace}_queue_wait_seconds",
+            "Time from job submission to execution, in seconds.",
+            labels,
+            tuple(buckets),
+        )
+        self._run_time = _Histogram(
+            f"{namespace}_run_seconds",
+            "Time from job execution to completion, in seconds.",
+            labels,
+            tuple(buckets),
+        )
+        self._observed_ids: Set[str] = set()
+        self._started_ids: Set[str] = set()
+        self._completed_ids: Set[str] = set()
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{type(self).__name__}: jobs: {len(self._observed_ids)}>"
+
+    def observe(self, job: "AsyncJob") -> None:
+        """
+        Update the metrics with the current state of a job.
+
+        This method is called by :class:`.JobQueueApiClient` whenever a job is added or changes
+        state. Call it directly to include jobs that are updated by other means.
+
+        Parameters
+        ----------
+        job : AsyncJob
+            Job to observe.
+        """
+        job_id = job._id
+        labels = (job._type, job._submitter_name)
+        status = job.status.name
+        with self._lock:
+            if job_id not in self._observed_ids:
+                self._observed_ids.add(job_id)
+                self._observed.increment(labels)
+            if job_id not in self._started_ids and job._execution_datetime is not None:
+                queue_wait = _seconds_between(job._submission_date, job._execution_datetime)
+                if queue_wait is not None:
+                    self._started_ids.add(job_id)
+                    self._queue_wait.observe(labels, queue_wait)
+            if job_id not in self._completed_ids and status in _COMPLETED_STATUSES:
+                self._completed_ids.add(job_id)
+                self._completed.increment((*labels, _COMPLETED_STATUSES[status]))
+                run_time = _seconds_between(job._execution_datetime, job._completion_datetime)
+                if run_time is not None:
+                    self._run_time.observe(labels, run_time)
+
+    def forget(self, job_id: str) -> None:
+        """
+        Stop tracking a job that was deleted from the server.
+
+        Metrics already recorded for the job are kept. Only the record of which metrics the job has
+        contributed to is discarded, so that memory usage does not grow with deleted jobs.
+
+        Parameters
+        ----------
+        job_id : str
+            ID of the job.
+        """
+        with self._lock:
+            self._observed_ids.discard(job_id)
+            self._started_ids.discard(job_id)
+            self._completed_ids.discard(job_id)
+
+    def render_text(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            Metrics in the Prometheus text exposition format, version 0.0.4.
+        """
+        with self._lock:
+            lines = [
+                line
+                for metric in (self._observed, self._completed, self._queue_wait, self._run_time)
+                for line in metric.render()
+            ]
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(self, port: int = 0, address: str = "127.0.0.1") -> "MetricsServer":
+        """
+        Serve the metrics over HTTP on a background thread.
+
+        The metrics are served at the ``/metrics`` path, for scraping by a Prometheus server.
+
+        Parameters
+        ----------
+        port : int, default: 0
+            Port to listen on. If ``0``, a free port is chosen.
+        address : str, default: "127.0.0.1"
+            Address to listen on. The default only accepts connections from the local machine.
+
+        Returns
+        -------
+        MetricsServer
+            Running server. Call :meth:`.MetricsServer.close` to stop it.
+        """
+        return MetricsServer(self, port, address)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serves the metrics of a :class:`JobMetrics` object at ``/metrics``."""
+
+    server: "_MetricsHTTPServer"
+
+    def do_GET(self) -> None:
+        """Respond with the metrics in the text exposition format, or 404 for other paths."""
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.metrics.render_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Discard the request log, because scrapes are frequent."""
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    """HTTP server that holds the metrics to serve."""
+
+    daemon_threads = True
+
+    def __init__(self, metrics: JobMetrics, port: int, address: str) -> None:
+        self.metrics = metrics
+        super().__init__((address, port), _MetricsRequestHandler)
+
+
+class MetricsServer:
+    """
+    Serves job queue metrics over HTTP on a background thread.
+
+    This class is returned by :meth:`.JobMetrics.start_http_server` and should not be instantiated
+    directly. Use it as a context manager to ensure that the server is stopped.
+
+    .. versionadded:: 1.4
+    """
+
+    def __init__(self, metrics: JobMetrics, port: int, address: str) -> None:
+        self._server = _MetricsHTTPServer(metrics, port, address)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="JobMetricsServer", daemon=True
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{type(self).__name__} url: {self.url}>"
+
+    def __enter__(self) -> "MetricsServer":
+        """Return the running server."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self.close()
+
+    @property
+    def url(self) -> str:
+        """
+        URL of the metrics endpoint.
+
+        Returns
+        -------
+        str
+            URL of the metrics endpoint.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/metrics"
+
+    def close(self) -> None:
+        """Stop the server and release its port."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
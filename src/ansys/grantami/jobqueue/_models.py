@@ -23,17 +23,42 @@
 """Module for models."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 import datetime
 from enum import Enum
 import json
-import os
 import pathlib
-from typing import Any, Dict, List, Optional, Type, Union
-import warnings
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from ansys.grantami.serverapi_openapi.v2025r2 import api, models
-from ansys.openapi.common import UndefinedObjectWarning, Unset
+from ansys.openapi.common import ApiException, Unset
+
+from ._streaming import (
+    OutputFileStream,
+    ProgressCallback,
+    _get_output_file_size,
+    _open_output_file,
+    _StreamingUpload,
+)
+from ._upload_cache import UploadCache
+
+if TYPE_CHECKING:
+    from ._connection import JobQueueApiClient
 
 
 class _DocumentedEnum(Enum):
@@ -74,6 +99,22 @@ class JobType(Enum):
     TextImportJob = "TextImportJob"
 
 
+class WaitCondition(_DocumentedEnum):
+    """
+    Provides the conditions under which :meth:`~JobQueueApiClient.wait_for_jobs` returns.
+
+    .. versionadded:: 1.4
+    """
+
+    AllCompleted = "AllCompleted", """Return when all jobs have completed."""
+    FirstCompleted = "FirstCompleted", """Return when any job has completed."""
+    AnyFailed = (
+        "AnyFailed",
+        """Return when any job has failed or has been cancelled, or when all jobs have
+        completed.""",
+    )
+
+
 class _FileType(Enum):
     """Provides possible file types."""
 
@@ -106,7 +147,7 @@ class JobQueueProcessingConfiguration:
     concurrency: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExportRecord:
     """
     Defines a record to include in an export job.
@@ -231,6 +272,8 @@ class _JobFile:
         Type of file being represented.
     """
 
+    __slots__ = ("file_type", "_path", "_id", "_virtual_path")
+
     def __init__(self, path: pathlib.Path, file_type: _FileType):
         self.file_type = file_type
         self._path: pathlib.Path = path
@@ -366,6 +409,120 @@ class _JobFile:
         self._virtual_path = value
 
 
+class FileUploadError(Exception):
+    """
+    Raised when more than one file in a job request cannot be uploaded to the server.
+
+    If files are uploaded concurrently, the first failure cancels all uploads that have not yet
+    started. The errors for all files that failed are available in :attr:`errors`. If only one
+    file failed, the original exception is raised instead.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    errors : dict of pathlib.Path to Exception
+        Exception raised for each file that could not be uploaded, indexed by the local path
+        of the file.
+    """
+
+    def __init__(self, errors: Dict[pathlib.Path, Exception]) -> None:
+        self.errors = errors
+        details = "; ".join(f"{path}: {error!r}" for path, error in errors.items())
+        super().__init__(f"{len(errors)} file(s) could not be uploaded. {details}")
+
+
+@dataclass(frozen=True)
+class OutputFileDownload:
+    """
+    Describes an output file saved by :meth:`.JobQueueApiClient.download_outputs`.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    job_id : str
+        ID of the job that produced the file.
+    file_name : str
+        Name of the output file on the server.
+    path : pathlib.Path
+        Local path of the file.
+    size : int
+        Size of the file in bytes.
+    downloaded : bool
+        ``True`` if the file was downloaded, or ``False`` if a file with the same size already
+        existed at :attr:`path`.
+    """
+
+    job_id: str
+    file_name: str
+    path: pathlib.Path
+    size: int
+    downloaded: bool
+
+
+class FileDownloadError(Exception):
+    """
+    Raised when one or more job output files cannot be downloaded from the server.
+
+    All other files are still downloaded. The files that were saved successfully are available in
+    :attr:`manifest`, and the errors for all files that failed are available in :attr:`errors`.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    errors : dict of pathlib.Path to Exception
+        Exception raised for each file that could not be downloaded, indexed by the local path
+        the file would have been saved to.
+    manifest : list of OutputFileDownload
+        Files that were saved successfully.
+    """
+
+    def __init__(
+        self, errors: Dict[pathlib.Path, Exception], manifest: List[OutputFileDownload]
+    ) -> None:
+        self.errors = errors
+        self.manifest = manifest
+        details = "; ".join(f"{path}: {error!r}" for path, error in errors.items())
+        super().__init__(f"{len(errors)} file(s) could not be downloaded. {details}")
+
+
+@dataclass(frozen=True)
+class SubmissionResult:
+    """
+    Describes the outcome of submitting one job request with :meth:`.JobQueueApiClient.submit_many`.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    job_request : JobRequest
+        Job request that was submitted.
+    job : AsyncJob or None
+        Job created from the request, or ``None`` if the submission failed.
+    error : Exception or None
+        Exception raised while uploading the files or creating the job, or ``None`` if the
+        submission succeeded.
+    """
+
+    job_request: "JobRequest"
+    job: Optional["AsyncJob"] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Whether the job was created successfully.
+
+        Returns
+        -------
+        bool
+            ``True`` if the job was created, ``False`` otherwise.
+        """
+        return self.error is None
+
+
 class JobRequest(ABC):
     """
     Provides the abstract base class representing a job request.
@@ -439,18 +596,159 @@ class JobRequest(ABC):
         """
         raise NotImplementedError
 
-    def _post_files(self, api_client: api.JobQueueApi) -> None:
+    def _post_files(
+        self,
+        api_client: api.JobQueueApi,
+        max_workers: int = 1,
+        upload_cache: Optional[UploadCache] = None,
+        streaming: Optional[_StreamingUpload] = None,
+    ) -> Set[str]:
         """
         Upload files to the server.
 
+        File IDs are only assigned once all files have been uploaded successfully.
+
         Parameters
         ----------
         api_client : api.JobQueueApi
             Job queue API object for interacting with the server.
-        """
-        for file in self._files:
-            file_id = api_client.upload_file(file=file.path)
+        max_workers : int, default: 1
+            Maximum number of files to upload concurrently.
+        upload_cache : UploadCache, default: None
+            Cache of previously uploaded files. If provided, files in the cache are not uploaded
+            again, and uploaded files are added to the cache.
+        streaming : _StreamingUpload, default: None
+            Settings used to stream files larger than one chunk from disk. If not provided, each
+            file is read into memory before it is uploaded.
+
+        Returns
+        -------
+        set of str
+            IDs of the files that were reused from the cache instead of being uploaded.
+
+        Raises
+        ------
+        FileUploadError
+            If more than one file could not be uploaded. If only one file could not be uploaded,
+            the exception raised by that upload is raised unchanged.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if max_workers == 1 or len(self._files) <= 1:
+            results = [
+                self._upload_file(api_client, file, upload_cache, streaming) for file in self._files
+            ]
+        else:
+            results = self._post_files_concurrently(
+                api_client, max_workers, upload_cache, streaming
+            )
+        for file, (file_id, _) in zip(self._files, results):
             file.file_id = file_id
+        return {file_id for file_id, reused in results if reused}
+
+    def _post_files_concurrently(
+        self,
+        api_client: api.JobQueueApi,
+        max_workers: int,
+        upload_cache: Optional[UploadCache],
+        streaming: Optional[_StreamingUpload],
+    ) -> List[Tuple[str, bool]]:
+        """
+        Upload files to the server using a pool of threads.
+
+        If an upload fails, uploads that have not yet started are cancelled.
+
+        Parameters
+        ----------
+        api_client : api.JobQueueApi
+            Job queue API object for interacting with the server.
+        max_workers : int
+            Maximum number of files to upload concurrently.
+        upload_cache : UploadCache or None
+            Cache of previously uploaded files.
+        streaming : _StreamingUpload or None
+            Settings used to stream files from disk.
+
+        Returns
+        -------
+        list of tuple of (str, bool)
+            ID of each file and whether it was reused from the cache, in the same order as the
+            files in the job request.
+
+        Raises
+        ------
+        FileUploadError
+            If more than one file could not be uploaded. If only one file could not be uploaded,
+            the exception raised by that upload is raised unchanged.
+        """
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(self._files))) as executor:
+            futures: List[Future[Tuple[str, bool]]] = [
+                executor.submit(self._upload_file, api_client, file, upload_cache, streaming)
+                for file in self._files
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                future.cancel()
+        errors: Dict[pathlib.Path, Exception] = {}
+        for file, future in zip(self._files, futures):
+            if future.cancelled():
+                continue
+            exception = future.exception()
+            if exception is not None:
+                errors[file.path] = cast(Exception, exception)
+        if len(errors) == 1:
+            raise next(iter(errors.values()))
+        if errors:
+            raise FileUploadError(errors) from next(iter(errors.values()))
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _upload_file(
+        api_client: api.JobQueueApi,
+        file: _JobFile,
+        upload_cache: Optional[UploadCache],
+        streaming: Optional[_StreamingUpload] = None,
+    ) -> Tuple[str, bool]:
+        """
+        Upload a single file to the server, unless it is already in the cache.
+
+        Parameters
+        ----------
+        api_client : api.JobQueueApi
+            Job queue API object for interacting with the server.
+        file : _JobFile
+            File to upload.
+        upload_cache : UploadCache or None
+            Cache of previously uploaded files.
+        streaming : _StreamingUpload, default: None
+            Settings used to stream the file from disk.
+
+        Returns
+        -------
+        tuple of (str, bool)
+            ID of the file, and whether it was reused from the cache.
+        """
+
+        def upload() -> str:
+            # Files that fit in a single chunk gain nothing from streaming
+            if streaming is None or file.path.stat().st_size <= streaming.chunk_size:
+                return api_client.upload_file(file=file.path)
+            return streaming.upload_file(
+                cast("JobQueueApiClient", api_client.api_client), file.path
+            )
+
+        if upload_cache is None:
+            return upload(), False
+        key, file_id = upload_cache._get(file.path, file.virtual_path)
+        if file_id is not None:
+            return file_id, True
+        try:
+            file_id = upload()
+        except BaseException:
+            upload_cache._cancel(key)
+            raise
+        upload_cache._put(key, file_id)
+        return file_id, False
 
     @abstractmethod
     def _render_job_parameters(self) -> str:
@@ -977,6 +1275,47 @@ class TextImportJobRequest(ImportJobRequest):
         return JobType.TextImportJob
 
 
+class _LazyJsonMapping(Mapping[str, Any]):
+    """
+    Provides a read-only mapping of JSON strings that are parsed the first time each is accessed.
+
+    Parameters
+    ----------
+    raw_values : dict of str to str
+        JSON string for each key.
+    """
+
+    __slots__ = ("_raw_values", "_parsed_values")
+
+    def __init__(self, raw_values: Dict[str, Any]) -> None:
+        self._raw_values = raw_values
+        self._parsed_values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the parsed value for a key, parsing it if it has not been accessed before."""
+        try:
+            return self._parsed_values[key]
+        except KeyError:
+            pass
+        raw_value = self._raw_values[key]
+        assert isinstance(raw_value, str)
+        parsed_value = json.loads(raw_value)
+        self._parsed_values[key] = parsed_value
+        return parsed_value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys without parsing any values."""
+        return iter(self._raw_values)
+
+    def __len__(self) -> int:
+        """Return the number of keys in the mapping."""
+        return len(self._raw_values)
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return repr(dict(self))
+
+
 class AsyncJob:
     """
     Base class that represents a job on the server.
@@ -986,6 +1325,29 @@ class AsyncJob:
     name, description, and scheduled execution date.
     """
 
+    # Clients can track tens of thousands of jobs, so avoid a per-instance __dict__
+    __slots__ = (
+        "_job_queue_api",
+        "_is_deleted",
+        "_id",
+        "_name",
+        "_description",
+        "_status",
+        "_type",
+        "_position",
+        "_submitter_name",
+        "_submission_date",
+        "_submitter_roles",
+        "_completion_datetime",
+        "_execution_datetime",
+        "_scheduled_exec_datetime",
+        "_job_specific_outputs",
+        "_output_files",
+        "_output_information",
+        "_output_information_view",
+        "_revision",
+    )
+
     _registry: Dict[str, Type["AsyncJob"]] = {}
     _job_types: List[str] = []
 
@@ -1040,32 +1402,99 @@ class AsyncJob:
         self._scheduled_exec_datetime: Optional[datetime.datetime]
         self._job_specific_outputs: Optional[Dict[str, Any]]
         self._output_files: Optional[List[str]]
+        self._output_information: Optional[Dict[str, Any]] = None
+        self._output_information_view: Optional[_LazyJsonMapping] = None
+        # Incremented each time the job is updated with different values, so that values derived
+        # from the job can be cached
+        self._revision = 0
 
         self._update_job(job_obj)
 
-    def _update_job(self, job_obj: models.GsaJob) -> None:
+    def _update_job(self, job_obj: models.GsaJob) -> bool:
         """
         Update a job with the latest information from the server.
 
+        The job is only modified if at least one field differs from the values currently held.
+
         Parameters
         ----------
         job_obj : models.GsaJob
             Job object to get from the server.
-        """
-        self._id = self._get_property(job_obj, name="id", required=True)
-        self._name = self._get_property(job_obj, name="name", required=True)
-        self._description = self._get_property(job_obj, name="description")
-        self._status = self._get_property(job_obj, name="status", required=True)
-        self._type = self._get_property(job_obj, name="type", required=True)
-        self._position = self._get_property(job_obj, name="position")
-        self._submitter_name = self._get_property(job_obj, name="submitter_name", required=True)
-        self._submission_date = self._get_property(job_obj, name="submission_date", required=True)
-        self._submitter_roles = self._get_property(job_obj, name="submitter_roles", required=True)
-        self._completion_datetime = self._get_property(job_obj, name="completion_date")
-        self._execution_datetime = self._get_property(job_obj, name="execution_date")
-        self._scheduled_exec_datetime = self._get_property(job_obj, name="scheduled_execution_date")
-        self._job_specific_outputs = self._get_property(job_obj, name="job_specific_outputs")
-        self._output_files = self._get_property(job_obj, name="output_file_names")
+
+        Returns
+        -------
+        bool
+            ``True`` if any field of the job changed, ``False`` otherwise.
+        """
+        values = (
+            self._get_property(job_obj, name="id", required=True),
+            self._get_property(job_obj, name="name", required=True),
+            self._get_property(job_obj, name="description"),
+            self._get_property(job_obj, name="status", required=True),
+            sys.intern(self._get_property(job_obj, name="type", required=True)),
+            self._get_property(job_obj, name="position"),
+            sys.intern(self._get_property(job_obj, name="submitter_name", required=True)),
+            self._get_property(job_obj, name="submission_date", required=True),
+            [
+                sys.intern(role)
+                for role in self._get_property(job_obj, name="submitter_roles", required=True)
+            ],
+            self._get_property(job_obj, name="completion_date"),
+            self._get_property(job_obj, name="execution_date"),
+            self._get_property(job_obj, name="scheduled_execution_date"),
+            self._get_property(job_obj, name="job_specific_outputs"),
+            self._get_property(job_obj, name="output_file_names"),
+        )
+        if hasattr(self, "_id") and values == self._field_values():
+            return False
+        (
+            self._id,
+            self._name,
+            self._description,
+            self._status,
+            self._type,
+            self._position,
+            self._submitter_name,
+            self._submission_date,
+            self._submitter_roles,
+            self._completion_datetime,
+            self._execution_datetime,
+            self._scheduled_exec_datetime,
+            self._job_specific_outputs,
+            self._output_files,
+        ) = values
+        self._output_information = None
+        self._output_information_view = None
+        self._revision += 1
+        return True
+
+    def _field_values(self) -> Tuple[Any, ...]:
+        """
+        Get the current values of the fields populated from the server.
+
+        The order of the values matches the order in which :meth:`_update_job` reads them.
+
+        Returns
+        -------
+        tuple
+            Current values of the job fields.
+        """
+        return (
+            self._id,
+            self._name,
+            self._description,
+            self._status,
+            self._type,
+            self._position,
+            self._submitter_name,
+            self._submission_date,
+            self._submitter_roles,
+            self._completion_datetime,
+            self._execution_datetime,
+            self._scheduled_exec_datetime,
+            self._job_specific_outputs,
+            self._output_files,
+        )
 
     @staticmethod
     def _get_property(job_obj: models.GsaJob, name: str, required: bool = False) -> Any:
@@ -1344,6 +1773,10 @@ class AsyncJob:
         success of the job, and more verbose logging. The additional information supported is
         dependent on the job.
 
+        .. versionchanged:: 1.4
+           The information is parsed the first time it is accessed, and the same dictionary is
+           returned until the job is updated with different information from the server.
+
         Returns
         -------
         dict or None
@@ -1351,11 +1784,33 @@ class AsyncJob:
         """
         if self._job_specific_outputs is None:
             return None
-        parsed = {}
-        for k, v in self._job_specific_outputs.items():
-            assert isinstance(v, str)
-            parsed[k] = json.loads(v)
-        return parsed
+        if self._output_information is None:
+            # Parse the values again instead of copying them from the internal view, so that
+            # changes made to the returned dictionary do not affect properties such as the status
+            parsed = {}
+            for k, v in self._job_specific_outputs.items():
+                assert isinstance(v, str)
+                parsed[k] = json.loads(v)
+            self._output_information = parsed
+        return self._output_information
+
+    def _get_output_information_view(self) -> Optional[_LazyJsonMapping]:
+        """
+        Get a read-only view of the output information that parses each entry on first access.
+
+        Use this view internally to read a single entry, such as the summary, without parsing
+        the other entries.
+
+        Returns
+        -------
+        _LazyJsonMapping or None
+            Additional output information provided by the job.
+        """
+        if self._job_specific_outputs is None:
+            return None
+        if self._output_information_view is None:
+            self._output_information_view = _LazyJsonMapping(self._job_specific_outputs)
+        return self._output_information_view
 
     @property
     def output_file_names(self) -> Union[List[str], None]:
@@ -1408,7 +1863,12 @@ class AsyncJob:
         r"""
         Download an output file from the server by name and save it to a specified location.
 
-        Performs an HTTP request against the Granta MI Server API.
+        Performs an HTTP request against the Granta MI Server API. The file is streamed to a
+        temporary file in the destination folder, which then replaces ``file_path``.
+
+        .. versionchanged:: 1.4
+           The file is streamed directly to the destination folder, and can be saved to a
+           different file system from the system temporary folder.
 
         Parameters
         ----------
@@ -1439,23 +1899,23 @@ class AsyncJob:
             raise ValueError("Job has no output files")
         if remote_file_name not in self.output_file_names:
             raise KeyError(f"File with name {remote_file_name} does not exist for this job")
-        downloaded_file_path = self._job_queue_api.get_job_output_file(
-            id=self.id, file_name=remote_file_name
-        )
-        if not downloaded_file_path:
-            return
         if isinstance(file_path, str):
             file_path = pathlib.Path(file_path)
         if file_path.is_dir():
             remote_name = pathlib.Path(remote_file_name).name
             file_path = file_path / remote_name
-        os.rename(downloaded_file_path, file_path)
+        with self._open_output(remote_file_name) as stream:
+            stream.save(file_path)
 
     def get_file_content(self, remote_file_name: str) -> bytes:
         """
         Download an output file from the server by name and return the file contents.
 
-        Performs an HTTP request against the Granta MI Server API.
+        Performs an HTTP request against the Granta MI Server API. To process large files without
+        holding them in memory, use :meth:`open_output` instead.
+
+        .. versionchanged:: 1.4
+           The file is no longer written to a temporary file.
 
         Parameters
         ----------
@@ -1489,17 +1949,141 @@ class AsyncJob:
             raise ValueError("Job has no output files.")
         if remote_file_name not in self.output_file_names:
             raise KeyError(f"File with name {remote_file_name} does not exist for this job")
-        local_file_name = self._job_queue_api.get_job_output_file(
-            id=self.id, file_name=remote_file_name
+        with self._open_output(remote_file_name) as stream:
+            return stream.read()
+
+    def open_output(
+        self, remote_file_name: str, progress_callback: Optional[ProgressCallback] = None
+    ) -> OutputFileStream:
+        """
+        Open an output file on the server by name for streaming.
+
+        Performs an HTTP request against the Granta MI Server API. The file content is read from
+        the server as the stream is read, so large files can be processed without writing them to
+        disk or holding them in memory. Close the stream, or use it as a context manager, to
+        release the connection.
+
+        .. versionadded:: 1.4
+
+        Parameters
+        ----------
+        remote_file_name : str
+            Filename provided by the :meth:`output_file_names` method.
+        progress_callback : callable, default: None
+            Function called with a :class:`~.TransferProgress` object each time data is read from
+            the stream.
+
+        Returns
+        -------
+        OutputFileStream
+            Readable binary stream of the file content.
+
+        Raises
+        ------
+        KeyError
+            If the filename does not exist for this job.
+        ValueError
+            If the job has been deleted from the server.
+
+        Examples
+        --------
+        >>> job: AsyncJob
+        >>> with job.open_output("Export.zip") as stream:
+        ...     for chunk in stream.iter_chunks():
+        ...         digest.update(chunk)
+        >>> with job.open_output("Import.log") as stream:
+        ...     for line in io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8"):
+        ...         print(line, end="")
+        """
+        if self._is_deleted:
+            raise ValueError("Job has been deleted from the job queue.")
+        if self.output_file_names is None:
+            raise ValueError("Job has no output files.")
+        if remote_file_name not in self.output_file_names:
+            raise KeyError(f"File with name {remote_file_name} does not exist for this job")
+        return self._open_output(remote_file_name, progress_callback)
+
+    def _download_output(
+        self, remote_file_name: str, file_path: pathlib.Path
+    ) -> OutputFileDownload:
+        """
+        Download an output file, unless a file with the same size already exists locally.
+
+        If the file exists locally, its size is compared with the size reported by a ``HEAD``
+        request, so that the file content is not requested. If the server does not report the
+        size, the size of the download is compared before its content is read instead.
+
+        Parameters
+        ----------
+        remote_file_name : str
+            Name of the output file.
+        file_path : pathlib.Path
+            Path to save the file to.
+
+        Returns
+        -------
+        OutputFileDownload
+            Description of the saved file.
+        """
+        api_client = cast("JobQueueApiClient", self._job_queue_api.api_client)
+        if file_path.is_file():
+            try:
+                size = _get_output_file_size(api_client, self.id, remote_file_name)
+            except ApiException:
+                size = None
+            if size is not None and file_path.stat().st_size == size:
+                return OutputFileDownload(
+                    self.id, remote_file_name, file_path, size, downloaded=False
+                )
+        with self._open_output(remote_file_name) as stream:
+            if stream.size is not None and file_path.is_file():
+                if file_path.stat().st_size == stream.size:
+                    return OutputFileDownload(
+                        self.id, remote_file_name, file_path, stream.size, downloaded=False
+                    )
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            stream.save(file_path)
+        return OutputFileDownload(
+            self.id, remote_file_name, file_path, file_path.stat().st_size, downloaded=True
+        )
+
+    def _open_output(
+        self, remote_file_name: str, progress_callback: Optional[ProgressCallback] = None
+    ) -> OutputFileStream:
+        """
+        Open an output file on the server for streaming, without validating the filename.
+
+        Parameters
+        ----------
+        remote_file_name : str
+            Name of the output file.
+        progress_callback : callable, default: None
+            Function called with a :class:`~.TransferProgress` object each time data is read.
+
+        Returns
+        -------
+        OutputFileStream
+            Readable binary stream of the file content.
+        """
+        return _open_output_file(
+            cast("JobQueueApiClient", self._job_queue_api.api_client),
+            self.id,
+            remote_file_name,
+            progress_callback,
         )
-        assert local_file_name
-        with open(local_file_name, "rb") as f:
-            return f.read()
 
-    def update(self) -> None:
+    def update(self, other_jobs: Optional[List["AsyncJob"]] = None) -> None:
         """
         Update the job from the server.
 
+        Parameters
+        ----------
+        other_jobs : list of AsyncJob, default: None
+            Other jobs to update at the same time. If provided, all jobs are updated with
+            :meth:`~JobQueueApiClient.refresh_jobs`, which minimizes the number of HTTP requests.
+
+            .. versionadded:: 1.4
+
         Raises
         ------
         ValueError
@@ -1507,11 +2091,17 @@ class AsyncJob:
         """
         if self._is_deleted:
             raise ValueError("Job has been deleted from the job queue.")
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", UndefinedObjectWarning)
-            job_obj = self._job_queue_api.get_job(id=self.id)
+        if other_jobs:
+            client = cast("JobQueueApiClient", self._job_queue_api.api_client)
+            client.refresh_jobs([self, *other_jobs])
+            return
+        job_obj = self._job_queue_api.get_job(id=self.id)
         assert job_obj
-        self._update_job(job_obj)
+        if self._update_job(job_obj):
+            # Jobs can be updated without the client, so report the change to its job metrics and
+            # job watchers
+            client = cast("JobQueueApiClient", self._job_queue_api.api_client)
+            client._observe_job_changes([self])
 
 
 class ImportJob(AsyncJob):
@@ -1530,6 +2120,8 @@ class ImportJob(AsyncJob):
     .. versionadded:: 1.0.1
     """
 
+    __slots__ = ()
+
     _job_types = ["TextImportJob", "ExcelImportJob"]
 
     @property
@@ -1551,14 +2143,27 @@ class ImportJob(AsyncJob):
             :attr:`AsyncJob.output_information` property.
         """
         status = super().status
-        if (
-            status == JobStatus.Succeeded
-            and self.output_information is not None
-            and self.output_information["summary"]["FinishedSuccessfully"] is False
-        ):
+        if status == JobStatus.Succeeded and self._import_failed():
             return JobStatus.Failed
         return status
 
+    def _import_failed(self) -> bool:
+        """
+        Whether the job summary reports that the import did not finish successfully.
+
+        Only the summary is parsed, and it is parsed once until the job changes.
+
+        Returns
+        -------
+        bool
+            ``True`` if the summary reports that the import failed.
+        """
+        output_information = self._get_output_information_view()
+        return (
+            output_information is not None
+            and output_information["summary"]["FinishedSuccessfully"] is False
+        )
+
 
 class ExportJob(AsyncJob):
     """
@@ -1576,4 +2181,6 @@ class ExportJob(AsyncJob):
     .. versionadded:: 1.0.1
     """
 
+    __slots__ = ()
+
     _job_types = ["ExcelExportJob"]
@@ -0,0 +1,240 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for polling strategies."""
+
+from abc import ABC, abstractmethod
+import random
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from ._models import AsyncJob, JobQueueProcessingConfiguration
+
+
+class PollingStrategy(ABC):
+    """
+    Provides the abstract base class for strategies that control how often the server is polled.
+
+    Polling strategies are used by the :class:`~.JobQueueApiClient` methods that wait for jobs
+    to complete. Subclass this class and implement :meth:`next_interval` to provide a custom
+    strategy.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    timeout : float, default: None
+        Maximum number of seconds to wait for jobs to complete. If ``None``, wait indefinitely.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must be a non-negative number of seconds.")
+        self.timeout = timeout
+
+    @abstractmethod
+    def next_interval(
+        self,
+        attempt: int,
+        pending_jobs: "Sequence[AsyncJob]",
+        processing_configuration: "JobQueueProcessingConfiguration",
+    ) -> float:
+        """
+        Get the number of seconds to wait before polling the server again.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of times the server has already been polled while waiting, starting at 0.
+        pending_jobs : sequence of AsyncJob
+            Jobs that have not yet completed.
+        processing_configuration : JobQueueProcessingConfiguration
+            Job queue processing configuration on the server.
+
+        Returns
+        -------
+        float
+            Number of seconds to wait.
+        """
+
+
+class FixedPollingStrategy(PollingStrategy):
+    """
+    Polls the server at a fixed interval.
+
+    Subclass of :class:`~PollingStrategy`.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    interval : float, default: 1.0
+        Number of seconds to wait between polls.
+    timeout : float, default: None
+        Maximum number of seconds to wait for jobs to complete. If ``None``, wait indefinitely.
+    """
+
+    def __init__(self, interval: float = 1.0, timeout: Optional[float] = None) -> None:
+        super().__init__(timeout)
+        if interval < 0:
+            raise ValueError("interval must be a non-negative number of seconds.")
+        self.interval = interval
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{type(self).__name__}: interval: {self.interval}, timeout: {self.timeout}>"
+
+    def next_interval(
+        self,
+        attempt: int,
+        pending_jobs: "Sequence[AsyncJob]",
+        processing_configuration: "JobQueueProcessingConfiguration",
+    ) -> float:
+        """
+        Get the number of seconds to wait before polling the server again.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of times the server has already been polled while waiting, starting at 0.
+        pending_jobs : sequence of AsyncJob
+            Jobs that have not yet completed.
+        processing_configuration : JobQueueProcessingConfiguration
+            Job queue processing configuration on the server.
+
+        Returns
+        -------
+        float
+            Number of seconds to wait.
+        """
+        return self.interval
+
+
+class BackoffPollingStrategy(PollingStrategy):
+    """
+    Polls the server with an exponentially increasing interval.
+
+    The interval starts at ``initial_interval`` and is multiplied by ``multiplier`` after every
+    poll, up to ``maximum_interval``. A random jitter is applied so that many clients waiting at
+    the same time do not poll the server in lockstep.
+
+    The interval is never shorter than the polling interval of the job queue on the server, because
+    queued jobs cannot start more often than this. If all pending jobs are queued behind other jobs,
+    the interval is also increased according to the position of the job closest to the front of the
+    queue.
+
+    Subclass of :class:`~PollingStrategy`.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    initial_interval : float, default: 0.25
+        Number of seconds to wait before the first poll.
+    maximum_interval : float, default: 30.0
+        Maximum number of seconds to wait between polls.
+    multiplier : float, default: 2.0
+        Factor by which the interval increases after each poll.
+    jitter : float, default: 0.1
+        Maximum fraction by which the interval is randomly reduced.
+    queue_position_interval : float, default: 1.0
+        Number of seconds to add to the interval for each job ahead in the queue, divided by the
+        number of jobs the server processes concurrently.
+    use_server_polling_interval : bool, default: True
+        Whether to use the polling interval of the job queue on the server as the minimum
+        interval.
+    timeout : float, default: None
+        Maximum number of seconds to wait for jobs to complete. If ``None``, wait indefinitely.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.25,
+        maximum_interval: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.1,
+        queue_position_interval: float = 1.0,
+        use_server_polling_interval: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__(timeout)
+        if not 0 < initial_interval <= maximum_interval:
+            raise ValueError("initial_interval must be positive and at most maximum_interval.")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1.")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 and 1.")
+        self.initial_interval = initial_interval
+        self.maximum_interval = maximum_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.queue_position_interval = queue_position_interval
+        self.use_server_polling_interval = use_server_polling_interval
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return (
+            f"<{type(self).__name__}: initial_interval: {self.initial_interval}, "
+            f"maximum_interval: {self.maximum_interval}, timeout: {self.timeout}>"
+        )
+
+    def next_interval(
+        self,
+        attempt: int,
+        pending_jobs: "Sequence[AsyncJob]",
+        processing_configuration: "JobQueueProcessingConfiguration",
+    ) -> float:
+        """
+        Get the number of seconds to wait before polling the server again.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of times the server has already been polled while waiting, starting at 0.
+        pending_jobs : sequence of AsyncJob
+            Jobs that have not yet completed.
+        processing_configuration : JobQueueProcessingConfiguration
+            Job queue processing configuration on the server.
+
+        Returns
+        -------
+        float
+            Number of seconds to wait.
+        """
+        # Cap the exponent to avoid overflow when waiting for a long time.
+        backoff = self.initial_interval * self.multiplier ** min(attempt, 64)
+        interval = min(backoff, self.maximum_interval)
+        interval *= 1 - random.uniform(0, self.jitter)  # nosec B311
+
+        positions = [job.position for job in pending_jobs if job.position is not None]
+        if positions and len(positions) == len(pending_jobs):
+            jobs_ahead = min(positions) - 1
+            concurrency = max(processing_configuration.concurrency, 1)
+            queue_interval = self.queue_position_interval * jobs_ahead / concurrency
+            interval = max(interval, min(queue_interval, self.maximum_interval))
+
+        if self.use_server_polling_interval:
+            interval = max(
+                interval, processing_configuration.polling_interval_in_milliseconds / 1000
+            )
+        return interval
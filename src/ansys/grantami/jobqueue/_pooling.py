@@ -0,0 +1,337 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for the HTTP connection pool configuration."""
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfiguration:
+    """
+    Configures the pool of HTTP connections used to communicate with Granta MI.
+
+    Connections are kept open and reused by later requests, so that concurrent uploads, downloads,
+    and status requests do not have to open a new connection for each request. By default, the
+    number of connections is sized automatically to the number of worker threads used by the
+    client, and to the number of jobs the server processes concurrently.
+
+    Provide an instance of this class to :class:`~.Connection` to configure the connection pool.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    max_connections_per_host : int, default: None
+        Maximum number of connections to keep open to each host. If ``None``, the pool grows
+        automatically to match the largest number of worker threads used by the client.
+    max_hosts : int, default: 10
+        Maximum number of hosts to keep connections open to. Only more than one host is used if
+        requests are redirected.
+    block : bool, default: False
+        Whether to wait for a connection to be returned to the pool when all connections are in
+        use. If ``False``, an additional connection is opened and discarded after use.
+    keep_alive : bool, default: True
+        Whether to keep connections open after each request. If ``False``, a new connection is
+        opened for every request.
+    """
+
+    max_connections_per_host: Optional[int] = None
+    max_hosts: int = 10
+    block: bool = False
+    keep_alive: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate the configuration."""
+        if self.max_connections_per_host is not None and self.max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1.")
+        if self.max_hosts < 1:
+            raise ValueError("max_hosts must be at least 1.")
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStatistics:
+    """
+    Provides a snapshot of the usage of the HTTP connection pool of a client.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    max_connections_per_host : int
+        Maximum number of connections kept open to each host.
+    hosts : int
+        Number of hosts with a connection pool.
+    idle_connections : int
+        Number of open connections that are not currently in use.
+    connections_created : int
+        Total number of connections created since the pool was last resized. Connections are
+        returned to the pool and reused after each request, so a number larger than
+        :attr:`max_connections_per_host` indicates that the pool is too small for the number of
+        concurrent requests.
+    requests : int
+        Total number of requests sent since the pool was last resized.
+    """
+
+    max_connections_per_host: int
+    hosts: int
+    idle_connections: int
+    connections_created: int
+    requests: int
+
+
+class _PoolAdapter(HTTPAdapter):  # type: ignore[misc]
+    """
+    HTTP adapter that tracks the requests it is sending, so that it can be closed once unused.
+
+    Parameters
+    ----------
+    timeout : float, default: None
+        Default timeout in seconds for requests that do not specify one. If ``None``, requests
+        without a timeout wait indefinitely.
+    **kwargs
+        Keyword arguments passed to :class:`requests.adapters.HTTPAdapter`.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, **kwargs: Any) -> None:
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._retired = False
+        super().__init__(**kwargs)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[None, str, Tuple[str, str]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        Send a request, using the default timeout if the request does not specify one.
+
+        Parameters
+        ----------
+        request : requests.PreparedRequest
+            Request to send.
+        stream : bool, default: False
+            Whether to stream the response content.
+        timeout : float or tuple, default: None
+            Timeout of the request in seconds, or a tuple of the connect and read timeouts.
+        verify : bool or str, default: True
+            Whether to verify the TLS certificate of the server, or the path to a CA bundle.
+        cert : str or tuple, default: None
+            Client certificate to send with the request.
+        proxies : dict, default: None
+            Proxies to use for the request.
+
+        Returns
+        -------
+        requests.Response
+            Response from the server.
+        """
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return super().send(  # type: ignore[no-any-return]
+                request,
+                stream,
+                self.timeout if timeout is None else timeout,
+                verify,
+                cert,
+                proxies,
+            )
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                close = self._retired and not self._in_flight
+            if close:
+                self.close()
+
+    def _retire(self) -> None:
+        """
+        Close the adapter once it is no longer sending requests.
+
+        Streamed responses that are still being read are not interrupted. Their connections are
+        closed instead of being returned to the pool.
+        """
+        with self._lock:
+            self._retired = True
+            close = not self._in_flight
+        if close:
+            self.close()
+
+
+def _get_adapters(session: requests.Session) -> List[HTTPAdapter]:
+    """
+    Get the distinct HTTP adapters mounted on a session.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session to get the adapters of.
+
+    Returns
+    -------
+    list of HTTPAdapter
+        Adapters mounted on the session, without duplicates.
+    """
+    adapters: List[HTTPAdapter] = []
+    for adapter in session.adapters.values():
+        if isinstance(adapter, HTTPAdapter) and not any(adapter is a for a in adapters):
+            adapters.append(adapter)
+    return adapters
+
+
+def _replace_adapters(
+    session: requests.Session, configuration: ConnectionPoolConfiguration, maxsize: int
+) -> List[HTTPAdapter]:
+    """
+    Mount new HTTP adapters on a session in place of the adapters that are currently mounted.
+
+    The new adapters keep the timeout and retry settings of the adapters they replace.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session to configure.
+    configuration : ConnectionPoolConfiguration
+        Connection pool configuration.
+    maxsize : int
+        Maximum number of connections to keep open to each host.
+
+    Returns
+    -------
+    list of HTTPAdapter
+        Adapters that were replaced.
+    """
+    adapters = _get_adapters(session)
+    for adapter in adapters:
+        replacement = _PoolAdapter(
+            timeout=getattr(adapter, "timeout", None),
+            pool_connections=configuration.max_hosts,
+            pool_maxsize=maxsize,
+            pool_block=configuration.block,
+            max_retries=adapter.max_retries,
+        )
+        # Only replace the adapters of existing prefixes, so that the adapters are not reordered
+        # while other threads look them up
+        for prefix, mounted in list(session.adapters.items()):
+            if mounted is adapter:
+                session.adapters[prefix] = replacement
+    return adapters
+
+
+def _configure_connection_pool(
+    session: requests.Session, configuration: ConnectionPoolConfiguration, maxsize: int
+) -> None:
+    """
+    Configure the connection pools of all HTTP adapters mounted on a session.
+
+    The adapters are replaced, and the previous adapters are closed immediately. This function
+    must only be called before the session is used by other threads. Use
+    :func:`_resize_connection_pool` afterwards.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session to configure.
+    configuration : ConnectionPoolConfiguration
+        Connection pool configuration.
+    maxsize : int
+        Maximum number of connections to keep open to each host.
+    """
+    for adapter in _replace_adapters(session, configuration, maxsize):
+        adapter.close()
+    session.headers["Connection"] = "keep-alive" if configuration.keep_alive else "close"
+
+
+def _resize_connection_pool(
+    session: requests.Session, configuration: ConnectionPoolConfiguration, maxsize: int
+) -> None:
+    """
+    Replace the HTTP adapters mounted on a session with adapters that have larger connection pools.
+
+    Requests in progress on other threads keep using the previous adapters, which are closed once
+    they are no longer sending requests.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session to configure.
+    configuration : ConnectionPoolConfiguration
+        Connection pool configuration.
+    maxsize : int
+        Maximum number of connections to keep open to each host.
+    """
+    for adapter in _replace_adapters(session, configuration, maxsize):
+        if isinstance(adapter, _PoolAdapter):
+            adapter._retire()
+        else:
+            adapter.close()
+
+
+def _get_connection_pool_statistics(
+    session: requests.Session, max_connections_per_host: int
+) -> ConnectionPoolStatistics:
+    """
+    Get the usage of the connection pools of all HTTP adapters mounted on a session.
+
+    Parameters
+    ----------
+    session : requests.Session
+        Session to get the statistics of.
+    max_connections_per_host : int
+        Configured maximum number of connections to keep open to each host.
+
+    Returns
+    -------
+    ConnectionPoolStatistics
+        Snapshot of the connection pool usage.
+    """
+    adapters = _get_adapters(session)
+    hosts = idle_connections = connections_created = request_count = 0
+    for adapter in adapters:
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            hosts += 1
+            connections_created += pool.num_connections
+            request_count += pool.num_requests
+            if pool.pool is not None:
+                idle_connections += sum(1 for c in list(pool.pool.queue) if c is not None)
+    return ConnectionPoolStatistics(
+        max_connections_per_host=max_connections_per_host,
+        hosts=hosts,
+        idle_connections=idle_connections,
+        connections_created=connections_created,
+        requests=request_count,
+    )
@@ -0,0 +1,447 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for the retry and circuit breaker policy."""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from ansys.openapi.common import ApiException
+import requests  # type: ignore[import-untyped]
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from ._logger import logger
+
+_T = TypeVar("_T")
+
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PATCH"}
+
+# POST endpoints that can safely be sent again. Uploading a file again only leaves an unused copy
+# on the server, and moving a job to the top of the queue twice has the same effect as once.
+_IDEMPOTENT_POST_PATHS = {
+    "/v1alpha/job-queue/files",
+    "/v1alpha/job-queue/jobs/{id}:move-to-top",
+}
+
+# Status codes returned when the server is temporarily unable to handle a request
+_TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Status codes returned when the server, or a proxy in front of it, is unavailable. Only these
+# responses count toward opening the circuit breaker. Other errors, such as a 500 response from a
+# single endpoint, show that the server is reachable.
+_UNAVAILABLE_STATUS_CODES = {502, 503, 504}
+
+# Status codes returned when the server did not process the request, so that any request can be
+# sent again
+_REJECTED_STATUS_CODES = {429, 503}
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised when a request is not sent because the Granta MI Server API is unavailable.
+
+    The circuit breaker of a :class:`~.RetryPolicy` opens after several consecutive requests fail
+    because the server is unavailable. While it is open, requests fail immediately with this
+    exception instead of being sent to the server.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    retry_after : float
+        Number of seconds until a request is sent to the server again.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(
+            "The Granta MI Server API is unavailable after repeated failures. Requests are not "
+            f"sent to the server for another {retry_after:.1f} seconds."
+        )
+
+
+def _is_idempotent(method: str, resource_path: str) -> bool:
+    """
+    Determine whether a request can be sent again after the server may have processed it.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method of the request.
+    resource_path : str
+        Path of the endpoint, relative to the Server API URL, with unresolved path parameters.
+
+    Returns
+    -------
+    bool
+        ``True`` if sending the request more than once has the same effect as sending it once.
+    """
+    method = method.upper()
+    return method in _IDEMPOTENT_METHODS or (
+        method == "POST" and resource_path in _IDEMPOTENT_POST_PATHS
+    )
+
+
+def _is_connection_refused(exception: Exception) -> bool:
+    """
+    Determine whether a request failed before a connection to the server was established.
+
+    Parameters
+    ----------
+    exception : Exception
+        Exception raised by the request.
+
+    Returns
+    -------
+    bool
+        ``True`` if the request was never sent to the server.
+    """
+    if isinstance(exception, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(exception, requests.exceptions.ConnectionError) and exception.args:
+        reason = exception.args[0]
+        if isinstance(reason, MaxRetryError):
+            reason = reason.reason
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _get_retry_after(exception: ApiException) -> Optional[float]:
+    """
+    Get the delay requested by the server in the ``Retry-After`` header of an error response.
+
+    Parameters
+    ----------
+    exception : ApiException
+        Exception raised for the error response.
+
+    Returns
+    -------
+    float or None
+        Number of seconds to wait, or ``None`` if the header is missing or invalid.
+    """
+    value = exception.headers.get("Retry-After") if exception.headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_date.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retries failed requests to the Granta MI Server API, and stops sending requests while it is down.
+
+    Requests that fail with a transient error, such as a ``502 Bad Gateway`` or
+    ``503 Service Unavailable`` response or a connection error, are sent again after an
+    exponentially increasing delay with random jitter. If the server provides a ``Retry-After``
+    header, the delay is at least the requested value.
+
+    Requests that are not idempotent, such as the request that creates a job, are only sent again
+    if the server cannot have processed them. This is the case if the connection could not be
+    established, or if the server responded with ``429 Too Many Requests`` or
+    ``503 Service Unavailable``.
+
+    After ``failure_threshold`` consecutive requests fail because the server is unavailable, the
+    circuit breaker opens and all requests fail immediately with a :class:`~.CircuitOpenError` for
+    ``reset_timeout`` seconds. A single request is then sent to test the server. If it succeeds,
+    the circuit breaker closes. Otherwise, it opens again.
+
+    Requests count as failures if the connection fails or times out, or if the server responds
+    with ``502 Bad Gateway``, ``503 Service Unavailable``, or ``504 Gateway Timeout``. Other
+    responses, including ``500 Internal Server Error``, show that the server is reachable. They
+    may still be retried, but they do not open the circuit breaker.
+
+    One policy is shared by all requests sent by a :class:`~.JobQueueApiClient`, including requests
+    sent from worker threads. Assign an instance of this class to :attr:`.JobQueueApiClient.retry_policy`
+    to change the default settings.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    max_attempts : int, default: 4
+        Maximum number of times to send each request, including the first attempt.
+    initial_delay : float, default: 0.5
+        Maximum delay in seconds before the first retry. The maximum delay is doubled for each
+        later retry. The actual delay is chosen at random between zero and the maximum delay.
+    max_delay : float, default: 30.0
+        Upper limit of the delay in seconds between two attempts.
+    max_retry_after : float, default: 120.0
+        Longest ``Retry-After`` delay in seconds to honor. If the server requests a longer delay,
+        the request is not retried.
+    failure_threshold : int, default: 5
+        Number of consecutive failures because the server is unavailable that open the circuit
+        breaker.
+    reset_timeout : float, default: 30.0
+        Number of seconds for which the circuit breaker stays open.
+
+    Notes
+    -----
+    The session created by :class:`~.Connection` also retries idempotent requests that fail
+    with some status codes, as configured by
+    :attr:`ansys.openapi.common.SessionConfiguration.retry_count`. Requests that have exhausted
+    those retries are not retried again, but count as failures for the circuit breaker.
+
+    Examples
+    --------
+    >>> client.retry_policy = RetryPolicy(max_attempts=6, failure_threshold=10)
+    >>> client.retry_policy = None  # Disable retries
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_retry_after: float = 120.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if initial_delay < 0 or max_delay < 0 or max_retry_after < 0:
+            raise ValueError("Delays must be non-negative numbers of seconds.")
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout must be a positive number of seconds.")
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return (
+            f"<{type(self).__name__}: max_attempts: {self.max_attempts}, "
+            f"failure_threshold: {self.failure_threshold}>"
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Whether the circuit breaker is open, so that requests fail without being sent.
+
+        Returns
+        -------
+        bool
+            ``True`` if requests currently fail immediately, ``False`` otherwise.
+        """
+        with self._lock:
+            return self._opened_at is not None and self._get_remaining_open_time() > 0
+
+    def reset(self) -> None:
+        """Close the circuit breaker and clear the count of consecutive failures."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def _get_remaining_open_time(self) -> float:
+        """
+        Get the number of seconds until the circuit breaker allows a trial request.
+
+        Must be called with the lock held, and only while the circuit breaker is open.
+
+        Returns
+        -------
+        float
+            Number of seconds remaining, or zero or less if a trial request can be sent.
+        """
+        assert self._opened_at is not None
+        return self._opened_at + self.reset_timeout - time.monotonic()
+
+    def _before_request(self) -> None:
+        """
+        Check whether a request can be sent.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit breaker is open, or a trial request is already in progress.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._get_remaining_open_time()
+            if remaining > 0 or self._trial_in_progress:
+                raise CircuitOpenError(max(remaining, 0.0))
+            self._trial_in_progress = True
+
+    def _record_success(self) -> None:
+        """Record a request that reached the server."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.debug("Server API request succeeded, closing the circuit breaker")
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def _record_failure(self) -> None:
+        """Record a request that failed because the server is unavailable."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._trial_in_progress = False
+            if self._opened_at is not None or self._consecutive_failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.debug(
+                        f"{self._consecutive_failures} consecutive Server API requests failed, "
+                        f"opening the circuit breaker for {self.reset_timeout} seconds"
+                    )
+                self._opened_at = time.monotonic()
+
+    def _release_trial(self) -> None:
+        """Allow another trial request after a request failed for an unrelated reason."""
+        with self._lock:
+            self._trial_in_progress = False
+
+    def _get_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """
+        Get the delay before the next attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of attempts made so far.
+        retry_after : float or None
+            Delay requested by the server.
+
+        Returns
+        -------
+        float
+            Number of seconds to wait.
+        """
+        backoff = min(self.max_delay, self.initial_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, backoff)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _call(self, method: str, resource_path: str, func: Callable[[], _T]) -> _T:
+        """
+        Send a request, and send it again if it fails with a transient error.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method of the request.
+        resource_path : str
+            Path of the endpoint, relative to the Server API URL, with unresolved path parameters.
+        func : callable
+            Function that sends the request and returns the result.
+
+        Returns
+        -------
+        Any
+            Value returned by ``func``.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit breaker is open.
+        """
+        idempotent = _is_idempotent(method, resource_path)
+        attempt = 0
+        while True:
+            self._before_request()
+            attempt += 1
+            try:
+                result = func()
+            except ApiException as e:
+                if e.status_code in _UNAVAILABLE_STATUS_CODES:
+                    self._record_failure()
+                else:
+                    self._record_success()
+                if e.status_code not in _TRANSIENT_STATUS_CODES:
+                    raise
+                retry_after = _get_retry_after(e)
+                can_retry = idempotent or e.status_code in _REJECTED_STATUS_CODES
+                if retry_after is not None and retry_after > self.max_retry_after:
+                    can_retry = False
+                exception: Exception = e
+            except requests.exceptions.RetryError:
+                self._record_failure()
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self._record_failure()
+                retry_after = None
+                can_retry = idempotent or _is_connection_refused(e)
+                exception = e
+            except BaseException:
+                # Errors such as an invalid response do not show whether the server is available
+                self._release_trial()
+                raise
+            else:
+                self._record_success()
+                return result
+            if not can_retry or attempt >= self.max_attempts:
+                raise exception
+            delay = self._get_delay(attempt, retry_after)
+            logger.debug(
+                f"{method} {resource_path} failed with {exception!r}, retrying in {delay:.2f} "
+                f"seconds (attempt {attempt + 1} of {self.max_attempts})"
+            )
+            time.sleep(delay)
+
+
+def _call_with_retry(
+    api_client: Any, method: str, resource_path: str, func: Callable[[], _T]
+) -> _T:
+    """
+    Send a request with the retry policy of a client, if it has one.
+
+    Parameters
+    ----------
+    api_client : Any
+        Client that sends the request.
+    method : str
+        HTTP method of the request.
+    resource_path : str
+        Path of the endpoint, relative to the Server API URL, with unresolved path parameters.
+    func : callable
+        Function that sends the request and returns the result.
+
+    Returns
+    -------
+    Any
+        Value returned by ``func``.
+    """
+    policy = getattr(api_client, "_retry_policy", None)
+    if isinstance(policy, RetryPolicy):
+        return policy._call(method, resource_path, func)
+    return func()
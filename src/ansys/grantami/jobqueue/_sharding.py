@@ -0,0 +1,474 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for splitting large jobs into several smaller jobs."""
+
+import io
+import math
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import IO, Any, Dict, List, Optional, Set, Union, cast
+import zipfile
+
+from ._models import (
+    AsyncJob,
+    ExcelExportJobRequest,
+    JobFile,
+    JobRequest,
+    TextImportJobRequest,
+    _FileType,
+    _JobFile,
+)
+from ._streaming import DEFAULT_CHUNK_SIZE
+
+# Output files that describe the job rather than containing exported data
+_LOG_FILE_SUFFIXES = {".log", ".json"}
+
+_BinaryStream = Union[IO[bytes], io.RawIOBase, io.BufferedIOBase]
+
+
+def _get_template_file(job_request: JobRequest) -> _JobFile:
+    """
+    Get the template file of a job request.
+
+    Parameters
+    ----------
+    job_request : JobRequest
+        Job request to get the template file of.
+
+    Returns
+    -------
+    _JobFile
+        Template file of the job request.
+
+    Raises
+    ------
+    ValueError
+        If the job request does not contain exactly one template file.
+    """
+    templates = [file for file in job_request._files if file.file_type == _FileType.Template]
+    if len(templates) != 1:
+        raise ValueError(
+            f"The job request must contain exactly one template file, not {len(templates)}."
+        )
+    return templates[0]
+
+
+def _split_export_request(
+    job_request: ExcelExportJobRequest, shard_count: int
+) -> List[ExcelExportJobRequest]:
+    """
+    Split an export job request into requests that each export a subset of the records.
+
+    The records are divided into contiguous groups whose sizes differ by at most one.
+
+    Parameters
+    ----------
+    job_request : ExcelExportJobRequest
+        Job request to split.
+    shard_count : int
+        Number of job requests to create. Limited to the number of records in the request.
+
+    Returns
+    -------
+    list of ExcelExportJobRequest
+        Job requests that together export all records in ``job_request``.
+
+    Raises
+    ------
+    ValueError
+        If the job request does not contain exactly one template file.
+    """
+    records = job_request._records
+    shard_count = max(1, min(shard_count, len(records)))
+    base_size, remainder = divmod(len(records), shard_count)
+    template_file = _get_template_file(job_request).path
+    shards = []
+    start = 0
+    for index in range(shard_count):
+        end = start + base_size + (1 if index < remainder else 0)
+        shards.append(
+            ExcelExportJobRequest(
+                name=f"{job_request.name} (part {index + 1} of {shard_count})",
+                description=job_request.description,
+                template_file=template_file,
+                database_key=job_request._database_key,
+                records=records[start:end],
+                scheduled_execution_date=job_request.scheduled_execution_date,
+            )
+        )
+        start = end
+    return shards
+
+
+def _get_export_data_files(job: AsyncJob) -> List[str]:
+    """
+    Get the names of the output files of an export job that contain exported data.
+
+    Parameters
+    ----------
+    job : AsyncJob
+        Completed export job.
+
+    Returns
+    -------
+    list of str
+        Names of the output files, excluding log and summary files.
+    """
+    return [
+        file_name
+        for file_name in job.output_file_names or []
+        if pathlib.PurePath(file_name).suffix.lower() not in _LOG_FILE_SUFFIXES
+    ]
+
+
+def _get_unique_name(name: str, existing_names: Set[str], shard_number: int) -> str:
+    """
+    Get a name for an archive entry that does not clash with entries from other shards.
+
+    Parameters
+    ----------
+    name : str
+        Name of the entry in the shard output.
+    existing_names : set of str
+        Names already used in the merged archive. The returned name is added to the set.
+    shard_number : int
+        Number of the shard that produced the entry, starting from 1.
+
+    Returns
+    -------
+    str
+        ``name``, or ``name`` with the shard number appended to the file stem if ``name`` is
+        already used.
+    """
+    unique_name = name
+    if unique_name in existing_names:
+        path = pathlib.PurePosixPath(name)
+        unique_name = str(path.with_name(f"{path.stem} (part {shard_number}){path.suffix}"))
+        suffix = 2
+        while unique_name in existing_names:
+            unique_name = str(
+                path.with_name(f"{path.stem} (part {shard_number}, {suffix}){path.suffix}")
+            )
+            suffix += 1
+    existing_names.add(unique_name)
+    return unique_name
+
+
+def _write_entry(
+    archive: zipfile.ZipFile, name: str, source: _BinaryStream, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """
+    Copy a stream into a new archive entry in fixed-size chunks.
+
+    Parameters
+    ----------
+    archive : zipfile.ZipFile
+        Archive open for writing.
+    name : str
+        Name of the new entry.
+    source : BinaryIO
+        Stream to copy.
+    chunk_size : int, default: 1048576
+        Number of bytes to copy at a time.
+    """
+    with archive.open(name, "w", force_zip64=True) as destination:
+        shutil.copyfileobj(source, destination, chunk_size)
+
+
+def _merge_export_outputs(
+    jobs: List[AsyncJob], output_path: pathlib.Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """
+    Merge the exported data of several export jobs into a single ZIP archive.
+
+    Output files are streamed from the server, so memory usage does not depend on their size.
+    Output files that are themselves ZIP archives are unpacked into the merged archive, which
+    requires them to be written to a temporary file first. Entries with the same name in more than
+    one output are renamed with the number of the job they came from.
+
+    The archive is written to a temporary file in the same folder as ``output_path``, which then
+    replaces ``output_path``. The temporary files are removed if merging fails.
+
+    Parameters
+    ----------
+    jobs : list of AsyncJob
+        Completed export jobs, in the order their records should appear.
+    output_path : pathlib.Path
+        Path to save the merged archive to.
+    chunk_size : int, default: 1048576
+        Number of bytes to copy at a time.
+    """
+    folder = output_path.parent
+    names: Set[str] = set()
+    with tempfile.NamedTemporaryFile(
+        dir=folder, prefix=f".{output_path.name}.", suffix=".part", delete=False
+    ) as f:
+        try:
+            with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for shard_number, job in enumerate(jobs, start=1):
+                    for file_name in _get_export_data_files(job):
+                        with job._open_output(file_name) as stream:
+                            if file_name.lower().endswith(".zip"):
+                                _copy_archive_entries(
+                                    stream, archive, names, shard_number, folder, chunk_size
+                                )
+                            else:
+                                name = _get_unique_name(file_name, names, shard_number)
+                                _write_entry(archive, name, stream, chunk_size)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, output_path)
+
+
+def _copy_archive_entries(
+    source: _BinaryStream,
+    archive: zipfile.ZipFile,
+    names: Set[str],
+    shard_number: int,
+    folder: pathlib.Path,
+    chunk_size: int,
+) -> None:
+    """
+    Copy every file in a ZIP archive stream into another archive.
+
+    Parameters
+    ----------
+    source : BinaryIO
+        Stream of the ZIP archive to copy from.
+    archive : zipfile.ZipFile
+        Archive open for writing.
+    names : set of str
+        Names already used in ``archive``.
+    shard_number : int
+        Number of the shard that produced ``source``, starting from 1.
+    folder : pathlib.Path
+        Folder in which to create the temporary copy of ``source``.
+    chunk_size : int
+        Number of bytes to copy at a time.
+    """
+    # Reading a ZIP archive requires random access, which the HTTP response does not provide
+    with tempfile.TemporaryFile(dir=folder) as spooled:
+        shutil.copyfileobj(source, spooled, chunk_size)
+        spooled.seek(0)
+        with zipfile.ZipFile(spooled) as shard_archive:
+            for info in shard_archive.infolist():
+                if info.is_dir():
+                    continue
+                with shard_archive.open(info) as entry:
+                    name = _get_unique_name(info.filename, names, shard_number)
+                    _write_entry(archive, name, entry, chunk_size)
+
+
+def _split_text_file(
+    path: pathlib.Path,
+    part_count: int,
+    header_lines: int,
+    folder: pathlib.Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[pathlib.Path]:
+    """
+    Split a text file into parts of similar size, without splitting any line.
+
+    The file is copied in fixed-size chunks, so memory usage does not depend on the size of the
+    file. The header lines are copied to the start of every part.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path to the text file.
+    part_count : int
+        Maximum number of parts to create. Fewer parts are created if the file does not contain
+        enough lines.
+    header_lines : int
+        Number of lines at the start of the file to copy to every part.
+    folder : pathlib.Path
+        Folder in which to create the parts.
+    chunk_size : int, default: 1048576
+        Number of bytes to copy at a time.
+
+    Returns
+    -------
+    list of pathlib.Path
+        Paths of the parts, in order.
+    """
+    file_size = path.stat().st_size
+    parts: List[pathlib.Path] = []
+    with open(path, "rb") as source:
+        header = b"".join(source.readline() for _ in range(header_lines))
+        part_size = max(1, math.ceil((file_size - len(header)) / part_count))
+        while not parts or source.tell() < file_size:
+            part_path = folder / f"{path.stem}.part{len(parts) + 1}{path.suffix}"
+            with open(part_path, "wb") as destination:
+                destination.write(header)
+                remaining = part_size
+                last_chunk = b""
+                while remaining > 0:
+                    chunk = source.read(min(chunk_size, remaining))
+                    if not chunk:
+                        break
+                    destination.write(chunk)
+                    remaining -= len(chunk)
+                    last_chunk = chunk
+                # Finish the current line, so that no record is split between two parts
+                if last_chunk and not last_chunk.endswith(b"\n"):
+                    destination.write(source.readline())
+            parts.append(part_path)
+    return parts
+
+
+def _get_job_file_argument(file: _JobFile) -> Union[pathlib.Path, JobFile]:
+    """
+    Get the argument that adds a file with the same local and virtual paths to a new job request.
+
+    Parameters
+    ----------
+    file : _JobFile
+        File in an existing job request.
+
+    Returns
+    -------
+    pathlib.Path or JobFile
+        Local path of the file, or a ``JobFile`` object if the file has a virtual path.
+    """
+    if file.virtual_path is None:
+        return file.path
+    return JobFile(file.path, file.virtual_path)
+
+
+def _split_text_import_request(
+    job_request: TextImportJobRequest, part_count: int, header_lines: int, folder: pathlib.Path
+) -> List[TextImportJobRequest]:
+    """
+    Split a text import job request into requests that each import part of the data file.
+
+    Each request uses the same template and attachment files as ``job_request``. The data file
+    parts keep the virtual path, or the name, of the original data file.
+
+    Parameters
+    ----------
+    job_request : TextImportJobRequest
+        Job request to split. Must contain exactly one data file.
+    part_count : int
+        Maximum number of job requests to create.
+    header_lines : int
+        Number of lines at the start of the data file to copy to every part.
+    folder : pathlib.Path
+        Folder in which to create the data file parts.
+
+    Returns
+    -------
+    list of TextImportJobRequest
+        Job requests that together import all records in ``job_request``.
+
+    Raises
+    ------
+    ValueError
+        If the job request does not contain exactly one data file.
+    """
+    data_files = [file for file in job_request._files if file.file_type == _FileType.Data]
+    if len(data_files) != 1:
+        raise ValueError("Only text import job requests with a single data file can be split.")
+    data_file = data_files[0]
+    template_file = next(
+        file for file in job_request._files if file.file_type == _FileType.Template
+    )
+    attachment_files: List[Union[str, pathlib.Path, JobFile]] = [
+        _get_job_file_argument(file)
+        for file in job_request._files
+        if file.file_type == _FileType.Attachment
+    ]
+    parts = _split_text_file(data_file.path, part_count, header_lines, folder)
+    virtual_path = data_file.virtual_path or pathlib.Path(data_file.path.name)
+    return [
+        TextImportJobRequest(
+            name=f"{job_request.name} (part {index} of {len(parts)})",
+            description=job_request.description,
+            template_file=_get_job_file_argument(template_file),
+            data_files=[JobFile(part, virtual_path)],
+            attachment_files=attachment_files or None,
+            scheduled_execution_date=job_request.scheduled_execution_date,
+        )
+        for index, part in enumerate(parts, start=1)
+    ]
+
+
+def _merge_summaries(summaries: List[Any]) -> Any:
+    """
+    Merge the values of the same summary field from several jobs.
+
+    Booleans are combined with ``all``, numbers are added, lists are concatenated, and dictionaries
+    are merged key by key. Any other values are returned unchanged if they are identical, or as a
+    list otherwise. ``None`` values are ignored.
+
+    Parameters
+    ----------
+    summaries : list
+        Value of the field from each job.
+
+    Returns
+    -------
+    Any
+        Merged value.
+    """
+    values = [value for value in summaries if value is not None]
+    if not values:
+        return None
+    if all(isinstance(value, bool) for value in values):
+        return all(values)
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        return sum(values)
+    if all(isinstance(value, list) for value in values):
+        return [item for value in values for item in value]
+    if all(isinstance(value, dict) for value in values):
+        keys = dict.fromkeys(key for value in values for key in value)
+        return {key: _merge_summaries([value.get(key) for value in values]) for key in keys}
+    if all(value == values[0] for value in values):
+        return values[0]
+    return values
+
+
+def _merge_job_summaries(jobs: List[AsyncJob]) -> Optional[Dict[str, Any]]:
+    """
+    Merge the ``summary`` output information of several jobs.
+
+    Parameters
+    ----------
+    jobs : list of AsyncJob
+        Jobs to merge the summaries of. Jobs without a summary are ignored.
+
+    Returns
+    -------
+    dict or None
+        Merged summary, or ``None`` if none of the jobs has a summary.
+    """
+    summaries = [
+        job.output_information["summary"]
+        for job in jobs
+        if job.output_information is not None and "summary" in job.output_information
+    ]
+    return cast(Optional[Dict[str, Any]], _merge_summaries(summaries))
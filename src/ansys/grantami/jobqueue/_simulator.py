@@ -0,0 +1,914 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Module for an in-process simulated Job Queue server.
+
+The simulator is used by the tests and benchmarks of this package. It is not part of the public
+API and may change without notice.
+"""
+
+from dataclasses import dataclass, field
+import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+import re
+import threading
+import time
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+from urllib.parse import parse_qs, unquote, urlsplit
+import uuid
+
+if TYPE_CHECKING:
+    from ._connection import JobQueueApiClient
+
+SERVICE_LAYER_PATH = "/mi_servicelayer"
+_PROXY_PATH = "/proxy/v1.svc/mi"
+_AUTH_PATH = "/Health/v2.svc"
+
+_PENDING = "Pending"
+_RUNNING = "Running"
+_SUCCEEDED = "Succeeded"
+_FAILED = "Failed"
+_CANCELLED = "Cancelled"
+
+_JobDuration = Union[float, Callable[["SimulatedJob"], float]]
+_Latency = Union[float, Callable[[str], float]]
+
+
+@dataclass(eq=False)
+class SimulatedJob:
+    """
+    Describes a job held by a :class:`SimulatedJobQueueServer`.
+
+    Objects of this type are passed to the ``job_duration`` and ``job_outcome`` functions of the
+    server, and returned by :meth:`SimulatedJobQueueServer.get_job`. They should not be modified.
+
+    Parameters
+    ----------
+    id : str
+        Job ID.
+    name : str
+        Job name.
+    type : str
+        Job type, for example ``ExcelImportJob``.
+    description : str or None
+        Job description.
+    parameters : dict
+        Job parameters submitted with the job.
+    input_file_ids : list of str
+        IDs of the files submitted with the job.
+    submitter_name : str
+        Name of the user who submitted the job.
+    submission_time : float
+        Time at which the job was submitted, in seconds since the epoch.
+    scheduled_time : float or None
+        Time before which the job cannot start, in seconds since the epoch.
+    status : str
+        Job status: ``Pending``, ``Running``, ``Succeeded``, ``Failed``, or ``Cancelled``.
+    execution_time : float or None
+        Time at which the job started, in seconds since the epoch.
+    completion_time : float or None
+        Time at which the job completed, in seconds since the epoch.
+    """
+
+    id: str
+    name: str
+    type: str
+    description: Optional[str]
+    parameters: Dict[str, Any]
+    input_file_ids: List[str]
+    submitter_name: str
+    submission_time: float
+    scheduled_time: Optional[float] = None
+    status: str = _PENDING
+    execution_time: Optional[float] = None
+    completion_time: Optional[float] = None
+    _end_time: float = field(default=0.0, repr=False)
+    _succeeds: bool = field(default=True, repr=False)
+    _json: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    def _to_json(self, position: Optional[int], roles: List[str]) -> Dict[str, Any]:
+        """
+        Serialize the job as returned by the Job Queue API.
+
+        Parameters
+        ----------
+        position : int or None
+            Position of the job in the queue, or ``None`` if the job is not pending.
+        roles : list of str
+            Roles of the submitter.
+
+        Returns
+        -------
+        dict
+            JSON representation of the job.
+        """
+        if self._json is None:
+            # Formatting dates dominates the cost of listing jobs, so reuse unchanged jobs
+            self._json = self._build_json(roles)
+        return {**self._json, "position": position}
+
+    def _build_json(self, roles: List[str]) -> Dict[str, Any]:
+        """
+        Serialize the fields of the job that do not depend on the rest of the queue.
+
+        Parameters
+        ----------
+        roles : list of str
+            Roles of the submitter.
+
+        Returns
+        -------
+        dict
+            JSON representation of the job, without its position.
+        """
+        completed = self.status in (_SUCCEEDED, _FAILED)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "type": self.type,
+            "status": self.status,
+            "submitterName": self.submitter_name,
+            "submitterRoles": roles,
+            "submissionDate": _format_time(self.submission_time),
+            "scheduledExecutionDate": _format_time(self.scheduled_time),
+            "executionDate": _format_time(self.execution_time),
+            "completionDate": _format_time(self.completion_time),
+            "inputFileIds": self.input_file_ids,
+            "jobSpecificOutputs": self._get_outputs() if completed else None,
+            "outputFileNames": self._get_output_file_names() if completed else None,
+        }
+
+    def _get_outputs(self) -> Dict[str, str]:
+        """Get the job-specific outputs of a completed job."""
+        summary = {"FinishedSuccessfully": self.status == _SUCCEEDED}
+        return {"summary": json.dumps(summary)}
+
+    def _get_output_file_names(self) -> List[str]:
+        """Get the names of the output files of a completed job."""
+        names = [f"{self.name}.log"]
+        if self.type == "ExcelExportJob" and self.status == _SUCCEEDED:
+            names.append(f"{self.name}.xlsx")
+        return names
+
+
+def _format_time(value: Optional[float]) -> Optional[str]:
+    """
+    Format a time as an ISO 8601 date.
+
+    Parameters
+    ----------
+    value : float or None
+        Time in seconds since the epoch.
+
+    Returns
+    -------
+    str or None
+        ISO 8601 date in UTC, or ``None`` if ``value`` is ``None``.
+    """
+    if value is None:
+        return None
+    return datetime.datetime.fromtimestamp(value, datetime.timezone.utc).isoformat()
+
+
+def _parse_time(value: Optional[str]) -> Optional[float]:
+    """
+    Parse an ISO 8601 date.
+
+    Parameters
+    ----------
+    value : str or None
+        ISO 8601 date.
+
+    Returns
+    -------
+    float or None
+        Time in seconds since the epoch, or ``None`` if ``value`` is ``None``.
+    """
+    if value is None:
+        return None
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+@dataclass
+class _Response:
+    """HTTP response produced by a simulated endpoint."""
+
+    status_code: int
+    body: Any = None
+    content_type: str = "application/json"
+
+
+_NOT_FOUND = _Response(404, {"message": "Job not found."})
+
+_Route = Tuple[str, Pattern[str], str, str]
+
+_ID = r"(?P<id>[^/:]+)"
+_ROUTES: List[_Route] = [
+    (method, re.compile(pattern + r"\Z"), template, handler)
+    for method, pattern, template, handler in [
+        ("GET", "/swagger/v1/swagger.json", "/swagger/v1/swagger.json", "_get_api_definition"),
+        ("GET", "/v1alpha/schema/mi-version", "/v1alpha/schema/mi-version", "_get_version"),
+        ("GET", "/v1alpha/job-queue/current-user", "/v1alpha/job-queue/current-user", "_get_user"),
+        (
+            "GET",
+            "/v1alpha/job-queue/processing-configuration",
+            "/v1alpha/job-queue/processing-configuration",
+            "_get_processing_config",
+        ),
+        ("POST", "/v1alpha/job-queue/files", "/v1alpha/job-queue/files", "_upload_file"),
+        ("GET", "/v1alpha/job-queue/jobs", "/v1alpha/job-queue/jobs", "_get_jobs"),
+        ("POST", "/v1alpha/job-queue/jobs", "/v1alpha/job-queue/jobs", "_create_job"),
+        ("DELETE", "/v1alpha/job-queue/jobs", "/v1alpha/job-queue/jobs", "_delete_jobs"),
+        ("GET", f"/v1alpha/job-queue/jobs/{_ID}", "/v1alpha/job-queue/jobs/{id}", "_get_job"),
+        ("PATCH", f"/v1alpha/job-queue/jobs/{_ID}", "/v1alpha/job-queue/jobs/{id}", "_update_job"),
+        ("DELETE", f"/v1alpha/job-queue/jobs/{_ID}", "/v1alpha/job-queue/jobs/{id}", "_delete_job"),
+        (
+            "POST",
+            f"/v1alpha/job-queue/jobs/{_ID}:move-to-top",
+            "/v1alpha/job-queue/jobs/{id}:move-to-top",
+            "_move_to_top",
+        ),
+        (
+            "GET",
+            f"/v1alpha/job-queue/jobs/{_ID}/outputs",
+            "/v1alpha/job-queue/jobs/{id}/outputs",
+            "_get_output_file_names",
+        ),
+        (
+            "GET",
+            f"/v1alpha/job-queue/jobs/{_ID}/outputs:export",
+            "/v1alpha/job-queue/jobs/{id}/outputs:export",
+            "_get_output_file",
+        ),
+    ]
+]
+
+
+class SimulatedJobQueueServer:
+    """
+    Simulates a Granta MI Job Queue server in the current process.
+
+    The server listens on a local port and implements the Server API endpoints used by
+    :class:`.JobQueueApiClient`, so that the client can be exercised at scale without a Granta MI
+    server. It is used to test and benchmark client throughput and polling behavior with tens of
+    thousands of jobs.
+
+    Jobs run in submission order, with at most ``concurrency`` jobs running at a time. A job
+    starts as soon as a slot is free and its scheduled execution date has passed, and runs for
+    ``job_duration`` seconds. Job states are advanced when the server receives a request, so the
+    server has no background threads other than those handling requests, and idle jobs cost no
+    CPU time.
+
+    Uploaded files are counted but not stored. Output files contain filler bytes.
+
+    This class only depends on the Python standard library. Use it as a context manager to ensure
+    that the server is stopped.
+
+    Parameters
+    ----------
+    concurrency : int, default: 1
+        Maximum number of jobs that run at the same time.
+    job_duration : float or callable, default: 0.0
+        Time in seconds for which each job runs, or a function that takes a
+        :class:`SimulatedJob` and returns that time.
+    job_outcome : callable, default: None
+        Function that takes a :class:`SimulatedJob` when it starts and returns whether the job
+        succeeds. If ``None``, all jobs succeed.
+    latency : float or callable, default: 0.0
+        Time in seconds added before each response, or a function that takes the endpoint name,
+        for example ``GET /v1alpha/job-queue/jobs/{id}``, and returns that time.
+    output_file_size : int, default: 1024
+        Size in bytes of each output file.
+    username : str, default: "User_1"
+        Name of the current user, recorded as the submitter of new jobs.
+    is_admin : bool, default: True
+        Whether the current user is a job queue administrator.
+    version : str, default: "25.2.0.0"
+        Granta MI version reported by the server.
+    port : int, default: 0
+        Port to listen on. If ``0``, a free port is chosen.
+
+    Examples
+    --------
+    >>> with SimulatedJobQueueServer(concurrency=4, job_duration=0.5) as server:
+    ...     client = server.connect()
+    ...     job = client.create_job_and_wait(job_request)
+    ...     print(server.request_counts)
+    {'GET /v1alpha/job-queue/jobs/{id}': 3, 'POST /v1alpha/job-queue/files': 2, ...}
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        job_duration: _JobDuration = 0.0,
+        job_outcome: Optional[Callable[[SimulatedJob], bool]] = None,
+        latency: _Latency = 0.0,
+        output_file_size: int = 1024,
+        username: str = "User_1",
+        is_admin: bool = True,
+        version: str = "25.2.0.0",
+        port: int = 0,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        if output_file_size < 0:
+            raise ValueError("output_file_size must not be negative.")
+        self._concurrency = concurrency
+        self._job_duration = job_duration
+        self._job_outcome = job_outcome
+        self._latency = latency
+        self._output_file_size = output_file_size
+        self._username = username
+        self._is_admin = is_admin
+        self._version = version
+        self._roles = ["Administrator" if is_admin else "Reader"]
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, SimulatedJob] = {}
+        self._pending: List[SimulatedJob] = []
+        self._running: List[SimulatedJob] = []
+        self._files: Dict[str, int] = {}
+        self._bytes_uploaded = 0
+        self._request_counts: Dict[str, int] = {}
+        self._clock = time.time()
+
+        self._server = _SimulatedHTTPServer(self, port)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            name="SimulatedJobQueueServer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{type(self).__name__} url: {self.url}>"
+
+    def __enter__(self) -> "SimulatedJobQueueServer":
+        """Return the running server."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self.close()
+
+    @property
+    def url(self) -> str:
+        """
+        Service Layer URL of the server, to pass to :class:`.Connection`.
+
+        Returns
+        -------
+        str
+            Service Layer URL.
+        """
+        port = self._server.server_address[1]
+        return f"http://127.0.0.1:{port}{SERVICE_LAYER_PATH}"
+
+    @property
+    def request_counts(self) -> Dict[str, int]:
+        """
+        Number of requests received by each endpoint.
+
+        Returns
+        -------
+        dict of str to int
+            Number of requests indexed by endpoint name, for example
+            ``GET /v1alpha/job-queue/jobs``.
+        """
+        with self._lock:
+            return dict(self._request_counts)
+
+    @property
+    def bytes_uploaded(self) -> int:
+        """
+        Total size of the request bodies of all file uploads, in bytes.
+
+        Returns
+        -------
+        int
+            Number of bytes uploaded.
+        """
+        with self._lock:
+            return self._bytes_uploaded
+
+    def connect(self) -> "JobQueueApiClient":
+        """
+        Connect a client to the server.
+
+        Returns
+        -------
+        JobQueueApiClient
+            Client connected to the server with anonymous authentication.
+        """
+        from ._connection import Connection
+
+        return Connection(self.url).with_anonymous().connect()
+
+    def add_jobs(
+        self,
+        count: int,
+        job_type: str = "ExcelImportJob",
+        status: str = _SUCCEEDED,
+        submitter_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Add jobs to the server without sending requests.
+
+        Use this method to populate the queue before a benchmark. Pending jobs are added to the end
+        of the queue and are run like submitted jobs. Completed jobs are given execution and
+        completion dates one second apart.
+
+        Parameters
+        ----------
+        count : int
+            Number of jobs to add.
+        job_type : str, default: "ExcelImportJob"
+            Type of the jobs.
+        status : str, default: "Succeeded"
+            Status of the jobs: ``Pending``, ``Succeeded``, or ``Failed``.
+        submitter_name : str, default: None
+            Name of the submitter. If ``None``, the current user is used.
+
+        Returns
+        -------
+        list of str
+            IDs of the added jobs.
+        """
+        if status not in (_PENDING, _SUCCEEDED, _FAILED):
+            raise ValueError("status must be 'Pending', 'Succeeded', or 'Failed'.")
+        now = time.time()
+        ids = []
+        with self._lock:
+            self._advance(now)
+            start = len(self._jobs)
+            for index in range(count):
+                job = SimulatedJob(
+                    id=str(uuid.uuid4()),
+                    name=f"Job {start + index}",
+                    type=job_type,
+                    description=None,
+                    parameters={},
+                    input_file_ids=[],
+                    submitter_name=submitter_name or self._username,
+                    submission_time=now - 2.0,
+                )
+                if status == _PENDING:
+                    self._pending.append(job)
+                else:
+                    job.status = status
+                    job.execution_time = now - 1.0
+                    job.completion_time = now
+                self._jobs[job.id] = job
+                ids.append(job.id)
+            self._advance(now)
+        return ids
+
+    def get_job(self, job_id: str) -> SimulatedJob:
+        """
+        Get a job held by the server, with its state at the current time.
+
+        Parameters
+        ----------
+        job_id : str
+            ID of the job.
+
+        Returns
+        -------
+        SimulatedJob
+            Job held by the server.
+
+        Raises
+        ------
+        KeyError
+            If the server holds no job with the given ID.
+        """
+        with self._lock:
+            self._advance(time.time())
+            return self._jobs[job_id]
+
+    def close(self) -> None:
+        """Stop the server and release its port."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _advance(self, now: float) -> None:
+        """
+        Run the simulation up to a given time.
+
+        Jobs are started and completed in the order in which these events would have happened,
+        with each job starting as soon as a slot is free.
+
+        Parameters
+        ----------
+        now : float
+            Time to advance to, in seconds since the epoch.
+        """
+        clock = self._clock
+        while True:
+            self._start_ready_jobs(clock)
+            next_event = min((job._end_time for job in self._running), default=math.inf)
+            if len(self._running) < self._concurrency and self._pending:
+                # Every remaining pending job is scheduled to start later
+                next_event = min(
+                    next_event, *(cast(float, job.scheduled_time) for job in self._pending)
+                )
+            if next_event > now:
+                break
+            clock = max(clock, next_event)
+            for job in [job for job in self._running if job._end_time <= clock]:
+                job.status = _SUCCEEDED if job._succeeds else _FAILED
+                job.completion_time = job._end_time
+                job._json = None
+                self._running.remove(job)
+        self._clock = max(self._clock, now)
+
+    def _start_ready_jobs(self, clock: float) -> None:
+        """
+        Start pending jobs while slots are free.
+
+        Parameters
+        ----------
+        clock : float
+            Current time of the simulation, in seconds since the epoch.
+        """
+        if len(self._running) >= self._concurrency or not self._pending:
+            return
+        index = 0
+        while len(self._running) < self._concurrency and index < len(self._pending):
+            job = self._pending[index]
+            if job.scheduled_time is not None and job.scheduled_time > clock:
+                index += 1
+                continue
+            del self._pending[index]
+            start = max(clock, job.submission_time)
+            job.status = _RUNNING
+            job.execution_time = start
+            duration = (
+                self._job_duration(job) if callable(self._job_duration) else self._job_duration
+            )
+            job._end_time = start + max(duration, 0.0)
+            job._succeeds = self._job_outcome(job) if self._job_outcome is not None else True
+            job._json = None
+            self._running.append(job)
+
+    def _handle(
+        self, method: str, path: str, query: Dict[str, List[str]], body: bytes
+    ) -> _Response:
+        """
+        Handle a request to the Server API.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method.
+        path : str
+            Path of the endpoint, relative to the Server API URL.
+        query : dict of str to list of str
+            Query parameters.
+        body : bytes
+            Request body.
+
+        Returns
+        -------
+        _Response
+            Response to send.
+        """
+        for route_method, pattern, template, handler in _ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match is None:
+                continue
+            name = f"{method} {template}"
+            latency = self._latency(name) if callable(self._latency) else self._latency
+            if latency > 0:
+                time.sleep(latency)
+            job_id = unquote(match.group("id")) if "id" in pattern.groupindex else None
+            with self._lock:
+                self._request_counts[name] = self._request_counts.get(name, 0) + 1
+                self._advance(time.time())
+                response: _Response = getattr(self, handler)(job_id, query, body)
+                return response
+        return _Response(404, {"message": f"No endpoint for {method} {path}."})
+
+    # Route handlers take the job ID from the path, the query parameters, and the request body
+    def _get_api_definition(
+        self, job_id: None, query: Dict[str, List[str]], body: bytes
+    ) -> _Response:
+        """Respond with a minimal API definition."""
+        return _Response(200, {"openapi": "3.0.1"})
+
+    def _get_version(self, job_id: None, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Respond with the Granta MI version."""
+        major_minor = ".".join(self._version.split(".")[:2])
+        return _Response(
+            200,
+            {
+                "version": self._version,
+                "majorMinorVersion": major_minor,
+                "binaryCompatibilityVersion": major_minor,
+            },
+        )
+
+    def _get_user(self, job_id: None, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Respond with the current user."""
+        return _Response(
+            200, {"username": self._username, "isAdmin": self._is_admin, "hasWriteAccess": True}
+        )
+
+    def _get_processing_config(
+        self, job_id: None, query: Dict[str, List[str]], body: bytes
+    ) -> _Response:
+        """Respond with the job queue processing configuration."""
+        return _Response(
+            200,
+            {
+                "concurrency": self._concurrency,
+                "pollingIntervalInMilliseconds": 1000,
+                "purgeIntervalInMilliseconds": 3600000,
+                "purgeJobAgeInMilliseconds": 86400000,
+            },
+        )
+
+    def _upload_file(self, job_id: None, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Record the size of an uploaded file, and respond with its ID."""
+        file_id = str(uuid.uuid4())
+        self._files[file_id] = len(body)
+        self._bytes_uploaded += len(body)
+        return _Response(200, file_id, "text/plain")
+
+    def _get_jobs(self, job_id: None, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Respond with the jobs that match the query filters, optionally paginated."""
+
+        def get(name: str) -> Optional[str]:
+            """Get the first value of a query parameter, or ``None`` if it is missing."""
+            return query[name][0] if name in query else None
+
+        job_type = get("jobType")
+        status = get("status")
+        name = (get("nameFilter") or "").lower()
+        description = (get("descriptionFilter") or "").lower()
+        submitter_name = get("submitterNameFilter")
+        positions = {job.id: index + 1 for index, job in enumerate(self._pending)}
+        results = [
+            job
+            for job in self._jobs.values()
+            if (job_type is None or job.type == job_type)
+            and (status is None or job.status == status)
+            and (not name or name in job.name.lower())
+            and (not description or description in (job.description or "").lower())
+            and (submitter_name is None or job.submitter_name == submitter_name)
+        ]
+        total = len(results)
+        page_size = get("pageSize")
+        if page_size is not None:
+            page_number = int(get("pageNumber") or 1)
+            offset = (page_number - 1) * int(page_size)
+            results = results[offset : offset + int(page_size)]
+        return _Response(
+            200,
+            {
+                "results": [job._to_json(positions.get(job.id), self._roles) for job in results],
+                "totalResultCount": total,
+            },
+        )
+
+    def _get_job(self, job_id: str, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Respond with a job."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return _NOT_FOUND
+        return _Response(200, job._to_json(self._get_position(job), self._roles))
+
+    def _create_job(self, job_id: None, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Add a job to the queue, unless it refers to unknown file IDs."""
+        request = json.loads(body)
+        input_file_ids = request.get("inputFileIds") or []
+        missing = [file_id for file_id in input_file_ids if file_id not in self._files]
+        if missing:
+            return _Response(400, {"message": f"Unknown file IDs: {', '.join(missing)}."})
+        job = SimulatedJob(
+            id=str(uuid.uuid4()),
+            name=request["name"],
+            type=request["type"],
+            description=request.get("description"),
+            parameters=json.loads(request.get("parameters") or "{}"),
+            input_file_ids=input_file_ids,
+            submitter_name=self._username,
+            submission_time=time.time(),
+            scheduled_time=_parse_time(request.get("scheduledExecutionDate")),
+        )
+        self._jobs[job.id] = job
+        self._pending.append(job)
+        self._start_ready_jobs(job.submission_time)
+        return _Response(201, job._to_json(self._get_position(job), self._roles))
+
+    def _update_job(self, job_id: str, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Update the name, description, schedule, or cancellation status of a job."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return _NOT_FOUND
+        update = json.loads(body)
+        if "name" in update:
+            job.name = update["name"]
+        if "description" in update:
+            job.description = update["description"]
+        if "scheduledExecutionDate" in update:
+            job.scheduled_time = _parse_time(update["scheduledExecutionDate"])
+        if update.get("status") == _CANCELLED and job.status == _PENDING:
+            self._pending.remove(job)
+            job.status = _CANCELLED
+            job.completion_time = time.time()
+        job._json = None
+        return _Response(200, job._to_json(self._get_position(job), self._roles))
+
+    def _delete_job(self, job_id: str, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Delete a job."""
+        if not self._remove_job(job_id):
+            return _NOT_FOUND
+        return _Response(200)
+
+    def _delete_jobs(self, job_id: None, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Delete the jobs in the request body, or all jobs, and respond with the deleted IDs."""
+        job_ids = json.loads(body) if body else list(self._jobs)
+        return _Response(200, [job_id for job_id in job_ids if self._remove_job(job_id)])
+
+    def _move_to_top(self, job_id: str, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Move a pending job to the top of the queue."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return _NOT_FOUND
+        if job.status == _PENDING:
+            self._pending.remove(job)
+            self._pending.insert(0, job)
+            self._start_ready_jobs(time.time())
+        return _Response(200)
+
+    def _get_output_file_names(
+        self, job_id: str, query: Dict[str, List[str]], body: bytes
+    ) -> _Response:
+        """Respond with the output file names of a job, or no names if it has not completed."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return _NOT_FOUND
+        completed = job.status in (_SUCCEEDED, _FAILED)
+        return _Response(200, job._get_output_file_names() if completed else [])
+
+    def _get_output_file(self, job_id: str, query: Dict[str, List[str]], body: bytes) -> _Response:
+        """Respond with the filler content of an output file of a completed job."""
+        job = self._jobs.get(job_id)
+        file_name = query.get("fileName", [""])[0]
+        if job is None or job.status not in (_SUCCEEDED, _FAILED):
+            return _NOT_FOUND
+        if file_name.lower() not in (name.lower() for name in job._get_output_file_names()):
+            return _Response(404, {"message": f"No output file named {file_name}."})
+        return _Response(200, b"\0" * self._output_file_size, "application/octet-stream")
+
+    def _get_position(self, job: SimulatedJob) -> Optional[int]:
+        """Get the position of a job in the queue, or ``None`` if the job is not pending."""
+        if job.status != _PENDING:
+            return None
+        return self._pending.index(job) + 1
+
+    def _remove_job(self, job_id: str) -> bool:
+        """Remove a job from the server, and return whether it existed."""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return False
+        if job.status == _PENDING:
+            self._pending.remove(job)
+        elif job.status == _RUNNING:
+            self._running.remove(job)
+        return True
+
+
+class _SimulatedRequestHandler(BaseHTTPRequestHandler):
+    """Forwards HTTP requests to a :class:`SimulatedJobQueueServer`."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which stalls keep-alive connections with Nagle
+    disable_nagle_algorithm = True
+    server: "_SimulatedHTTPServer"
+
+    def do_GET(self) -> None:
+        """Handle a GET request."""
+        self._handle_request()
+
+    def do_POST(self) -> None:
+        """Handle a POST request."""
+        self._handle_request()
+
+    def do_PATCH(self) -> None:
+        """Handle a PATCH request."""
+        self._handle_request()
+
+    def do_DELETE(self) -> None:
+        """Handle a DELETE request."""
+        self._handle_request()
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Discard the request log, because load tests send many requests."""
+
+    def _handle_request(self) -> None:
+        """Route a request to the authentication endpoint or the simulated Server API."""
+        body = self._read_body()
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        path = url.path
+        if path == SERVICE_LAYER_PATH + _AUTH_PATH:
+            response = _Response(200, "OK", "text/plain")
+        elif path.startswith(SERVICE_LAYER_PATH + _PROXY_PATH):
+            api_path = path[len(SERVICE_LAYER_PATH + _PROXY_PATH) :]
+            response = self.server.simulator._handle(self.command, api_path, query, body)
+        else:
+            response = _Response(404, {"message": "Not found."})
+        self._send(response)
+
+    def _read_body(self) -> bytes:
+        """Read the request body, decoding chunked transfer encoding."""
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";", 1)[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b"".join(chunks)
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, response: _Response) -> None:
+        """Serialize and send a response."""
+        if isinstance(response.body, bytes):
+            payload = response.body
+        elif response.body is None:
+            payload = b""
+        elif response.content_type == "text/plain":
+            payload = str(response.body).encode("utf-8")
+        else:
+            payload = json.dumps(response.body).encode("utf-8")
+        self.send_response(response.status_code)
+        if payload:
+            self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _SimulatedHTTPServer(ThreadingHTTPServer):
+    """HTTP server that holds the simulated job queue."""
+
+    daemon_threads = True
+
+    def __init__(self, simulator: SimulatedJobQueueServer, port: int) -> None:
+        self.simulator = simulator
+        super().__init__(("127.0.0.1", port), _SimulatedRequestHandler)
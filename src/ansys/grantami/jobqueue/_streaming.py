@@ -0,0 +1,695 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for streaming file transfers."""
+
+from dataclasses import dataclass
+import io
+import mimetypes
+import mmap
+import os
+import pathlib
+import tempfile
+import time
+from types import TracebackType
+from typing import IO, Callable, Iterator, Optional, Type, Union, cast
+import uuid
+
+from ansys.openapi.common import ApiClient, ApiException
+import requests  # type: ignore[import-untyped]
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+
+from ._instrumentation import _get_request_hooks, _get_request_size, _RequestTimer
+from ._retry import _call_with_retry
+
+UPLOAD_PATH = "/v1alpha/job-queue/files"
+OUTPUT_FILE_PATH = "/v1alpha/job-queue/jobs/{id}/outputs:export"
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class TransferProgress:
+    """
+    Provides the progress of a file transfer to or from the server.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    file_name : str
+        Name of the file being transferred.
+    bytes_transferred : int
+        Number of bytes of the file transferred so far.
+    total_bytes : int or None
+        Size of the file in bytes, or ``None`` if the size is not known.
+    elapsed_seconds : float
+        Number of seconds since the transfer started.
+    """
+
+    file_name: str
+    bytes_transferred: int
+    total_bytes: Optional[int]
+    elapsed_seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        """
+        Average transfer rate since the transfer started.
+
+        Returns
+        -------
+        float
+            Average number of bytes transferred per second.
+        """
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_transferred / self.elapsed_seconds
+
+
+ProgressCallback = Callable[[TransferProgress], None]
+
+
+class _MultipartFileStream:
+    """
+    Provides a ``multipart/form-data`` request body that reads a file in fixed-size chunks.
+
+    The body is never held in memory in full. At most ``chunk_size`` bytes of the file are buffered
+    at a time, so memory usage does not depend on the size of the file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path to the file to upload.
+    field_name : str
+        Name of the form field containing the file.
+    chunk_size : int
+        Number of bytes to read from the file at a time.
+    memory_map : bool
+        Whether to read the file through a memory map instead of buffered reads.
+    progress_callback : callable or None
+        Function called with a :class:`TransferProgress` object each time a chunk of the file
+        has been read.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        field_name: str,
+        chunk_size: int,
+        memory_map: bool,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        boundary = uuid.uuid4().hex
+        file_name = path.name.replace('"', "%22")
+        mimetype = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{file_name}"\r\n'
+            f"Content-Type: {mimetype}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        self._path = path
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+
+        self._file: IO[bytes] = open(path, "rb")
+        self._file_size = os.fstat(self._file.fileno()).st_size
+        self._mmap: Optional[mmap.mmap] = None
+        if memory_map and self._file_size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._length = len(self._head) + self._file_size + len(self._tail)
+        self._position = 0
+        self._buffer = b""
+        self._buffer_start = 0
+        self._released_offset = 0
+        self._start_time: Optional[float] = None
+
+    def __len__(self) -> int:
+        """Total length of the request body in bytes."""
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the request body in chunks."""
+        while chunk := self.read(self._chunk_size):
+            yield chunk
+
+    def __enter__(self) -> "_MultipartFileStream":
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Close the file when leaving the runtime context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def tell(self) -> int:
+        """
+        Get the current position in the request body.
+
+        Returns
+        -------
+        int
+            Current position in bytes.
+        """
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """
+        Move to a new position in the request body.
+
+        This allows the body to be sent again, for example during an authentication handshake.
+
+        Parameters
+        ----------
+        offset : int
+            Offset in bytes.
+        whence : int, default: os.SEEK_SET
+            Position that the offset is relative to.
+
+        Returns
+        -------
+        int
+            New position in bytes.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        self._position = min(max(offset, 0), self._length)
+        return self._position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """
+        Read the next part of the request body.
+
+        Fewer bytes than requested may be returned. An empty bytes object is returned at the end of
+        the body.
+
+        Parameters
+        ----------
+        size : int, default: -1
+            Maximum number of bytes to read. If negative, read the rest of the body.
+
+        Returns
+        -------
+        bytes
+            Next part of the request body.
+        """
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self._chunk_size), b""))
+        head_length = len(self._head)
+        file_end = head_length + self._file_size
+        if self._position < head_length:
+            data = self._head[self._position : self._position + size]
+        elif self._position < file_end:
+            data = self._read_file(self._position - head_length, size)
+        else:
+            offset = self._position - file_end
+            data = self._tail[offset : offset + size]
+        self._position += len(data)
+        return data
+
+    def _read_file(self, offset: int, size: int) -> bytes:
+        """
+        Read part of the file, refilling the chunk buffer from disk if required.
+
+        Parameters
+        ----------
+        offset : int
+            Offset in the file in bytes.
+        size : int
+            Maximum number of bytes to read.
+
+        Returns
+        -------
+        bytes
+            Data read from the file.
+        """
+        buffer_end = self._buffer_start + len(self._buffer)
+        if not self._buffer_start <= offset < buffer_end:
+            if self._mmap is not None:
+                self._buffer = self._mmap[offset : offset + self._chunk_size]
+                self._release_mapped_pages(offset)
+            else:
+                self._file.seek(offset)
+                self._buffer = self._file.read(self._chunk_size)
+            self._buffer_start = offset
+            buffer_end = offset + len(self._buffer)
+            self._report_progress(buffer_end)
+        start = offset - self._buffer_start
+        return self._buffer[start : start + size]
+
+    def _release_mapped_pages(self, offset: int) -> None:
+        """
+        Release memory-mapped pages before an offset that have already been read.
+
+        Mapped pages that have been read count towards the resident memory of the process until
+        they are released, so they are dropped as the file is read to keep memory usage flat.
+
+        Parameters
+        ----------
+        offset : int
+            Offset in the file in bytes. Pages entirely before this offset are released.
+        """
+        if self._mmap is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        end = offset - offset % mmap.PAGESIZE
+        if end > self._released_offset:
+            self._mmap.madvise(
+                mmap.MADV_DONTNEED, self._released_offset, end - self._released_offset
+            )
+            self._released_offset = end
+        elif end < self._released_offset:
+            # The stream has been rewound
+            self._released_offset = end
+
+    def _report_progress(self, bytes_transferred: int) -> None:
+        """
+        Call the progress callback, if provided.
+
+        Parameters
+        ----------
+        bytes_transferred : int
+            Number of bytes of the file read so far.
+        """
+        now = time.perf_counter()
+        if self._start_time is None or bytes_transferred <= self._chunk_size:
+            self._start_time = now
+        if self._progress_callback is not None:
+            self._progress_callback(
+                TransferProgress(
+                    file_name=self._path.name,
+                    bytes_transferred=bytes_transferred,
+                    total_bytes=self._file_size,
+                    elapsed_seconds=now - self._start_time,
+                )
+            )
+
+
+@dataclass(frozen=True)
+class _StreamingUpload:
+    """
+    Uploads files to the job queue without loading the whole file into memory.
+
+    Files are sent with the same request as :meth:`JobQueueApi.upload_file`, but the request body
+    is streamed from disk.
+
+    Parameters
+    ----------
+    chunk_size : int, default: 1048576
+        Number of bytes to read from the file at a time.
+    memory_map : bool, default: False
+        Whether to read the file through a memory map.
+    progress_callback : callable, default: None
+        Function called with a :class:`TransferProgress` object each time a chunk of the file
+        has been read.
+    """
+
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    memory_map: bool = False
+    progress_callback: Optional[ProgressCallback] = None
+
+    def upload_file(self, api_client: ApiClient, path: pathlib.Path) -> str:
+        """
+        Upload a file to the job queue.
+
+        Parameters
+        ----------
+        api_client : ApiClient
+            Client used to send the request.
+        path : pathlib.Path
+            Path to the file to upload.
+
+        Returns
+        -------
+        str
+            ID of the uploaded file.
+
+        Raises
+        ------
+        ApiException
+            If the server returns an error.
+        """
+
+        def upload() -> str:
+            hooks = _get_request_hooks(api_client)
+            timer = _RequestTimer(hooks, "POST", UPLOAD_PATH) if hooks else None
+            with _MultipartFileStream(
+                path, "file", self.chunk_size, self.memory_map, self.progress_callback
+            ) as body:
+                try:
+                    response = api_client.rest_client.post(
+                        api_client.api_url + UPLOAD_PATH,
+                        data=body,
+                        headers={
+                            "Content-Type": body.content_type,
+                            "Accept": "text/plain, application/json, text/json",
+                        },
+                    )
+                except Exception as e:
+                    if timer is not None:
+                        timer.finish(None, 0, 0, e)
+                    raise
+            if timer is not None:
+                timer.finish(response.status_code, len(body), len(response.content))
+            if not 200 <= response.status_code <= 299:
+                raise ApiException.from_response(response)
+            return cast(str, api_client.deserialize(response, "str"))
+
+        return _call_with_retry(api_client, "POST", UPLOAD_PATH, upload)
+
+
+class OutputFileStream(io.RawIOBase):
+    """
+    Provides a read-only binary stream of a job output file as it is downloaded from the server.
+
+    The file is read directly from the HTTP response, so it is never written to a temporary file
+    and never held in memory in full, unless :meth:`read` is called without a size.
+
+    This class is returned by :meth:`.AsyncJob.open_output` and should not be instantiated
+    directly. Use it as a context manager to ensure that the connection is released.
+
+    .. versionadded:: 1.4
+
+    Examples
+    --------
+    >>> with job.open_output("Export.zip") as stream:
+    ...     for chunk in stream.iter_chunks():
+    ...         process(chunk)
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        file_name: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        request_timer: Optional[_RequestTimer] = None,
+    ) -> None:
+        super().__init__()
+        self._response = response
+        self._raw = response.raw
+        self._raw.decode_content = True
+        self._file_name = file_name
+        self._progress_callback = progress_callback
+        self._request_timer = request_timer
+        self._bytes_read = 0
+        self._start_time = time.perf_counter()
+        self._size = _get_content_size(response)
+
+    @property
+    def file_name(self) -> str:
+        """
+        Name of the output file.
+
+        Returns
+        -------
+        str
+            Name of the output file.
+        """
+        return self._file_name
+
+    @property
+    def size(self) -> Optional[int]:
+        """
+        Size of the output file in bytes, if provided by the server.
+
+        Returns
+        -------
+        int or None
+            Size of the output file in bytes, or ``None`` if the size is not known.
+        """
+        return self._size
+
+    def readable(self) -> bool:
+        """
+        Whether the stream can be read from.
+
+        Returns
+        -------
+        bool
+            Always ``True``.
+        """
+        return True
+
+    def readinto(self, buffer: "Union[bytearray, memoryview]") -> int:  # type: ignore[override]
+        """
+        Read bytes from the response into a pre-allocated buffer.
+
+        Parameters
+        ----------
+        buffer : bytearray or memoryview
+            Buffer to read into.
+
+        Returns
+        -------
+        int
+            Number of bytes read, or ``0`` at the end of the file.
+        """
+        # Raise the same exceptions as requests.Response.iter_content
+        try:
+            count = cast(int, self._raw.readinto(buffer))
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e) from e
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e) from e
+        if count:
+            self._bytes_read += count
+            if self._progress_callback is not None:
+                self._progress_callback(
+                    TransferProgress(
+                        file_name=self._file_name,
+                        bytes_transferred=self._bytes_read,
+                        total_bytes=self._size,
+                        elapsed_seconds=time.perf_counter() - self._start_time,
+                    )
+                )
+        return count
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the rest of the file in chunks.
+
+        Parameters
+        ----------
+        chunk_size : int, default: 1048576
+            Maximum number of bytes in each chunk.
+
+        Yields
+        ------
+        bytes
+            Next chunk of the file.
+        """
+        while chunk := self.read(chunk_size):
+            yield chunk
+
+    def save(
+        self, file_path: Union[str, pathlib.Path], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        """
+        Write the rest of the file to a local path.
+
+        The file is first written to a temporary file in the same folder as ``file_path``, which
+        then replaces ``file_path``. The temporary file is removed if the download fails, and
+        ``file_path`` is never left partially written.
+
+        Parameters
+        ----------
+        file_path : str or pathlib.Path
+            Path to save the file to.
+        chunk_size : int, default: 1048576
+            Number of bytes to read from the server at a time.
+        """
+        file_path = pathlib.Path(file_path)
+        buffer = memoryview(bytearray(chunk_size))
+        with tempfile.NamedTemporaryFile(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".part", delete=False
+        ) as f:
+            try:
+                while count := self.readinto(buffer):
+                    f.write(buffer[:count])
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        try:
+            os.replace(f.name, file_path)
+        except BaseException:
+            os.unlink(f.name)
+            raise
+
+    def close(self) -> None:
+        """Close the stream and release the connection."""
+        if not self.closed:
+            self._response.close()
+            if self._request_timer is not None:
+                # Report the download once the whole body has been read or abandoned
+                self._request_timer.finish(
+                    self._response.status_code,
+                    _get_request_size(self._response),
+                    self._bytes_read,
+                )
+        super().close()
+
+
+def _get_content_size(response: requests.Response) -> Optional[int]:
+    """
+    Get the size of the file in a response from its headers.
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response to a request for a file.
+
+    Returns
+    -------
+    int or None
+        Size of the file in bytes, or ``None`` if the server did not provide it.
+    """
+    content_length = response.headers.get("Content-Length")
+    is_encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+    return int(content_length) if content_length and not is_encoded else None
+
+
+def _get_output_file_size(api_client: ApiClient, job_id: str, file_name: str) -> Optional[int]:
+    """
+    Get the size of a job output file without downloading it.
+
+    This function sends a ``HEAD`` request to the endpoint used by :func:`_open_output_file`.
+
+    Parameters
+    ----------
+    api_client : ApiClient
+        Client used to send the request.
+    job_id : str
+        ID of the job.
+    file_name : str
+        Name of the output file.
+
+    Returns
+    -------
+    int or None
+        Size of the output file in bytes, or ``None`` if the server did not provide it.
+
+    Raises
+    ------
+    ApiException
+        If the server returns an error, for example because it does not support ``HEAD`` requests.
+    """
+
+    def get_output_file_size() -> Optional[int]:
+        hooks = _get_request_hooks(api_client)
+        timer = _RequestTimer(hooks, "HEAD", OUTPUT_FILE_PATH) if hooks else None
+        try:
+            response = api_client.rest_client.head(
+                api_client.api_url + OUTPUT_FILE_PATH.format(id=job_id),
+                params={"fileName": file_name},
+                headers={"Accept": "application/octet-stream"},
+            )
+        except Exception as e:
+            if timer is not None:
+                timer.finish(None, 0, 0, e)
+            raise
+        if timer is not None:
+            timer.finish(response.status_code, 0, 0)
+        if not 200 <= response.status_code <= 299:
+            raise ApiException.from_response(response)
+        return _get_content_size(response)
+
+    return _call_with_retry(api_client, "HEAD", OUTPUT_FILE_PATH, get_output_file_size)
+
+
+def _open_output_file(
+    api_client: ApiClient,
+    job_id: str,
+    file_name: str,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> OutputFileStream:
+    """
+    Start downloading a job output file.
+
+    This function sends the same request as :meth:`JobQueueApi.get_job_output_file`, but does
+    not read the response body.
+
+    Parameters
+    ----------
+    api_client : ApiClient
+        Client used to send the request.
+    job_id : str
+        ID of the job.
+    file_name : str
+        Name of the output file.
+    progress_callback : callable, default: None
+        Function called with a :class:`TransferProgress` object each time data is read.
+
+    Returns
+    -------
+    OutputFileStream
+        Stream of the output file.
+
+    Raises
+    ------
+    ApiException
+        If the server returns an error.
+    """
+
+    def open_output_file() -> OutputFileStream:
+        hooks = _get_request_hooks(api_client)
+        timer = _RequestTimer(hooks, "GET", OUTPUT_FILE_PATH) if hooks else None
+        try:
+            response = api_client.rest_client.get(
+                api_client.api_url + OUTPUT_FILE_PATH.format(id=job_id),
+                params={"fileName": file_name},
+                headers={"Accept": "application/octet-stream"},
+                stream=True,
+            )
+        except Exception as e:
+            if timer is not None:
+                timer.finish(None, 0, 0, e)
+            raise
+        if not 200 <= response.status_code <= 299:
+            try:
+                raise ApiException.from_response(response)
+            finally:
+                if timer is not None:
+                    timer.finish(response.status_code, 0, len(response.content))
+                response.close()
+        return OutputFileStream(response, file_name, progress_callback, timer)
+
+    return _call_with_retry(api_client, "GET", OUTPUT_FILE_PATH, open_output_file)
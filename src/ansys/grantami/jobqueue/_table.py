@@ -0,0 +1,368 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for columnar snapshots of the job queue."""
+
+from array import array
+import datetime
+import math
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from ansys.grantami.serverapi_openapi.v2025r2 import models
+
+from ._models import AsyncJob, ImportJob, JobStatus, JobType
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+_STATUSES: Tuple[JobStatus, ...] = tuple(JobStatus)
+_STATUS_CODES: Dict[JobStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_SERVER_STATUS_CODES: Dict[models.GsaJobStatus, int] = {
+    server_status: _STATUS_CODES[JobStatus[server_status.value]]
+    for server_status in models.GsaJobStatus
+}
+_SUCCEEDED_CODE = _STATUS_CODES[JobStatus.Succeeded]
+_FAILED_CODE = _STATUS_CODES[JobStatus.Failed]
+_DELETED_CODE = _STATUS_CODES[JobStatus.Deleted]
+_TYPES: Tuple[JobType, ...] = tuple(JobType)
+_TYPE_CODES: Dict[str, int] = {job_type.value: code for code, job_type in enumerate(_TYPES)}
+
+_ARRAY_COLUMNS = (
+    "status",
+    "type",
+    "position",
+    "submission_time",
+    "execution_time",
+    "completion_time",
+)
+
+
+_TableRow = Tuple[int, int, int, float, float, float]
+# Revision of the job when the row was built, and the row
+_CachedRow = Tuple[int, _TableRow]
+
+
+def _to_timestamp(value: Optional[datetime.datetime]) -> float:
+    """
+    Convert a date and time to seconds since the Unix epoch.
+
+    Parameters
+    ----------
+    value : datetime.datetime or None
+        Date and time to convert.
+
+    Returns
+    -------
+    float
+        Seconds since the Unix epoch, or ``nan`` if the date and time is missing.
+    """
+    return math.nan if value is None else value.timestamp()
+
+
+def _build_table_row(job: AsyncJob) -> _TableRow:
+    """
+    Get the numeric column values of a job from its fields.
+
+    The :attr:`.AsyncJob.status` property is not used, because it is much slower than reading the
+    fields of the job directly.
+
+    Parameters
+    ----------
+    job : AsyncJob
+        Job to get the values of.
+
+    Returns
+    -------
+    tuple of int and float
+        Status code, type code, position, submission time, execution time, and completion time.
+    """
+    status = _SERVER_STATUS_CODES[job._status]
+    if status == _SUCCEEDED_CODE and isinstance(job, ImportJob) and job._import_failed():
+        status = _FAILED_CODE
+    return (
+        status,
+        _TYPE_CODES.get(job._type, -1),
+        -1 if job._position is None else job._position,
+        job._submission_date.timestamp(),
+        _to_timestamp(job._execution_datetime),
+        _to_timestamp(job._completion_datetime),
+    )
+
+
+class JobTable:
+    """
+    Provides a columnar snapshot of jobs in the job queue.
+
+    Each column holds one value per job, in the same order as :attr:`ids`. Numeric columns are
+    stored in :class:`array.array` objects, so they can be converted to NumPy arrays without
+    copying, and statistics over many jobs can be computed without accessing each job object.
+
+    This class is returned by :meth:`~.JobQueueApiClient.jobs_table` and should not be
+    instantiated directly.
+
+    .. versionadded:: 1.4
+
+    Examples
+    --------
+    >>> table = client.jobs_table()
+    >>> columns = table.to_numpy()
+    >>> queue_time = columns["execution_time"] - columns["submission_time"]
+    >>> numpy.nanmedian(queue_time)
+    12.5
+    """
+
+    statuses: Tuple[JobStatus, ...] = _STATUSES
+    """Job status represented by each code in the :attr:`status` column."""
+
+    types: Tuple[JobType, ...] = _TYPES
+    """Job type represented by each code in the :attr:`type` column."""
+
+    def __init__(self, jobs: Iterable[AsyncJob], previous: Optional["JobTable"] = None) -> None:
+        # Read the job fields instead of the job properties, and build each column in a single
+        # pass, which is much faster than appending row by row
+        jobs = list(jobs)
+        self._ids: List[str] = [job._id for job in jobs]
+        self._names: List[str] = [job._name for job in jobs]
+        self._submitters: List[str] = [job._submitter_name for job in jobs]
+        # Rows are reused from the previous table for jobs that have not been updated since it
+        # was built, so building a table again only converts the jobs that have changed
+        previous_rows: Dict[AsyncJob, _CachedRow] = {} if previous is None else previous._rows
+        cached_rows: Dict[AsyncJob, _CachedRow] = {}
+        rows = []
+        for job in jobs:
+            cached = previous_rows.get(job)
+            if cached is None or cached[0] != job._revision:
+                cached = (job._revision, _build_table_row(job))
+            cached_rows[job] = cached
+            row = cached[1]
+            if job._is_deleted:
+                # Jobs are marked as deleted without being updated, so the revision is unchanged
+                row = (_DELETED_CODE, *row[1:])
+            rows.append(row)
+        self._rows: Dict[AsyncJob, _CachedRow] = cached_rows
+        # Avoid zip(*rows), which allocates an iterator per row and triggers garbage collection
+        self._status = array("b", [row[0] for row in rows])
+        self._type = array("b", [row[1] for row in rows])
+        self._position = array("q", [row[2] for row in rows])
+        self._submission_time = array("d", [row[3] for row in rows])
+        self._execution_time = array("d", [row[4] for row in rows])
+        self._completion_time = array("d", [row[5] for row in rows])
+
+    def __len__(self) -> int:
+        """Return the number of jobs in the table."""
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{self.__class__.__name__}: {len(self)} jobs>"
+
+    @property
+    def ids(self) -> List[str]:
+        """
+        ID of each job.
+
+        Returns
+        -------
+        list of str
+            Job IDs.
+        """
+        return self._ids
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Name of each job.
+
+        Returns
+        -------
+        list of str
+            Job names.
+        """
+        return self._names
+
+    @property
+    def submitters(self) -> List[str]:
+        """
+        Name of the user who submitted each job.
+
+        Returns
+        -------
+        list of str
+            Submitter names.
+        """
+        return self._submitters
+
+    @property
+    def status(self) -> "array[int]":
+        """
+        Status of each job, as an index into :attr:`statuses`.
+
+        Returns
+        -------
+        array.array
+            Job status codes.
+        """
+        return self._status
+
+    @property
+    def type(self) -> "array[int]":
+        """
+        Type of each job, as an index into :attr:`types`.
+
+        Jobs of a type that is not a member of :class:`~.JobType` have the code ``-1``.
+
+        Returns
+        -------
+        array.array
+            Job type codes.
+        """
+        return self._type
+
+    @property
+    def position(self) -> "array[int]":
+        """
+        Position of each job in the queue.
+
+        Jobs that are not in the queue have the position ``-1``.
+
+        Returns
+        -------
+        array.array
+            Queue positions.
+        """
+        return self._position
+
+    @property
+    def submission_time(self) -> "array[float]":
+        """
+        Time at which each job was submitted, in seconds since the Unix epoch.
+
+        Returns
+        -------
+        array.array
+            Submission times.
+        """
+        return self._submission_time
+
+    @property
+    def execution_time(self) -> "array[float]":
+        """
+        Time at which each job started running, in seconds since the Unix epoch.
+
+        Jobs that have not started have the value ``nan``.
+
+        Returns
+        -------
+        array.array
+            Execution times.
+        """
+        return self._execution_time
+
+    @property
+    def completion_time(self) -> "array[float]":
+        """
+        Time at which each job completed, in seconds since the Unix epoch.
+
+        Jobs that have not completed have the value ``nan``.
+
+        Returns
+        -------
+        array.array
+            Completion times.
+        """
+        return self._completion_time
+
+    def to_numpy(self) -> "Dict[str, numpy.ndarray]":
+        """
+        Convert the table to a dictionary of NumPy arrays.
+
+        Numeric columns share memory with the table. The ``ids``, ``names`` and ``submitters``
+        columns are converted to arrays of Python objects.
+
+        Requires the ``numpy`` package.
+
+        Returns
+        -------
+        dict of str to numpy.ndarray
+            Array for each column, indexed by column name.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        """
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("JobTable.to_numpy() requires the 'numpy' package.") from e
+
+        columns: Dict[str, Any] = {
+            "ids": numpy.array(self._ids, dtype=object),
+            "names": numpy.array(self._names, dtype=object),
+            "submitters": numpy.array(self._submitters, dtype=object),
+        }
+        for name in _ARRAY_COLUMNS:
+            values = getattr(self, f"_{name}")
+            columns[name] = numpy.frombuffer(values, dtype=values.typecode)
+        return columns
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """
+        Convert the table to a pandas DataFrame indexed by job ID.
+
+        The ``status`` and ``type`` columns are categorical, and the time columns are converted to
+        timezone-aware timestamps in UTC.
+
+        Requires the ``pandas`` package.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with one row per job.
+
+        Raises
+        ------
+        ImportError
+            If pandas is not installed.
+        """
+        try:
+            import pandas
+        except ImportError as e:
+            raise ImportError("JobTable.to_pandas() requires the 'pandas' package.") from e
+
+        columns = self.to_numpy()
+        data = {
+            "name": columns["names"],
+            "submitter": columns["submitters"],
+            "status": pandas.Categorical.from_codes(
+                columns["status"], categories=[status.name for status in self.statuses]
+            ),
+            "type": pandas.Categorical.from_codes(
+                columns["type"], categories=[job_type.name for job_type in self.types]
+            ),
+            "position": columns["position"],
+        }
+        for name in ("submission_time", "execution_time", "completion_time"):
+            data[name] = pandas.to_datetime(columns[name], unit="s", utc=True)
+        return pandas.DataFrame(data, index=pandas.Index(columns["ids"], name="id"))
@@ -0,0 +1,295 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for the upload cache."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import pathlib
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of file hashes to remember. The least recently used hashes are discarded first.
+_MAX_DIGESTS = 1024
+
+_ContentKey = Tuple[str, int]
+_StatKey = Tuple[str, int, int]
+_UploadKey = Tuple[str, int, str, Optional[str]]
+
+
+@dataclass(frozen=True)
+class UploadCacheStatistics:
+    """
+    Provides a snapshot of the usage of an :class:`~.UploadCache`.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    hits : int
+        Number of uploads avoided by reusing a cached file ID.
+    misses : int
+        Number of files that were not in the cache and had to be uploaded.
+    invalidations : int
+        Number of file IDs removed from the cache because the server rejected them.
+    entries : int
+        Number of file IDs currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+
+class UploadCache:
+    """
+    Reuses the IDs of files that have already been uploaded to the server.
+
+    Files are identified by the SHA-256 hash and size of their content, their name, and their
+    virtual path in the job request. The server refers to uploaded files by name, so a file is only
+    reused if its content, name, and virtual path all match, for example if several job requests
+    use the same template file. The hash of a file is only recomputed if its size or modification
+    time changes. If several threads upload the same file at the same time, the file
+    is only uploaded once, and the other threads reuse its file ID.
+
+    Files uploaded to the job queue are ephemeral, and are removed by the server after some time.
+    Cached file IDs therefore expire after ``lifetime`` seconds. If the server rejects a job that
+    refers to a cached file ID, the file IDs are invalidated and the files are uploaded again.
+
+    Assign an instance of this class to :attr:`.JobQueueApiClient.upload_cache` to enable caching.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    lifetime : float, default: 600.0
+        Number of seconds for which a file ID can be reused after the file was uploaded.
+
+    Examples
+    --------
+    >>> client.upload_cache = UploadCache(lifetime=300)
+    >>> for request in job_requests:  # All requests use the same template file
+    ...     client.create_job(request)
+    >>> client.upload_cache.statistics
+    UploadCacheStatistics(hits=99, misses=101, invalidations=0, entries=101)
+    """
+
+    def __init__(self, lifetime: float = 600.0) -> None:
+        if lifetime <= 0:
+            raise ValueError("lifetime must be a positive number of seconds.")
+        self._lifetime = lifetime
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_UploadKey, Tuple[str, float]]" = OrderedDict()
+        self._digests: "OrderedDict[_StatKey, _ContentKey]" = OrderedDict()
+        self._uploads: Dict[_UploadKey, threading.Event] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{type(self).__name__}: lifetime: {self._lifetime}, entries: {len(self._entries)}>"
+
+    @property
+    def lifetime(self) -> float:
+        """
+        Number of seconds for which a file ID can be reused after the file was uploaded.
+
+        Returns
+        -------
+        float
+            Lifetime of cached file IDs in seconds.
+        """
+        return self._lifetime
+
+    @property
+    def statistics(self) -> UploadCacheStatistics:
+        """
+        Current usage statistics of the cache.
+
+        Returns
+        -------
+        UploadCacheStatistics
+            Snapshot of the cache usage.
+        """
+        with self._lock:
+            self._purge_expired()
+            return UploadCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Remove all file IDs from the cache and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._digests.clear()
+            self._hits = 0
+            self._misses = 0
+            self._invalidations = 0
+
+    def _get(
+        self, path: pathlib.Path, virtual_path: Optional[pathlib.Path] = None
+    ) -> Tuple[_UploadKey, Optional[str]]:
+        """
+        Get the cached file ID for a local file.
+
+        If the file is being uploaded by another thread, this method waits for the upload to
+        finish. If the file is not in the cache, the caller must upload it and then call either
+        :meth:`_put` or :meth:`_cancel`.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Path to the local file.
+        virtual_path : pathlib.Path, default: None
+            Virtual path of the file in the job request, if any.
+
+        Returns
+        -------
+        tuple of (tuple of (str, int, str, str or None), str or None)
+            Key identifying the uploaded file, and the cached file ID or ``None`` if the file is
+            not in the cache.
+        """
+        digest, size = self._get_content_key(path)
+        key = (digest, size, path.name, None if virtual_path is None else virtual_path.as_posix())
+        while True:
+            with self._lock:
+                self._purge_expired()
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._hits += 1
+                    return key, entry[0]
+                upload = self._uploads.get(key)
+                if upload is None:
+                    self._uploads[key] = threading.Event()
+                    self._misses += 1
+                    return key, None
+            upload.wait()
+
+    def _put(self, key: _UploadKey, file_id: str) -> None:
+        """
+        Add the ID of an uploaded file to the cache.
+
+        Parameters
+        ----------
+        key : tuple of (str, int, str, str or None)
+            Key identifying the uploaded file, as returned by :meth:`_get`.
+        file_id : str
+            ID returned by the server for the uploaded file.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (file_id, time.monotonic() + self._lifetime)
+            self._finish_upload(key)
+
+    def _cancel(self, key: _UploadKey) -> None:
+        """
+        Record that a file returned as not in the cache by :meth:`_get` was not uploaded.
+
+        Another thread waiting for the file uploads it instead.
+
+        Parameters
+        ----------
+        key : tuple of (str, int, str, str or None)
+            Key identifying the uploaded file, as returned by :meth:`_get`.
+        """
+        with self._lock:
+            self._finish_upload(key)
+
+    def _finish_upload(self, key: _UploadKey) -> None:
+        """Wake the threads waiting for a file to be uploaded. Must be called with the lock held."""
+        upload = self._uploads.pop(key, None)
+        if upload is not None:
+            upload.set()
+
+    def _invalidate(self, file_ids: Iterable[str]) -> int:
+        """
+        Remove file IDs from the cache.
+
+        Parameters
+        ----------
+        file_ids : iterable of str
+            File IDs to remove.
+
+        Returns
+        -------
+        int
+            Number of file IDs that were removed.
+        """
+        file_ids = set(file_ids)
+        with self._lock:
+            stale = [key for key, (file_id, _) in self._entries.items() if file_id in file_ids]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def _purge_expired(self) -> None:
+        """Remove expired file IDs. Must be called with the lock held."""
+        now = time.monotonic()
+        # Entries are ordered by upload time, and all entries share the same lifetime.
+        while self._entries:
+            key, (_, expiry) = next(iter(self._entries.items()))
+            if expiry > now:
+                break
+            del self._entries[key]
+
+    def _get_content_key(self, path: pathlib.Path) -> _ContentKey:
+        """
+        Get the key identifying the content of a local file.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Path to the local file.
+
+        Returns
+        -------
+        tuple of (str, int)
+            SHA-256 hash of the file content and the size of the file in bytes.
+        """
+        stat = path.stat()
+        stat_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            key = self._digests.get(stat_key)
+            if key is not None:
+                self._digests.move_to_end(stat_key)
+                return key
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        key = (digest.hexdigest(), stat.st_size)
+        with self._lock:
+            self._digests[stat_key] = key
+            if len(self._digests) > _MAX_DIGESTS:
+                self._digests.popitem(last=False)
+        return key
@@ -0,0 +1,221 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for the server version cache."""
+
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+def _get_default_path() -> pathlib.Path:
+    """
+    Get the default location of the server version cache file.
+
+    Returns
+    -------
+    pathlib.Path
+        Path in the cache directory of the current user.
+    """
+    if sys.platform.startswith("win"):
+        cache_dir = os.environ.get("LOCALAPPDATA") or pathlib.Path.home() / "AppData" / "Local"
+    else:
+        cache_dir = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(cache_dir) / "ansys-grantami-jobqueue" / "server-versions.json"
+
+
+class ServerVersionCache:
+    """
+    Stores the Granta MI version of each server on disk, to speed up connections.
+
+    When a :class:`~.Connection` uses a version cache, the server version is only checked if it is
+    not in the cache or has expired. Otherwise, :meth:`.Connection.connect` returns the client
+    without making any request to the Server API. Use this class to reduce the startup time of
+    short-lived processes that connect to the same server repeatedly.
+
+    The cache is a JSON file that can be shared by several processes. Entries are indexed by the
+    Server API URL, and are only written after a successful connection check.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    path : str or pathlib.Path, default: None
+        Path of the cache file. If ``None``, ``server-versions.json`` in the
+        ``ansys-grantami-jobqueue`` folder of the cache directory of the current user is used.
+    ttl : float, default: 86400.0
+        Number of seconds for which a cached server version is used before it is checked again.
+
+    Examples
+    --------
+    >>> cache = ServerVersionCache(ttl=3600)
+    >>> client = (
+    ...     Connection("http://my_mi_server/mi_servicelayer", version_cache=cache)
+    ...     .with_autologon()
+    ...     .connect()
+    ... )
+    """
+
+    def __init__(
+        self, path: Optional[Union[str, pathlib.Path]] = None, ttl: float = 86400.0
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds.")
+        self._path = pathlib.Path(path) if path is not None else _get_default_path()
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return f"<{type(self).__name__}: path: {self._path}, ttl: {self._ttl}>"
+
+    @property
+    def path(self) -> pathlib.Path:
+        """
+        Path of the cache file.
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the cache file.
+        """
+        return self._path
+
+    @property
+    def ttl(self) -> float:
+        """
+        Number of seconds for which a cached server version is used before it is checked again.
+
+        Returns
+        -------
+        float
+            Lifetime of cached server versions in seconds.
+        """
+        return self._ttl
+
+    def get(self, url: str) -> Optional[Tuple[int, ...]]:
+        """
+        Get the cached Granta MI version of a server.
+
+        Parameters
+        ----------
+        url : str
+            URL of the Server API.
+
+        Returns
+        -------
+        tuple of int or None
+            Granta MI version of the server, or ``None`` if the version is not cached or has
+            expired.
+        """
+        with self._lock:
+            entry = self._read().get(url)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            version = tuple(int(element) for element in entry["version"])
+            checked = float(entry["checked"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not 0 <= time.time() - checked < self._ttl:
+            return None
+        return version
+
+    def set(self, url: str, version: Tuple[int, ...]) -> None:
+        """
+        Store the Granta MI version of a server.
+
+        Expired entries for other servers are removed at the same time.
+
+        Parameters
+        ----------
+        url : str
+            URL of the Server API.
+        version : tuple of int
+            Granta MI version of the server.
+        """
+        now = time.time()
+        with self._lock:
+            entries = {
+                key: entry
+                for key, entry in self._read().items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get("checked"), (int, float))
+                and now - entry["checked"] < self._ttl
+            }
+            entries[url] = {"version": list(version), "checked": now}
+            self._write(entries)
+
+    def clear(self) -> None:
+        """Remove all cached server versions."""
+        with self._lock:
+            try:
+                self._path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _read(self) -> Dict[str, Any]:
+        """
+        Read all entries from the cache file.
+
+        Returns
+        -------
+        dict
+            Entries indexed by URL. Empty if the file does not exist or cannot be read.
+        """
+        try:
+            entries = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        """
+        Replace the content of the cache file.
+
+        The file is written to a temporary file first, so that other processes never read a
+        partially written file. Errors are ignored, because the cache is only an optimization.
+
+        Parameters
+        ----------
+        entries : dict
+            Entries indexed by URL.
+        """
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temporary_path = tempfile.mkstemp(
+                dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(temporary_path, self._path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        except OSError:
+            pass
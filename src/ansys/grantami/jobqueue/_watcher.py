@@ -0,0 +1,489 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for a background job watcher that dispatches job status-change events."""
+
+from dataclasses import dataclass
+import queue
+import threading
+import time
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ._logger import logger
+from ._models import AsyncJob, JobStatus, _DocumentedEnum
+
+if TYPE_CHECKING:
+    from ._connection import JobQueueApiClient
+
+_COMPLETED_STATUSES = {JobStatus.Succeeded, JobStatus.Failed, JobStatus.Cancelled}
+_FAILED_STATUSES = {JobStatus.Failed, JobStatus.Cancelled}
+
+_JobState = Tuple[JobStatus, Optional[int]]
+
+
+class JobEventType(_DocumentedEnum):
+    """
+    Provides the types of event dispatched by a :class:`JobWatcher`.
+
+    .. versionadded:: 1.4
+    """
+
+    Submitted = "Submitted", """Job was added to the queue."""
+    Started = "Started", """Job started executing."""
+    PositionChanged = "PositionChanged", """Position of a pending job in the queue changed."""
+    Succeeded = "Succeeded", """Job has completed."""
+    Failed = "Failed", """Job could not complete or was cancelled by the user."""
+    Deleted = "Deleted", """Job was deleted on the server."""
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """
+    Describes a change to a job observed by a :class:`JobWatcher`.
+
+    The current state of the job is available from the :attr:`job` object. This state may be more
+    recent than the event if the job changed again before the event was dispatched.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    event_type : JobEventType
+        Type of the event.
+    job : AsyncJob
+        Job that changed.
+    previous_status : JobStatus or None
+        Status of the job before the change, or ``None`` for :attr:`~JobEventType.Submitted`
+        events.
+    previous_position : int or None
+        Position of the job in the queue before the change, or ``None`` if the job was not pending.
+    """
+
+    event_type: JobEventType
+    job: AsyncJob
+    previous_status: Optional[JobStatus] = None
+    previous_position: Optional[int] = None
+
+
+JobEventCallback = Callable[[JobEvent], None]
+"""Function called with a :class:`JobEvent` for each event dispatched by a :class:`JobWatcher`."""
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    """
+    Describes a function registered with :meth:`JobWatcher.subscribe`.
+
+    Parameters
+    ----------
+    callback : callable
+        Function to call.
+    event_types : frozenset of JobEventType or None
+        Types of event to dispatch to the function, or ``None`` for all types.
+    job_ids : frozenset of str or None
+        IDs of the jobs to dispatch events for, or ``None`` for all jobs.
+    """
+
+    callback: JobEventCallback
+    event_types: Optional[FrozenSet[JobEventType]]
+    job_ids: Optional[FrozenSet[str]]
+
+    def matches(self, event: JobEvent) -> bool:
+        """
+        Whether an event should be dispatched to this subscription.
+
+        Parameters
+        ----------
+        event : JobEvent
+            Event to dispatch.
+
+        Returns
+        -------
+        bool
+            ``True`` if the function should be called with the event.
+        """
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        return self.job_ids is None or event.job.id in self.job_ids
+
+
+def _derive_events(job: AsyncJob, previous: Optional[_JobState]) -> List[JobEvent]:
+    """
+    Derive the events that describe a change to a job.
+
+    A job that completes between two polls is reported as started before it is reported as
+    succeeded or failed, as long as it has an execution date.
+
+    Parameters
+    ----------
+    job : AsyncJob
+        Job in its current state.
+    previous : tuple of JobStatus and int or None, or None
+        Status and position of the job when it was last observed, or ``None`` if the job has not
+        been observed before.
+
+    Returns
+    -------
+    list of JobEvent
+        Events in the order in which they occurred.
+    """
+    events = []
+    status = job.status
+    if previous is None:
+        events.append(JobEvent(JobEventType.Submitted, job))
+        previous_status, previous_position = None, None
+    else:
+        previous_status, previous_position = previous
+
+    if status is previous_status:
+        if status is JobStatus.Pending and job.position != previous_position:
+            events.append(
+                JobEvent(JobEventType.PositionChanged, job, previous_status, previous_position)
+            )
+        return events
+
+    if previous_status in (None, JobStatus.Pending) and (
+        status is JobStatus.Running
+        or (status in _COMPLETED_STATUSES and job.execution_date_time is not None)
+    ):
+        events.append(JobEvent(JobEventType.Started, job, previous_status, previous_position))
+        previous_status, previous_position = JobStatus.Running, None
+    if status is JobStatus.Succeeded:
+        events.append(JobEvent(JobEventType.Succeeded, job, previous_status, previous_position))
+    elif status in _FAILED_STATUSES:
+        events.append(JobEvent(JobEventType.Failed, job, previous_status, previous_position))
+    return events
+
+
+class JobWatcher:
+    """
+    Polls the job queue in a background thread and dispatches job status-change events.
+
+    A single watcher can serve any number of subscribers, so that code waiting for different jobs
+    in the same process shares one request for the list of jobs per polling interval.
+
+    The watcher observes every change that the client applies to its jobs, so jobs updated by
+    other calls such as :attr:`.JobQueueApiClient.jobs` or :meth:`.AsyncJob.update` also raise
+    events. Callbacks are always called on the watcher thread, in the order in which the changes
+    were observed. Exceptions raised by callbacks are logged and otherwise ignored.
+
+    Jobs that exist when the watcher is started do not raise :attr:`~JobEventType.Submitted`
+    events.
+
+    .. versionadded:: 1.4
+
+    Parameters
+    ----------
+    client : JobQueueApiClient
+        Client used to poll the job queue.
+    interval : float, optional
+        Time between requests for the list of jobs, in seconds. Defaults to the polling interval
+        in the job queue processing configuration of the server.
+
+    Examples
+    --------
+    >>> def on_completed(event: JobEvent) -> None:
+    ...     print(f"{event.job.name}: {event.event_type.name}")
+    >>> with JobWatcher(client, interval=5.0) as watcher:
+    ...     watcher.subscribe(
+    ...         on_completed, event_types=[JobEventType.Succeeded, JobEventType.Failed]
+    ...     )
+    ...     job = client.create_job(job_request)
+    ...     ...
+    Excel import: Succeeded
+    """
+
+    def __init__(self, client: "JobQueueApiClient", interval: Optional[float] = None) -> None:
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be greater than 0.")
+        self._client = client
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._subscriptions: Tuple[_Subscription, ...] = ()
+        self._states: Dict[str, _JobState] = {}
+        self._events: "queue.SimpleQueue[Optional[JobEvent]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        state = "running" if self.is_running else "stopped"
+        return f"<{type(self).__name__}: {state}, subscriptions: {len(self._subscriptions)}>"
+
+    def __enter__(self) -> "JobWatcher":
+        """Start the watcher if it is not running."""
+        if not self.is_running:
+            self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Stop the watcher."""
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether the watcher thread is running.
+
+        Returns
+        -------
+        bool
+            ``True`` if the watcher has been started and not stopped.
+        """
+        return self._thread is not None
+
+    def subscribe(
+        self,
+        callback: JobEventCallback,
+        event_types: Optional[Iterable[JobEventType]] = None,
+        jobs: Optional[Iterable[Union[AsyncJob, str]]] = None,
+    ) -> None:
+        """
+        Register a function to call with job events.
+
+        Parameters
+        ----------
+        callback : callable
+            Function that takes a :class:`JobEvent` object.
+        event_types : iterable of JobEventType, optional
+            Types of event to call the function with. Defaults to all types.
+        jobs : iterable of AsyncJob or str, optional
+            Jobs, or IDs of jobs, to call the function for. Defaults to all jobs.
+        """
+        subscription = _Subscription(
+            callback=callback,
+            event_types=frozenset(event_types) if event_types is not None else None,
+            job_ids=(
+                frozenset(job.id if isinstance(job, AsyncJob) else job for job in jobs)
+                if jobs is not None
+                else None
+            ),
+        )
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+
+    def unsubscribe(self, callback: JobEventCallback) -> None:
+        """
+        Unregister a function registered with :meth:`subscribe`.
+
+        If the function was registered more than once, all registrations are removed.
+
+        Parameters
+        ----------
+        callback : callable
+            Function to unregister.
+
+        Raises
+        ------
+        ValueError
+            If the function is not registered.
+        """
+        with self._lock:
+            subscriptions = tuple(s for s in self._subscriptions if s.callback != callback)
+            if len(subscriptions) == len(self._subscriptions):
+                raise ValueError(f"Callback {callback!r} is not subscribed.")
+            self._subscriptions = subscriptions
+
+    def start(self) -> None:
+        """
+        Start polling the job queue in a background thread.
+
+        The list of jobs is requested once before this method returns. Jobs in this list are
+        treated as already known, and do not raise events until they next change.
+
+        Raises
+        ------
+        RuntimeError
+            If the watcher is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError("The job watcher is already running.")
+        interval = self._interval
+        if interval is None:
+            interval = self._client.processing_configuration.polling_interval_in_milliseconds / 1000
+
+        self._client._refetch_jobs()
+        with self._lock:
+            self._states = {job.id: _get_state(job) for job in self._client._get_known_jobs()}
+        self._client._register_job_watcher(self)
+
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="JobWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop polling the job queue and wait for the watcher thread to finish.
+
+        Events that were observed before the watcher was stopped are dispatched before the thread
+        finishes. Stopping a watcher that is not running has no effect.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait for the watcher thread to finish, in seconds. Defaults to no
+            limit.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._client._unregister_job_watcher(self)
+        self._thread = None
+        self._events.put(None)
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self, interval: float) -> None:
+        """
+        Poll the job queue and dispatch events until the watcher is stopped.
+
+        Parameters
+        ----------
+        interval : float
+            Time between requests for the list of jobs, in seconds.
+        """
+        while True:
+            if not self._dispatch_until(time.monotonic() + interval):
+                return
+            try:
+                self._client._refetch_jobs()
+            except Exception as e:
+                logger.warning(f"Job watcher failed to refresh the list of jobs: {e!r}")
+
+    def _dispatch_until(self, deadline: float) -> bool:
+        """
+        Dispatch observed events as they arrive until a deadline.
+
+        Parameters
+        ----------
+        deadline : float
+            Value of :func:`time.monotonic` at which to return.
+
+        Returns
+        -------
+        bool
+            ``False`` if the watcher was stopped, otherwise ``True``.
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                event = (
+                    self._events.get(timeout=remaining)
+                    if remaining > 0
+                    else self._events.get_nowait()
+                )
+            except queue.Empty:
+                return True
+            if event is None:
+                return False
+            self._dispatch(event)
+
+    def _dispatch(self, event: JobEvent) -> None:
+        """
+        Call each matching subscriber with an event.
+
+        Parameters
+        ----------
+        event : JobEvent
+            Event to dispatch.
+        """
+        for subscription in self._subscriptions:
+            if not subscription.matches(event):
+                continue
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                logger.warning(
+                    f"Job event callback {subscription.callback!r} raised an exception: {e!r}"
+                )
+
+    def _observe(self, updated: Iterable[AsyncJob], removed: Iterable[AsyncJob] = ()) -> None:
+        """
+        Queue events for jobs that were added, changed, or deleted by the client.
+
+        This method is called by the client on the thread that applied the changes.
+
+        Parameters
+        ----------
+        updated : iterable of AsyncJob
+            Jobs that were added or changed.
+        removed : iterable of AsyncJob, default: ()
+            Jobs that were deleted from the server.
+        """
+        with self._lock:
+            for job in updated:
+                if job.status is JobStatus.Deleted:
+                    self._observe_deleted(job)
+                    continue
+                events = _derive_events(job, self._states.get(job.id))
+                self._states[job.id] = _get_state(job)
+                for event in events:
+                    self._events.put(event)
+            for job in removed:
+                self._observe_deleted(job)
+
+    def _observe_deleted(self, job: AsyncJob) -> None:
+        """
+        Queue a deleted event for a job, unless the job has already been reported as deleted.
+
+        Parameters
+        ----------
+        job : AsyncJob
+            Job that was deleted from the server.
+        """
+        previous = self._states.pop(job.id, None)
+        if previous is not None:
+            self._events.put(JobEvent(JobEventType.Deleted, job, *previous))
+
+
+def _get_state(job: AsyncJob) -> _JobState:
+    """
+    Get the status and position of a job.
+
+    Parameters
+    ----------
+    job : AsyncJob
+        Job to inspect.
+
+    Returns
+    -------
+    tuple of JobStatus and int or None
+        Status and position of the job.
+    """
+    return job.status, job.position
@@ -23,7 +23,8 @@
 import datetime
 import pathlib
 import time
-from typing import List, Tuple, cast
+from typing import Any, List, Optional, Tuple, cast
+import uuid
 
 from ansys.grantami.serverapi_openapi.v2025r2 import api, models
 from ansys.openapi.common import ApiClient
@@ -63,6 +64,29 @@ def generate_now():
         return datetime.datetime.now(datetime.timezone.utc)
 
 
+def build_gsa_job(
+    job_id: Optional[str] = None,
+    status: models.GsaJobStatus = models.GsaJobStatus.PENDING,
+    position: Optional[int] = 1,
+    job_type: str = "ExcelImportJob",
+    **kwargs: Any,
+) -> models.GsaJob:
+    """Build a job model as returned by the server, with all required fields populated."""
+    fields = {
+        "id": job_id or str(uuid.uuid4()),
+        "name": "Job",
+        "description": None,
+        "status": status,
+        "type": job_type,
+        "position": position,
+        "submitter_name": "User_1",
+        "submission_date": generate_now(),
+        "submitter_roles": ["Role1"],
+    }
+    fields.update(kwargs)
+    return models.GsaJob(**fields)
+
+
 def _get_table_guid(client: ApiClient) -> str:
     schema_tables_api = api.SchemaTablesApi(client)
     all_tables = schema_tables_api.get_tables(
@@ -253,3 +253,93 @@ def test_job_with_no_output(job_model, job_specific_outputs):
     job_model.job_specific_outputs = job_specific_outputs
     async_job = AsyncJob(job_model, api.JobQueueApi(Mock()))
     assert async_job.output_information is None
+
+
+def test_update_job_reports_changes(asyncjob, job_model):
+    assert asyncjob._update_job(job_model) is False
+
+    job_model.position = 2
+    assert asyncjob._update_job(job_model) is True
+    assert asyncjob.position == 2
+
+
+class TestOutputInformation:
+    @pytest.fixture
+    def job(self, job_model):
+        job_model.job_specific_outputs = {
+            "summary": json.dumps({"FinishedSuccessfully": True}),
+            "placement": json.dumps([{"Record": i} for i in range(10)]),
+        }
+        return AsyncJob(job_model, api.JobQueueApi(Mock()))
+
+    @pytest.fixture
+    def loads(self, monkeypatch):
+        loads = Mock(side_effect=json.loads)
+        monkeypatch.setattr("ansys.grantami.jobqueue._models.json.loads", loads)
+        return loads
+
+    def test_output_information_is_a_dict(self, job):
+        output_information = job.output_information
+
+        assert isinstance(output_information, dict)
+        assert json.loads(json.dumps(output_information)) == output_information
+        output_information["extra"] = 1
+
+    def test_output_information_is_parsed_on_first_access(self, job, loads):
+        assert loads.call_count == 0
+        assert job.output_information["summary"] == {"FinishedSuccessfully": True}
+        assert loads.call_count == 2
+
+    def test_view_parses_values_on_access(self, job, loads):
+        view = job._get_output_information_view()
+
+        assert set(view) == {"summary", "placement"}
+        assert loads.call_count == 0
+        assert view["summary"] == {"FinishedSuccessfully": True}
+        assert loads.call_count == 1
+
+    def test_import_job_status_parses_only_summary(self, job, job_model, loads):
+        job_model.status = models.GsaJobStatus.SUCCEEDED
+        job = ImportJob(job_obj=job_model, job_queue_api=api.JobQueueApi(Mock()))
+
+        assert job.status == JobStatus.Succeeded
+        assert loads.call_count == 1
+
+    def test_changes_to_output_information_do_not_affect_status(self, job_model):
+        job_model.status = models.GsaJobStatus.SUCCEEDED
+        job_model.job_specific_outputs = {"summary": json.dumps({"FinishedSuccessfully": True})}
+        job = ImportJob(job_obj=job_model, job_queue_api=api.JobQueueApi(Mock()))
+        assert job.status == JobStatus.Succeeded
+
+        job.output_information["summary"]["FinishedSuccessfully"] = False
+
+        assert job.status == JobStatus.Succeeded
+        assert job._get_output_information_view()["summary"] == {"FinishedSuccessfully": True}
+
+    def test_parsed_values_are_reused(self, job, loads):
+        for _ in range(3):
+            job.output_information["summary"]
+
+        assert loads.call_count == 2
+        assert job.output_information is job.output_information
+
+    def test_update_without_changes_keeps_parsed_values(self, job, job_model, loads):
+        job.output_information["summary"]
+        job._update_job(job_model)
+        job.output_information["summary"]
+
+        assert loads.call_count == 2
+
+    def test_update_with_changes_discards_parsed_values(self, job, job_model):
+        job.output_information["summary"]
+        job_model.job_specific_outputs = {"summary": json.dumps({"FinishedSuccessfully": False})}
+        job._update_job(job_model)
+
+        assert job.output_information == {"summary": {"FinishedSuccessfully": False}}
+
+
+@pytest.mark.parametrize("job_type", ["ExcelImportJob", "TextImportJob", "ExcelExportJob", "Other"])
+def test_jobs_have_no_instance_dict(job_model, job_type):
+    job_model.type = job_type
+    job = AsyncJob.create_job(job_model, api.JobQueueApi(Mock()))
+    assert not hasattr(job, "__dict__")
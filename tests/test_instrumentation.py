@@ -0,0 +1,278 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys
+import types
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+from ansys.openapi.common import ApiException, SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import (
+    AsyncJob,
+    JobQueueApiClient,
+    LatencyAggregator,
+    OpenTelemetryHook,
+    RequestEvent,
+    RetryPolicy,
+)
+from ansys.grantami.jobqueue._streaming import OUTPUT_FILE_PATH, UPLOAD_PATH, _StreamingUpload
+from common import build_gsa_job
+
+JOB_PATH = "/v1alpha/job-queue/jobs/{id}"
+
+
+def build_event(endpoint=JOB_PATH, status_code=200, elapsed_seconds=0.1, **kwargs):
+    values = {"method": "GET", "bytes_sent": 0, "bytes_received": 100, "start_time": 1000.0}
+    values.update(kwargs)
+    return RequestEvent(
+        endpoint=endpoint, status_code=status_code, elapsed_seconds=elapsed_seconds, **values
+    )
+
+
+@pytest.fixture
+def client():
+    client = JobQueueApiClient(
+        requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+    )
+    client.setup_client(models)
+    client.retry_policy = None
+    return client
+
+
+@pytest.fixture
+def events(client):
+    received = []
+    client.add_request_hook(received.append)
+    return received
+
+
+class TestLatencyAggregator:
+    def test_percentiles(self):
+        aggregator = LatencyAggregator()
+        for i in range(1, 101):
+            aggregator(build_event(elapsed_seconds=i / 1000))
+
+        stats = aggregator.statistics[f"GET {JOB_PATH}"]
+
+        assert stats.count == 100
+        assert stats.p50 == pytest.approx(0.050)
+        assert stats.p95 == pytest.approx(0.095)
+        assert stats.p99 == pytest.approx(0.099)
+        assert stats.total_seconds == pytest.approx(5.05)
+        assert stats.bytes_received == 10000
+
+    def test_endpoints_are_aggregated_separately(self):
+        aggregator = LatencyAggregator()
+        aggregator(build_event())
+        aggregator(build_event(method="PATCH"))
+        aggregator(build_event(endpoint="/v1alpha/job-queue/jobs", status_code=None))
+
+        stats = aggregator.statistics
+
+        assert set(stats) == {
+            f"GET {JOB_PATH}",
+            f"PATCH {JOB_PATH}",
+            "GET /v1alpha/job-queue/jobs",
+        }
+        assert stats["GET /v1alpha/job-queue/jobs"].errors == 1
+        assert stats[f"GET {JOB_PATH}"].errors == 0
+
+    def test_percentiles_use_recent_samples(self):
+        aggregator = LatencyAggregator(max_samples=10)
+        for _ in range(10):
+            aggregator(build_event(elapsed_seconds=10.0))
+        for _ in range(10):
+            aggregator(build_event(elapsed_seconds=0.1))
+
+        stats = aggregator.statistics[f"GET {JOB_PATH}"]
+
+        assert stats.count == 20
+        assert stats.p99 == 0.1
+
+    def test_reset(self):
+        aggregator = LatencyAggregator()
+        aggregator(build_event())
+        aggregator.reset()
+
+        assert aggregator.statistics == {}
+
+    def test_invalid_max_samples(self):
+        with pytest.raises(ValueError, match="max_samples"):
+            LatencyAggregator(max_samples=0)
+
+
+class TestClientHooks:
+    def test_api_calls_are_reported(self, client, events, requests_mock):
+        requests_mock.patch(client.api_url + JOB_PATH.format(id="job-id"), json={"id": "job-id"})
+
+        client.call_api(
+            JOB_PATH, "PATCH", path_params={"id": "job-id"}, body={"description": "New"}
+        )
+
+        (event,) = events
+        assert event.method == "PATCH"
+        assert event.endpoint == JOB_PATH
+        assert event.status_code == 200
+        assert event.succeeded
+        assert event.bytes_sent == len(requests_mock.last_request.body)
+        assert event.bytes_received == len(b'{"id": "job-id"}')
+        assert event.elapsed_seconds >= 0
+
+    def test_each_attempt_is_reported(self, client, events, requests_mock, monkeypatch):
+        monkeypatch.setattr("ansys.grantami.jobqueue._retry.time.sleep", Mock())
+        client.retry_policy = RetryPolicy()
+        requests_mock.get(
+            client.api_url + "/v1alpha/job-queue/current-user",
+            [{"status_code": 503}, {"json": {"username": "User", "isAdmin": False}}],
+        )
+
+        client.job_queue_api.get_current_user()
+
+        assert [event.status_code for event in events] == [503, 200]
+        assert not events[0].succeeded
+
+    def test_connection_errors_are_reported(self, client, events, requests_mock):
+        requests_mock.get(
+            client.api_url + "/v1alpha/job-queue/jobs", exc=requests.exceptions.ConnectTimeout
+        )
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            client.call_api("/v1alpha/job-queue/jobs", "GET")
+
+        (event,) = events
+        assert event.status_code is None
+        assert isinstance(event.error, requests.exceptions.ConnectTimeout)
+
+    def test_hook_errors_are_ignored(self, client, requests_mock):
+        client.add_request_hook(Mock(side_effect=RuntimeError("Hook failed")))
+        requests_mock.get(client.api_url + "/v1alpha/job-queue/jobs", json={"results": []})
+
+        client.call_api("/v1alpha/job-queue/jobs", "GET")
+
+    def test_hooks_can_be_removed(self, client, requests_mock):
+        hook = Mock()
+        client.add_request_hook(hook)
+        client.remove_request_hook(hook)
+        requests_mock.get(client.api_url + "/v1alpha/job-queue/jobs", json={"results": []})
+
+        client.call_api("/v1alpha/job-queue/jobs", "GET")
+
+        hook.assert_not_called()
+        with pytest.raises(ValueError, match="not registered"):
+            client.remove_request_hook(hook)
+
+    def test_streamed_upload_is_reported(self, client, events, requests_mock, tmp_path):
+        path = tmp_path / "data.txt"
+        path.write_bytes(b"x" * 1000)
+        requests_mock.post(
+            client.api_url + UPLOAD_PATH, text="file-id", headers={"Content-Type": "text/plain"}
+        )
+
+        _StreamingUpload(chunk_size=100).upload_file(client, path)
+
+        (event,) = events
+        assert (event.method, event.endpoint) == ("POST", UPLOAD_PATH)
+        assert event.bytes_sent > 1000
+        assert event.bytes_received == len("file-id")
+
+    def test_streamed_download_is_reported_on_close(self, client, events, requests_mock):
+        job = AsyncJob.create_job(
+            build_gsa_job(status=models.GsaJobStatus.SUCCEEDED, output_file_names=["Export.zip"]),
+            api.JobQueueApi(client),
+        )
+        requests_mock.get(client.api_url + OUTPUT_FILE_PATH.format(id=job.id), content=b"x" * 5000)
+
+        with job.open_output("Export.zip") as stream:
+            stream.read(1000)
+            assert events == []
+
+        (event,) = events
+        assert (event.method, event.endpoint) == ("GET", OUTPUT_FILE_PATH)
+        assert event.bytes_received == 1000
+
+    def test_failed_download_is_reported(self, client, events, requests_mock):
+        job = AsyncJob.create_job(
+            build_gsa_job(status=models.GsaJobStatus.SUCCEEDED, output_file_names=["Export.zip"]),
+            api.JobQueueApi(client),
+        )
+        requests_mock.get(client.api_url + OUTPUT_FILE_PATH.format(id=job.id), status_code=404)
+
+        with pytest.raises(ApiException):
+            job.open_output("Export.zip")
+
+        (event,) = events
+        assert event.status_code == 404
+
+
+class TestOpenTelemetryHook:
+    @pytest.fixture
+    def trace(self, monkeypatch):
+        trace = types.ModuleType("opentelemetry.trace")
+        trace.SpanKind = Mock()
+        trace.Status = Mock()
+        trace.StatusCode = Mock()
+        trace.get_tracer = Mock()
+        package = types.ModuleType("opentelemetry")
+        package.trace = trace
+        monkeypatch.setitem(sys.modules, "opentelemetry", package)
+        monkeypatch.setitem(sys.modules, "opentelemetry.trace", trace)
+        return trace
+
+    def test_span_is_emitted(self, trace):
+        tracer = Mock()
+        hook = OpenTelemetryHook(tracer)
+
+        hook(build_event(start_time=1.5, elapsed_seconds=0.25, status_code=200))
+
+        tracer.start_span.assert_called_once()
+        args, kwargs = tracer.start_span.call_args
+        assert args == (f"GET {JOB_PATH}",)
+        assert kwargs["start_time"] == 1_500_000_000
+        assert kwargs["attributes"]["http.response.status_code"] == 200
+        assert kwargs["attributes"]["url.template"] == JOB_PATH
+        span = tracer.start_span.return_value
+        span.set_status.assert_not_called()
+        span.end.assert_called_once_with(end_time=1_750_000_000)
+
+    def test_failed_request_sets_error_status(self, trace):
+        tracer = Mock()
+        error = ConnectionError("Connection refused")
+
+        OpenTelemetryHook(tracer)(build_event(status_code=None, error=error))
+
+        span = tracer.start_span.return_value
+        span.record_exception.assert_called_once_with(error)
+        span.set_status.assert_called_once()
+
+    def test_global_tracer_is_used_by_default(self, trace):
+        OpenTelemetryHook()
+
+        trace.get_tracer.assert_called_once_with("ansys.grantami.jobqueue")
+
+    def test_missing_package_raises_import_error(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "opentelemetry", None)
+
+        with pytest.raises(ImportError, match="opentelemetry-api"):
+            OpenTelemetryHook()
@@ -20,8 +20,74 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import ast
+import inspect
+import subprocess
+import sys
+
+import pytest
+
+import ansys.grantami.jobqueue as jobqueue
+from ansys.grantami.jobqueue import UploadCache
+
 
 def test_date_creation(now, tomorrow):
     assert now.tzinfo is not None
     assert tomorrow.tzinfo is not None
     assert tomorrow > now
+
+
+def test_package_import_is_lazy():
+    code = (
+        "import sys\n"
+        "import ansys.grantami.jobqueue\n"
+        "print(sorted(m for m in sys.modules if m.startswith(('ansys.grantami.', 'requests'))))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "['ansys.grantami.jobqueue']"
+
+
+@pytest.mark.parametrize("name", jobqueue.__all__)
+def test_public_names_resolve(name):
+    value = getattr(jobqueue, name)
+
+    assert value.__name__ == name
+    assert value.__module__ == f"ansys.grantami.jobqueue{jobqueue._LAZY_IMPORTS[name]}"
+
+
+def test_public_names_are_imported_for_type_checking():
+    tree = ast.parse(inspect.getsource(jobqueue))
+    type_checking_block = next(node for node in tree.body if isinstance(node, ast.If))
+    imported_names = {
+        alias.name: f".{node.module}"
+        for node in type_checking_block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+    assert imported_names == jobqueue._LAZY_IMPORTS
+
+
+def test_lightweight_names_do_not_import_server_api():
+    code = (
+        "import sys\n"
+        "from ansys.grantami.jobqueue import ConnectionPoolConfiguration, PollingStrategy, "
+        "RetryPolicy, UploadCache\n"
+        "print('ansys.grantami.serverapi_openapi' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_public_names_are_resolved_on_access():
+    assert jobqueue.UploadCache is UploadCache
+    assert jobqueue.__version__
+    assert set(jobqueue.__all__) <= set(dir(jobqueue))
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        jobqueue.Missing
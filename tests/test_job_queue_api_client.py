@@ -0,0 +1,569 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from copy import copy
+import sys
+import threading
+import time
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+from ansys.openapi.common import ApiException, SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import (
+    AsyncJob,
+    ExportJob,
+    FixedPollingStrategy,
+    ImportJob,
+    JobQueueApiClient,
+    JobQueueProcessingConfiguration,
+    JobStatus,
+    TextImportJobRequest,
+    UploadCache,
+    WaitCondition,
+)
+from common import build_gsa_job
+
+
+@pytest.fixture
+def client():
+    client = JobQueueApiClient(
+        requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+    )
+    client.job_queue_api = Mock(spec=api.JobQueueApi)
+    client.job_queue_api.api_client = client
+    client._processing_configuration = JobQueueProcessingConfiguration(
+        purge_job_age_in_milliseconds=86400000,
+        purge_interval_in_milliseconds=3600000,
+        polling_interval_in_milliseconds=100,
+        concurrency=1,
+    )
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr("ansys.grantami.jobqueue._connection.time.sleep", calls.append)
+    return calls
+
+
+def set_remote_jobs(client, jobs):
+    client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(results=jobs)
+
+
+class TestReconcileJobs:
+    def test_new_jobs_are_added(self, client):
+        remote = [build_gsa_job(), build_gsa_job(job_type="ExcelExportJob")]
+        delta = client._reconcile_jobs(remote)
+
+        assert [job.id for job in delta.added] == [job.id for job in remote]
+        assert not delta.changed
+        assert not delta.removed
+        assert isinstance(delta.added[0], ImportJob)
+        assert isinstance(delta.added[1], ExportJob)
+
+    def test_unchanged_jobs_are_not_reported(self, client):
+        remote = [build_gsa_job(), build_gsa_job()]
+        client._reconcile_jobs(remote)
+        delta = client._reconcile_jobs(remote)
+
+        assert not delta.added
+        assert not delta.changed
+        assert not delta.removed
+
+    def test_changed_jobs_are_updated_in_place(self, client):
+        remote = build_gsa_job()
+        job = client._reconcile_jobs([remote]).added[0]
+
+        remote.status = models.GsaJobStatus.RUNNING
+        remote.position = None
+        delta = client._reconcile_jobs([remote])
+
+        assert delta.changed == [job]
+        assert job.status == JobStatus.Running
+        assert job.position is None
+        assert client.get_job_by_id(remote.id) is job
+
+    def test_missing_jobs_are_kept_without_flush(self, client):
+        first, second = build_gsa_job(), build_gsa_job()
+        client._reconcile_jobs([first, second])
+        delta = client._reconcile_jobs([first])
+
+        assert not delta.removed
+        assert len(client._jobs) == 2
+
+    def test_missing_jobs_are_removed_with_flush(self, client):
+        first, second = build_gsa_job(), build_gsa_job()
+        client._reconcile_jobs([first, second])
+        delta = client._reconcile_jobs([first], flush_jobs=True)
+
+        assert [job.id for job in delta.removed] == [second.id]
+        assert delta.removed[0].status == JobStatus.Deleted
+        assert list(client._jobs) == [first.id]
+
+    def test_concurrent_reconciliation(self, client):
+        remote = [build_gsa_job() for _ in range(200)]
+        client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(results=[])
+        errors = []
+
+        def reconcile(index):
+            try:
+                for iteration in range(50):
+                    # Each thread removes a different half of the jobs on each iteration
+                    client._reconcile_jobs(remote[(index + iteration) % 2 :: 2], flush_jobs=True)
+                    client.jobs_where()
+                    client.jobs_table(refresh=False)
+            except Exception as e:
+                errors.append(e)
+
+        # Switch threads often, so that unsynchronized access to the job list fails reliably
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=reconcile, args=(index,)) for index in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+
+
+def test_undefined_objects_are_deserialized_without_warning(requests_mock):
+    client = JobQueueApiClient(
+        requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+    )
+    client.setup_client(models)
+    remote = build_gsa_job(job_specific_outputs={"summary": '{"FinishedSuccessfully": true}'})
+    requests_mock.get(
+        client.api_url + "/v1alpha/job-queue/jobs",
+        json={"results": [client.sanitize_for_serialization(remote)]},
+    )
+
+    # Warnings are raised as errors by the test configuration
+    jobs = client.jobs
+
+    assert jobs[0].output_information == {"summary": {"FinishedSuccessfully": True}}
+
+
+def test_jobs_sorted_by_position(client):
+    remote = [
+        build_gsa_job(status=models.GsaJobStatus.SUCCEEDED, position=None),
+        build_gsa_job(position=2),
+        build_gsa_job(position=1),
+    ]
+    set_remote_jobs(client, remote)
+
+    assert [job.id for job in client.jobs] == [remote[2].id, remote[1].id, remote[0].id]
+
+
+def test_jobs_where_returns_only_matching_jobs(client):
+    matching, other = build_gsa_job(name="Match"), build_gsa_job()
+    set_remote_jobs(client, [matching, other])
+    client.jobs
+
+    set_remote_jobs(client, [matching])
+    jobs = client.jobs_where(name="Match")
+
+    assert [job.id for job in jobs] == [matching.id]
+    assert len(client._jobs) == 2
+
+
+def test_delete_jobs_removes_jobs_from_registry(client):
+    first, second = build_gsa_job(), build_gsa_job()
+    set_remote_jobs(client, [first, second])
+    jobs = client.jobs
+
+    set_remote_jobs(client, [second])
+    client.delete_jobs([jobs[0]])
+
+    client.job_queue_api.delete_job.assert_called_once_with(id=first.id)
+    assert jobs[0].status == JobStatus.Deleted
+    assert list(client._jobs) == [second.id]
+
+
+def test_get_job_by_id_unknown_job_raises_key_error(client):
+    with pytest.raises(KeyError):
+        client.get_job_by_id("unknown")
+
+
+class TestRefreshJobs:
+    @staticmethod
+    def track(client, remote):
+        return client._reconcile_jobs(remote).added
+
+    def test_few_jobs_are_requested_individually(self, client):
+        remote = [build_gsa_job(), build_gsa_job()]
+        jobs = self.track(client, remote)
+        for job_obj in remote:
+            job_obj.status = models.GsaJobStatus.RUNNING
+        client.job_queue_api.get_job.side_effect = lambda id: {j.id: j for j in remote}[id]
+
+        client.refresh_jobs(jobs, max_workers=2)
+
+        assert client.job_queue_api.get_job.call_count == 2
+        client.job_queue_api.get_jobs.assert_not_called()
+        assert all(job.status == JobStatus.Running for job in jobs)
+
+    def test_many_jobs_are_requested_with_one_list_call(self, client):
+        remote = [build_gsa_job() for _ in range(5)]
+        jobs = self.track(client, remote)
+        for job_obj in remote:
+            job_obj.status = models.GsaJobStatus.SUCCEEDED
+        set_remote_jobs(client, remote)
+
+        client.refresh_jobs(jobs, max_workers=2)
+
+        client.job_queue_api.get_jobs.assert_called_once_with(
+            job_type="ExcelImportJob", submitter_name_filter="User_1"
+        )
+        client.job_queue_api.get_job.assert_not_called()
+        assert all(job.status == JobStatus.Succeeded for job in jobs)
+
+    def test_mixed_jobs_are_requested_without_filter(self, client):
+        remote = [build_gsa_job(job_type="ExcelExportJob"), build_gsa_job(), build_gsa_job()]
+        jobs = self.track(client, remote)
+        set_remote_jobs(client, remote)
+
+        client.refresh_jobs(jobs, max_workers=1)
+
+        client.job_queue_api.get_jobs.assert_called_once_with(
+            job_type=None, submitter_name_filter="User_1"
+        )
+
+    def test_missing_job_in_list_is_deleted(self, client):
+        remote = [build_gsa_job() for _ in range(3)]
+        jobs = self.track(client, remote)
+        set_remote_jobs(client, remote[1:])
+
+        client.refresh_jobs(jobs, max_workers=1)
+
+        assert jobs[0].status == JobStatus.Deleted
+        assert remote[0].id not in client._jobs
+
+    def test_missing_job_individually_is_deleted(self, client):
+        remote = build_gsa_job()
+        job = self.track(client, [remote])[0]
+        client.job_queue_api.get_job.side_effect = ApiException(404, "Not Found")
+
+        client.refresh_jobs([job])
+
+        assert job.status == JobStatus.Deleted
+
+    def test_other_errors_are_raised(self, client):
+        job = self.track(client, [build_gsa_job()])[0]
+        client.job_queue_api.get_job.side_effect = ApiException(500, "Internal Server Error")
+
+        with pytest.raises(ApiException):
+            client.refresh_jobs([job])
+
+    def test_untracked_jobs_are_updated(self, client):
+        remote = build_gsa_job()
+        job = AsyncJob.create_job(remote, client.job_queue_api)
+        remote.status = models.GsaJobStatus.RUNNING
+        client.job_queue_api.get_job.return_value = remote
+
+        client.refresh_jobs([job])
+
+        assert job.status == JobStatus.Running
+
+    def test_update_with_other_jobs(self, client):
+        remote = [build_gsa_job(), build_gsa_job()]
+        jobs = self.track(client, remote)
+        client.job_queue_api.get_job.side_effect = lambda id: {j.id: j for j in remote}[id]
+
+        jobs[0].update(other_jobs=jobs[1:])
+
+        assert client.job_queue_api.get_job.call_count == 2
+
+
+class TestWaitForJobs:
+    @pytest.fixture
+    def remote(self):
+        return [build_gsa_job() for _ in range(20)]
+
+    @pytest.fixture
+    def jobs(self, client, remote):
+        return client._reconcile_jobs(remote).added
+
+    @staticmethod
+    def complete_in_cycles(client, remote, cycles):
+        """Complete the job at remote[i] during polling cycle cycles[i] (1-based)."""
+        responses = []
+        for cycle in range(1, max(cycles) + 1):
+            for job_obj, completion_cycle in zip(remote, cycles):
+                if completion_cycle == cycle:
+                    job_obj.status = models.GsaJobStatus.SUCCEEDED
+            responses.append(models.GsaGetJobsResponse(results=[copy(j) for j in remote]))
+        client.job_queue_api.get_jobs.side_effect = responses
+
+    def test_all_completed_uses_one_list_call_per_cycle(self, client, remote, jobs, sleeps):
+        self.complete_in_cycles(client, remote, [1] * 5 + [3] * 15)
+
+        done, not_done = client.wait_for_jobs(jobs, polling_strategy=FixedPollingStrategy(2.0))
+
+        assert done == jobs
+        assert not_done == []
+        assert client.job_queue_api.get_jobs.call_count == 3
+        client.job_queue_api.get_job.assert_not_called()
+        assert sleeps == [2.0, 2.0]
+
+    def test_first_completed(self, client, remote, jobs, sleeps):
+        self.complete_in_cycles(client, remote, [2] + [3] * 19)
+
+        done, not_done = client.wait_for_jobs(jobs, return_when=WaitCondition.FirstCompleted)
+
+        assert done == jobs[:1]
+        assert not_done == jobs[1:]
+
+    def test_any_failed(self, client, remote, jobs, sleeps):
+        remote[3].status = models.GsaJobStatus.FAILED
+        self.complete_in_cycles(client, remote, [1] + [3] * 19)
+
+        done, not_done = client.wait_for_jobs(jobs, return_when=WaitCondition.AnyFailed)
+
+        assert done == [jobs[0], jobs[3]]
+        assert client.job_queue_api.get_jobs.call_count == 1
+
+    def test_already_completed_jobs_are_not_refreshed(self, client, sleeps):
+        jobs = client._reconcile_jobs([build_gsa_job(status=models.GsaJobStatus.SUCCEEDED)]).added
+
+        done, not_done = client.wait_for_jobs(jobs)
+
+        assert done == jobs
+        client.job_queue_api.get_jobs.assert_not_called()
+        client.job_queue_api.get_job.assert_not_called()
+
+    def test_timeout_returns_incomplete_jobs(self, client, remote, jobs, monkeypatch):
+        set_remote_jobs(client, remote)
+        clock = iter(range(100))
+        monkeypatch.setattr(
+            "ansys.grantami.jobqueue._connection.time.monotonic", lambda: next(clock)
+        )
+        monkeypatch.setattr("ansys.grantami.jobqueue._connection.time.sleep", lambda _: None)
+
+        done, not_done = client.wait_for_jobs(jobs, timeout=3)
+
+        assert done == []
+        assert not_done == jobs
+
+    def test_as_completed_yields_in_completion_order(self, client, remote, jobs, sleeps):
+        cycles = [3, 1, 2, 3, 3, 1, 2, 3, 3, 3] * 2
+        self.complete_in_cycles(client, remote, cycles)
+
+        completed = list(client.as_completed(jobs))
+
+        expected = [job for cycle in (1, 2, 3) for job, c in zip(jobs, cycles) if c == cycle]
+        assert completed == expected
+
+    def test_as_completed_timeout(self, client, remote, jobs, monkeypatch):
+        set_remote_jobs(client, remote)
+        clock = iter(range(100))
+        monkeypatch.setattr(
+            "ansys.grantami.jobqueue._connection.time.monotonic", lambda: next(clock)
+        )
+        monkeypatch.setattr("ansys.grantami.jobqueue._connection.time.sleep", lambda _: None)
+
+        with pytest.raises(TimeoutError, match="20 of 20 jobs"):
+            list(client.as_completed(jobs, timeout=3))
+
+
+class TestCreateJobAndWait:
+    @pytest.fixture
+    def job_request(self):
+        job_request = Mock()
+        job_request._get_job_for_submission.return_value = None
+        return job_request
+
+    @pytest.fixture
+    def remote(self, client):
+        remote = build_gsa_job()
+        client.job_queue_api.create_job.return_value = remote
+        return remote
+
+    def test_polls_until_complete(self, client, job_request, remote, sleeps):
+        responses = [copy(remote) for _ in range(3)]
+        responses[-1].status = models.GsaJobStatus.SUCCEEDED
+        client.job_queue_api.get_job.side_effect = responses
+
+        job = client.create_job_and_wait(job_request, FixedPollingStrategy(0.5))
+
+        assert job.status == JobStatus.Succeeded
+        assert sleeps == [0.5, 0.5, 0.5]
+        job_request._post_files.assert_called_once()
+
+    def test_errors_are_not_retried_again(self, client, job_request, remote, sleeps):
+        # Requests are retried by the retry policy, which the mock API bypasses
+        client.job_queue_api.get_job.side_effect = ApiException(503, "Unavailable")
+
+        with pytest.raises(ApiException):
+            client.create_job_and_wait(job_request, FixedPollingStrategy(0.5))
+        assert client.job_queue_api.get_job.call_count == 1
+
+    def test_timeout_returns_pending_job(self, client, job_request, remote, sleeps):
+        client.job_queue_api.get_job.return_value = remote
+
+        job = client.create_job_and_wait(job_request, FixedPollingStrategy(0.5, timeout=0))
+
+        assert job.status == JobStatus.Pending
+        client.job_queue_api.get_job.assert_not_called()
+
+
+class TestCreateJobWithUploadCache:
+    @pytest.fixture
+    def job_request(self, tmp_path):
+        template = tmp_path / "template.xml"
+        template.write_text("<template/>")
+        data = tmp_path / "data.txt"
+        data.write_text("data")
+        return TextImportJobRequest(
+            name="Job", description=None, template_file=template, data_files=[data]
+        )
+
+    @pytest.fixture
+    def cached_client(self, client, job_request):
+        client.upload_cache = UploadCache()
+        ids = iter(range(1000))
+        client.job_queue_api.upload_file.side_effect = lambda file: f"id-{next(ids)}"
+        client.job_queue_api.create_job.side_effect = lambda body: build_gsa_job()
+        client.create_job(job_request)
+        return client
+
+    def test_cached_files_are_reused(self, cached_client, job_request):
+        cached_client.create_job(job_request)
+
+        assert cached_client.job_queue_api.upload_file.call_count == 2
+        assert cached_client.upload_cache.statistics.hits == 2
+
+    @pytest.mark.parametrize("status_code", [400, 404])
+    def test_rejected_file_ids_are_uploaded_again(self, cached_client, job_request, status_code):
+        cached_client.job_queue_api.create_job.side_effect = [
+            ApiException(status_code, "Unknown file ID"),
+            build_gsa_job(),
+        ]
+
+        cached_client.create_job(job_request)
+
+        assert cached_client.job_queue_api.upload_file.call_count == 4
+        assert cached_client.upload_cache.statistics.invalidations == 2
+        assert [file.file_id for file in job_request._files] == ["id-2", "id-3"]
+
+    @pytest.mark.parametrize("status_code", [403, 500, 502])
+    def test_other_errors_are_not_retried(self, cached_client, job_request, status_code):
+        cached_client.job_queue_api.create_job.side_effect = ApiException(status_code, "Error")
+
+        with pytest.raises(ApiException):
+            cached_client.create_job(job_request)
+        assert cached_client.job_queue_api.create_job.call_count == 2
+        assert cached_client.job_queue_api.upload_file.call_count == 2
+        assert cached_client.upload_cache.statistics.invalidations == 0
+
+    def test_errors_without_cached_files_are_raised(self, client, job_request):
+        client.upload_cache = UploadCache()
+        client.job_queue_api.upload_file.return_value = "id"
+        client.job_queue_api.create_job.side_effect = ApiException(400, "Bad Request")
+
+        with pytest.raises(ApiException):
+            client.create_job(job_request)
+        assert client.job_queue_api.create_job.call_count == 1
+
+
+class TestSubmitMany:
+    @pytest.fixture
+    def job_requests(self):
+        job_requests = []
+        for index in range(6):
+            job_request = Mock()
+            job_request.name = f"Job {index}"
+            job_request._post_files.return_value = set()
+            job_request._get_job_for_submission.return_value = job_request.name
+            job_requests.append(job_request)
+        return job_requests
+
+    @pytest.fixture
+    def created(self, client):
+        created = []
+
+        def create_job(body):
+            created.append(body)
+            return build_gsa_job(f"id-{body}", name=body)
+
+        client.job_queue_api.create_job.side_effect = create_job
+        return created
+
+    def test_results_match_requests(self, client, job_requests, created):
+        results = client.submit_many(job_requests, max_in_flight=3)
+
+        assert [result.job_request for result in results] == job_requests
+        assert all(result.succeeded for result in results)
+        assert [result.job.name for result in results] == [r.name for r in job_requests]
+        assert created == [r.name for r in job_requests]
+
+    def test_failures_do_not_abort_batch(self, client, job_requests, created):
+        upload_error = ApiException(500, "Internal Server Error")
+        job_requests[1]._post_files.side_effect = upload_error
+        create_error = ApiException(400, "Bad Request")
+
+        def create_job(body):
+            if body == "Job 3":
+                raise create_error
+            return build_gsa_job(f"id-{body}", name=body)
+
+        client.job_queue_api.create_job.side_effect = create_job
+
+        results = client.submit_many(job_requests)
+
+        assert [result.succeeded for result in results] == [True, False, True, False, True, True]
+        assert results[1].error is upload_error and results[1].job is None
+        assert results[3].error is create_error
+        assert len(client._jobs) == 4
+
+    def test_uploads_run_concurrently(self, client, job_requests, created):
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def upload(**kwargs):
+            with lock:
+                active.append(None)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return set()
+
+        for job_request in job_requests:
+            job_request._post_files.side_effect = upload
+
+        client.submit_many(job_requests, max_in_flight=2)
+
+        assert max(peak) == 2
+
+    def test_invalid_max_in_flight(self, client, job_requests):
+        with pytest.raises(ValueError, match="max_in_flight"):
+            client.submit_many(job_requests, max_in_flight=0)
@@ -23,10 +23,19 @@
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
 import sys
+import threading
+from unittest.mock import Mock
 
+from ansys.grantami.serverapi_openapi.v2025r2 import api
+from ansys.openapi.common import ApiException
 import pytest
 
-from ansys.grantami.jobqueue import ExcelImportJobRequest, JobFile, TextImportJobRequest
+from ansys.grantami.jobqueue import (
+    ExcelImportJobRequest,
+    FileUploadError,
+    JobFile,
+    TextImportJobRequest,
+)
 from common import (
     ATTACHMENT,
     EXCEL_IMPORT_COMBINED_FILE,
@@ -233,3 +242,96 @@ path_error = pytest.raises(
 def test_virtual_path_validation(virtual_path, expectation):
     with expectation:
         JobFile._validate_virtual_path(virtual_path)
+
+
+class TestPostFiles:
+    @pytest.fixture
+    def job_request(self):
+        return ExcelImportJobRequest(
+            name="TestPostFiles",
+            description=None,
+            template_file=EXCEL_IMPORT_TEMPLATE_FILE,
+            data_files=[EXCEL_IMPORT_DATA_FILE],
+            attachment_files=[JobFile(ATTACHMENT, f"attachment_{i}.bmp") for i in range(20)],
+        )
+
+    @pytest.fixture
+    def api_client(self):
+        api_client = Mock(spec=api.JobQueueApi)
+        # Return IDs that depend on the order in which uploads complete
+        counter = iter(range(1000))
+        lock = threading.Lock()
+
+        def upload_file(file):
+            with lock:
+                return f"id-{next(counter)}"
+
+        api_client.upload_file.side_effect = upload_file
+        return api_client
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_all_files_are_uploaded(self, job_request, api_client, max_workers):
+        job_request._post_files(api_client, max_workers=max_workers)
+
+        assert api_client.upload_file.call_count == len(job_request._files)
+        file_ids = [file.file_id for file in job_request._files]
+        assert len(set(file_ids)) == len(file_ids)
+
+    def test_file_ids_match_uploaded_files(self, job_request):
+        api_client = Mock(spec=api.JobQueueApi)
+        api_client.upload_file.side_effect = lambda file: f"id-{file}"
+
+        job_request._post_files(api_client, max_workers=8)
+
+        assert all(file.file_id == f"id-{file.path}" for file in job_request._files)
+
+    def test_failure_cancels_remaining_uploads(self, job_request):
+        api_client = Mock(spec=api.JobQueueApi)
+        # Both workers fail, so that more than one error is reported
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload_file(file):
+            barrier.wait()
+            raise ApiException(500, "Internal Server Error")
+
+        api_client.upload_file.side_effect = upload_file
+
+        with pytest.raises(FileUploadError) as exc_info:
+            job_request._post_files(api_client, max_workers=2)
+
+        assert len(exc_info.value.errors) == 2
+        assert api_client.upload_file.call_count < len(job_request._files)
+        assert all(isinstance(e, ApiException) for e in exc_info.value.errors.values())
+        with pytest.raises(ValueError, match="not been uploaded"):
+            job_request._files[0].file_id
+
+    def test_single_concurrent_failure_raises_original_error(self, job_request):
+        api_client = Mock(spec=api.JobQueueApi)
+        error = ApiException(500, "Internal Server Error")
+
+        def upload_file(file):
+            if file == EXCEL_IMPORT_DATA_FILE:
+                raise error
+            return "file-id"
+
+        api_client.upload_file.side_effect = upload_file
+
+        with pytest.raises(ApiException) as exc_info:
+            job_request._post_files(api_client, max_workers=4)
+
+        assert exc_info.value is error
+
+    def test_sequential_failure_raises_original_error(self, job_request):
+        api_client = Mock(spec=api.JobQueueApi)
+        error = ApiException(500, "Internal Server Error")
+        api_client.upload_file.side_effect = error
+
+        with pytest.raises(ApiException) as exc_info:
+            job_request._post_files(api_client, max_workers=1)
+
+        assert exc_info.value is error
+        assert api_client.upload_file.call_count == 1
+
+    def test_invalid_max_workers(self, job_request, api_client):
+        with pytest.raises(ValueError, match="max_workers"):
+            job_request._post_files(api_client, max_workers=0)
@@ -0,0 +1,173 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+import json
+import math
+import sys
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+from ansys.openapi.common import SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import JobQueueApiClient, JobStatus, JobTable, JobType
+from ansys.grantami.jobqueue._table import _build_table_row
+from common import build_gsa_job
+
+SUBMITTED = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+STARTED = SUBMITTED + datetime.timedelta(seconds=30)
+COMPLETED = STARTED + datetime.timedelta(seconds=90)
+
+
+@pytest.fixture
+def client():
+    client = JobQueueApiClient(
+        requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+    )
+    client.job_queue_api = Mock(spec=api.JobQueueApi)
+    client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(
+        results=[
+            build_gsa_job(
+                "completed",
+                status=models.GsaJobStatus.SUCCEEDED,
+                position=None,
+                job_type="ExcelExportJob",
+                submission_date=SUBMITTED,
+                execution_date=STARTED,
+                completion_date=COMPLETED,
+            ),
+            build_gsa_job("second", position=2, submission_date=SUBMITTED),
+            build_gsa_job("first", position=1, job_type="NewJob", submission_date=SUBMITTED),
+        ]
+    )
+    return client
+
+
+@pytest.fixture
+def table(client):
+    return client.jobs_table()
+
+
+def test_jobs_are_in_queue_order(client, table):
+    assert len(table) == 3
+    assert table.ids == [job.id for job in client.jobs] == ["first", "second", "completed"]
+    assert list(table.position) == [1, 2, -1]
+
+
+def test_status_and_type_are_coded(table):
+    assert [table.statuses[code] for code in table.status] == [
+        JobStatus.Pending,
+        JobStatus.Pending,
+        JobStatus.Succeeded,
+    ]
+    assert list(table.type) == [
+        -1,
+        JobTable.types.index(JobType.ExcelImportJob),
+        JobTable.types.index(JobType.ExcelExportJob),
+    ]
+
+
+def test_times_are_epoch_seconds(table):
+    assert list(table.submission_time) == [SUBMITTED.timestamp()] * 3
+    assert all(math.isnan(value) for value in table.execution_time[:2])
+    assert table.completion_time[2] - table.execution_time[2] == 90.0
+
+
+def test_local_snapshot_does_not_fetch_jobs(client, table):
+    client.jobs_table(refresh=False)
+    assert client.job_queue_api.get_jobs.call_count == 1
+
+
+@pytest.mark.parametrize("job_type", ["ExcelImportJob", "ExcelExportJob", "NewJob"])
+@pytest.mark.parametrize("status", list(models.GsaJobStatus))
+def test_status_codes_match_status_property(client, job_type, status):
+    outputs = {"summary": json.dumps({"FinishedSuccessfully": False})}
+    client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(
+        results=[
+            build_gsa_job("job", status=status, job_type=job_type, job_specific_outputs=outputs)
+        ]
+    )
+    table = client.jobs_table()
+    assert table.statuses[table.status[0]] == client.jobs[0].status
+
+
+def test_changed_jobs_are_converted_again(client, table):
+    job_obj = build_gsa_job(
+        "second",
+        status=models.GsaJobStatus.RUNNING,
+        position=None,
+        submission_date=SUBMITTED,
+        execution_date=STARTED,
+    )
+    client.get_job_by_id("second")._update_job(job_obj)
+    client.get_job_by_id("first")._is_deleted = True
+
+    table = client.jobs_table(refresh=False)
+
+    assert table.ids == ["first", "completed", "second"]
+    assert [table.statuses[code] for code in table.status] == [
+        JobStatus.Deleted,
+        JobStatus.Succeeded,
+        JobStatus.Running,
+    ]
+    assert list(table.position) == [1, -1, -1]
+    assert table.execution_time[2] == STARTED.timestamp()
+
+
+def test_unchanged_jobs_are_not_converted_again(client, table, monkeypatch):
+    build_table_row = Mock(wraps=_build_table_row)
+    monkeypatch.setattr("ansys.grantami.jobqueue._table._build_table_row", build_table_row)
+    client.get_job_by_id("second")._update_job(
+        build_gsa_job("second", position=3, submission_date=SUBMITTED)
+    )
+
+    client.jobs_table(refresh=False)
+    client.jobs_table(refresh=False)
+
+    build_table_row.assert_called_once_with(client.get_job_by_id("second"))
+
+
+def test_to_numpy(table):
+    numpy = pytest.importorskip("numpy")
+    columns = table.to_numpy()
+
+    assert columns["status"].dtype == numpy.int8
+    assert numpy.nansum(columns["completion_time"] - columns["execution_time"]) == 90.0
+    assert list(columns["ids"]) == table.ids
+
+
+def test_to_pandas(table):
+    pytest.importorskip("pandas")
+    frame = table.to_pandas()
+
+    assert list(frame.index) == table.ids
+    assert list(frame["status"]) == ["Pending", "Pending", "Succeeded"]
+    assert frame["completion_time"].iloc[2] == COMPLETED
+
+
+@pytest.mark.parametrize(["method", "module"], [("to_numpy", "numpy"), ("to_pandas", "pandas")])
+def test_missing_optional_dependency(table, monkeypatch, method, module):
+    monkeypatch.setitem(sys.modules, module, None)
+    with pytest.raises(ImportError, match=f"requires the '{module}' package"):
+        getattr(table, method)()
@@ -0,0 +1,206 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+from unittest.mock import Mock
+import urllib.error
+import urllib.request
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+from ansys.openapi.common import SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import AsyncJob, JobMetrics, JobQueueApiClient
+from ansys.grantami.jobqueue._metrics import CONTENT_TYPE
+from common import build_gsa_job
+
+SUBMITTED = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def build_job_obj(job_id="job-1", status=models.GsaJobStatus.PENDING, wait=None, run=None):
+    execution_date = SUBMITTED + datetime.timedelta(seconds=wait) if wait is not None else None
+    completion_date = execution_date + datetime.timedelta(seconds=run) if run is not None else None
+    return build_gsa_job(
+        job_id,
+        status=status,
+        position=1 if status == models.GsaJobStatus.PENDING else None,
+        submission_date=SUBMITTED,
+        execution_date=execution_date,
+        completion_date=completion_date,
+    )
+
+
+def build_job(**kwargs):
+    return AsyncJob.create_job(build_job_obj(**kwargs), Mock(spec=api.JobQueueApi))
+
+
+def samples(metrics):
+    """Parse the exposition text into a dict of sample name and labels to value."""
+    values = {}
+    for line in metrics.render_text().splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            values[name] = float(value)
+    return values
+
+
+LABELS = 'job_type="ExcelImportJob",submitter="User_1"'
+
+
+class TestJobMetrics:
+    def test_transitions_are_observed_once(self):
+        metrics = JobMetrics(buckets=[10, 100])
+        job = build_job()
+        metrics.observe(job)
+        job._update_job(build_job_obj(status=models.GsaJobStatus.RUNNING, wait=5))
+        metrics.observe(job)
+        metrics.observe(job)
+        job._update_job(build_job_obj(status=models.GsaJobStatus.SUCCEEDED, wait=5, run=50))
+        metrics.observe(job)
+        metrics.observe(job)
+
+        values = samples(metrics)
+
+        assert values[f"grantami_jobqueue_jobs_observed_total{{{LABELS}}}"] == 1
+        assert values[f'grantami_jobqueue_jobs_completed_total{{{LABELS},status="succeeded"}}'] == 1
+        assert values[f'grantami_jobqueue_queue_wait_seconds_bucket{{{LABELS},le="10.0"}}'] == 1
+        assert values[f"grantami_jobqueue_queue_wait_seconds_sum{{{LABELS}}}"] == 5
+        assert values[f'grantami_jobqueue_run_seconds_bucket{{{LABELS},le="10.0"}}'] == 0
+        assert values[f'grantami_jobqueue_run_seconds_bucket{{{LABELS},le="100.0"}}'] == 1
+        assert values[f'grantami_jobqueue_run_seconds_bucket{{{LABELS},le="+Inf"}}'] == 1
+        assert values[f"grantami_jobqueue_run_seconds_count{{{LABELS}}}"] == 1
+
+    def test_completed_jobs_are_observed(self):
+        metrics = JobMetrics(buckets=[10])
+        metrics.observe(build_job(job_id="1", status=models.GsaJobStatus.FAILED, wait=20, run=1))
+        metrics.observe(build_job(job_id="2", status=models.GsaJobStatus.SUCCEEDED, wait=1, run=1))
+
+        values = samples(metrics)
+
+        assert values[f"grantami_jobqueue_jobs_observed_total{{{LABELS}}}"] == 2
+        assert values[f'grantami_jobqueue_jobs_completed_total{{{LABELS},status="failed"}}'] == 1
+        assert values[f'grantami_jobqueue_queue_wait_seconds_bucket{{{LABELS},le="10.0"}}'] == 1
+        assert values[f'grantami_jobqueue_queue_wait_seconds_bucket{{{LABELS},le="+Inf"}}'] == 2
+
+    def test_forgotten_jobs_keep_their_metrics(self):
+        metrics = JobMetrics()
+        metrics.observe(build_job())
+        metrics.forget("job-1")
+
+        assert samples(metrics)[f"grantami_jobqueue_jobs_observed_total{{{LABELS}}}"] == 1
+        assert repr(metrics) == "<JobMetrics: jobs: 0>"
+
+    def test_label_values_are_escaped(self):
+        metrics = JobMetrics(namespace="test")
+        job = AsyncJob.create_job(
+            build_gsa_job(submitter_name='DOMAIN\\"user"'), Mock(spec=api.JobQueueApi)
+        )
+        metrics.observe(job)
+
+        assert 'submitter="DOMAIN\\\\\\"user\\""' in metrics.render_text()
+
+    def test_empty_metrics_declare_types(self):
+        text = JobMetrics().render_text()
+
+        assert "# TYPE grantami_jobqueue_queue_wait_seconds histogram" in text
+        assert "# TYPE grantami_jobqueue_jobs_completed_total counter" in text
+
+    @pytest.mark.parametrize("buckets", [[], [10, 1], [1, 1]])
+    def test_invalid_buckets(self, buckets):
+        with pytest.raises(ValueError):
+            JobMetrics(buckets=buckets)
+
+
+class TestClient:
+    @pytest.fixture
+    def client(self):
+        client = JobQueueApiClient(
+            requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+        )
+        client.job_queue_api = Mock(spec=api.JobQueueApi)
+        client.job_metrics = JobMetrics()
+        return client
+
+    def test_job_list_updates_metrics(self, client):
+        client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(
+            results=[build_job_obj(status=models.GsaJobStatus.RUNNING, wait=5)]
+        )
+        client.jobs
+        client.jobs
+
+        values = samples(client.job_metrics)
+
+        assert values[f"grantami_jobqueue_queue_wait_seconds_count{{{LABELS}}}"] == 1
+
+    def test_deleted_jobs_are_forgotten(self, client):
+        client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(
+            results=[build_job_obj()]
+        )
+        client.jobs
+        client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(results=[])
+        client.jobs
+
+        assert client.job_metrics._observed_ids == set()
+
+    def test_refreshed_jobs_update_metrics(self, client):
+        job = build_job()
+        client.job_queue_api.get_job.return_value = build_job_obj(
+            status=models.GsaJobStatus.SUCCEEDED, wait=5, run=5
+        )
+
+        client.refresh_jobs([job])
+
+        values = samples(client.job_metrics)
+        assert values[f'grantami_jobqueue_jobs_completed_total{{{LABELS},status="succeeded"}}'] == 1
+
+    def test_existing_jobs_are_observed_when_metrics_are_set(self, client):
+        client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(
+            results=[build_job_obj()]
+        )
+        client.jobs
+
+        client.job_metrics = JobMetrics()
+
+        assert client.job_metrics._observed_ids == {"job-1"}
+
+
+class TestHttpServer:
+    def test_metrics_are_served(self):
+        metrics = JobMetrics()
+        metrics.observe(build_job())
+
+        with metrics.start_http_server() as server:
+            with urllib.request.urlopen(server.url) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+
+        assert body == metrics.render_text()
+        assert content_type == CONTENT_TYPE
+
+    def test_other_paths_are_not_found(self):
+        with JobMetrics().start_http_server() as server:
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(server.url.replace("/metrics", "/other"))
+
+        exc_info.value.close()
+        assert exc_info.value.code == 404
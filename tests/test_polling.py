@@ -0,0 +1,102 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from unittest.mock import Mock
+
+import pytest
+
+from ansys.grantami.jobqueue import (
+    BackoffPollingStrategy,
+    FixedPollingStrategy,
+    JobQueueProcessingConfiguration,
+)
+
+
+def configuration(polling_interval_in_milliseconds=0, concurrency=1):
+    return JobQueueProcessingConfiguration(
+        purge_job_age_in_milliseconds=86400000,
+        purge_interval_in_milliseconds=3600000,
+        polling_interval_in_milliseconds=polling_interval_in_milliseconds,
+        concurrency=concurrency,
+    )
+
+
+def job(position=None):
+    return Mock(position=position)
+
+
+def test_fixed_interval():
+    strategy = FixedPollingStrategy(interval=2.5)
+    assert strategy.next_interval(0, [job()], configuration()) == 2.5
+    assert strategy.next_interval(10, [job()], configuration()) == 2.5
+
+
+class TestBackoffPollingStrategy:
+    def test_interval_increases_exponentially(self):
+        strategy = BackoffPollingStrategy(initial_interval=0.5, multiplier=2, jitter=0)
+        intervals = [strategy.next_interval(i, [job()], configuration()) for i in range(4)]
+        assert intervals == [0.5, 1.0, 2.0, 4.0]
+
+    def test_interval_is_capped(self):
+        strategy = BackoffPollingStrategy(maximum_interval=10, jitter=0)
+        assert strategy.next_interval(1000, [job()], configuration()) == 10
+
+    def test_jitter_reduces_interval(self):
+        strategy = BackoffPollingStrategy(initial_interval=1, jitter=0.5)
+        intervals = {strategy.next_interval(0, [job()], configuration()) for _ in range(50)}
+        assert all(0.5 <= interval <= 1 for interval in intervals)
+        assert len(intervals) > 1
+
+    def test_server_polling_interval_is_minimum(self):
+        strategy = BackoffPollingStrategy(initial_interval=0.1, jitter=0)
+        assert strategy.next_interval(0, [job()], configuration(2000)) == 2.0
+
+    def test_server_polling_interval_can_be_ignored(self):
+        strategy = BackoffPollingStrategy(
+            initial_interval=0.1, jitter=0, use_server_polling_interval=False
+        )
+        assert strategy.next_interval(0, [job()], configuration(2000)) == 0.1
+
+    def test_queued_jobs_poll_slower(self):
+        strategy = BackoffPollingStrategy(initial_interval=0.1, jitter=0)
+        config = configuration(concurrency=2)
+        assert strategy.next_interval(0, [job(21), job(41)], config) == 10
+        assert strategy.next_interval(0, [job(1)], config) == 0.1
+
+    def test_running_jobs_ignore_queue_position(self):
+        strategy = BackoffPollingStrategy(initial_interval=0.1, jitter=0)
+        assert strategy.next_interval(0, [job(21), job(None)], configuration()) == 0.1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"initial_interval": 0},
+            {"initial_interval": 10, "maximum_interval": 1},
+            {"multiplier": 0.5},
+            {"jitter": 1},
+            {"timeout": -1},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            BackoffPollingStrategy(**kwargs)
@@ -0,0 +1,191 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+from ansys.openapi.common import ApiClientFactory, SessionConfiguration
+import pytest
+
+from ansys.grantami.jobqueue import (
+    ConnectionPoolConfiguration,
+    ConnectionPoolStatistics,
+    JobQueueApiClient,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received = threading.Event()
+    release = threading.Event()
+
+    def do_GET(self):
+        if self.path == "/slow":
+            self.received.set()
+            self.release.wait(5)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    # Use the session created by the connection builder, which has a timeout adapter mounted
+    factory = ApiClientFactory("http://my_mi_server", SessionConfiguration(request_timeout=5))
+    return JobQueueApiClient(factory._session, "http://my_mi_server", SessionConfiguration())
+
+
+def test_adapter_settings_are_kept(client):
+    previous = client.rest_client.get_adapter("http://")
+    retries = previous.max_retries
+
+    client._configure_connection_pool(ConnectionPoolConfiguration(max_connections_per_host=3))
+
+    adapter = client.rest_client.get_adapter("http://")
+    assert client.rest_client.get_adapter("https://") is adapter
+    assert adapter.timeout == 5
+    assert adapter.max_retries is retries
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 3
+    assert client.connection_pool_statistics.max_connections_per_host == 3
+
+
+def test_pool_grows_with_workers(client):
+    client._configure_connection_pool(ConnectionPoolConfiguration())
+    assert client.connection_pool_statistics.max_connections_per_host == 8
+
+    client.max_upload_workers = 20
+    client.max_upload_workers = 2
+
+    assert client.connection_pool_statistics.max_connections_per_host == 20
+
+
+def test_growing_replaces_adapter(client, server_url):
+    client._configure_connection_pool(ConnectionPoolConfiguration())
+    client.rest_client.get(server_url).raise_for_status()
+    previous = client.rest_client.get_adapter(server_url)
+    prefixes = list(client.rest_client.adapters)
+
+    client.max_upload_workers = 20
+
+    adapter = client.rest_client.get_adapter(server_url)
+    assert adapter is not previous
+    assert client.rest_client.get_adapter("https://") is adapter
+    assert list(client.rest_client.adapters) == prefixes
+    assert adapter.timeout == 5
+    assert adapter.max_retries is previous.max_retries
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 20
+    assert len(previous.poolmanager.pools) == 0
+
+
+def test_previous_adapter_is_closed_after_requests_in_progress(client, server_url):
+    client._configure_connection_pool(ConnectionPoolConfiguration())
+    previous = client.rest_client.get_adapter(server_url)
+    _Handler.received.clear()
+    _Handler.release.clear()
+    thread = threading.Thread(target=client.rest_client.get, args=(f"{server_url}/slow",))
+    thread.start()
+    try:
+        assert _Handler.received.wait(5)
+
+        client.max_upload_workers = 20
+
+        assert len(previous.poolmanager.pools) == 1
+    finally:
+        _Handler.release.set()
+        thread.join()
+    assert len(previous.poolmanager.pools) == 0
+
+
+def test_pool_grows_while_requests_are_sent(client, server_url):
+    client._configure_connection_pool(ConnectionPoolConfiguration())
+    errors = []
+
+    def send_requests():
+        try:
+            for _ in range(20):
+                client.rest_client.get(server_url).raise_for_status()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=send_requests) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for workers in range(9, 40):
+        client._grow_connection_pool(workers)
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert client.connection_pool_statistics.max_connections_per_host == 39
+
+
+def test_fixed_pool_does_not_grow(client):
+    client._configure_connection_pool(ConnectionPoolConfiguration(max_connections_per_host=2))
+
+    client.max_upload_workers = 20
+
+    assert client.connection_pool_statistics.max_connections_per_host == 2
+
+
+def test_statistics(client, server_url):
+    client._configure_connection_pool(ConnectionPoolConfiguration())
+
+    for _ in range(5):
+        client.rest_client.get(server_url).raise_for_status()
+
+    assert client.connection_pool_statistics == ConnectionPoolStatistics(
+        max_connections_per_host=8,
+        hosts=1,
+        idle_connections=1,
+        connections_created=1,
+        requests=5,
+    )
+
+
+def test_keep_alive(client):
+    client._configure_connection_pool(ConnectionPoolConfiguration(keep_alive=False))
+    assert client.rest_client.headers["Connection"] == "close"
+
+    client._configure_connection_pool(ConnectionPoolConfiguration())
+    assert client.rest_client.headers["Connection"] == "keep-alive"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_connections_per_host": 0}, {"max_hosts": 0}],
+    ids=lambda kwargs: next(iter(kwargs)),
+)
+def test_invalid_configuration(kwargs):
+    with pytest.raises(ValueError, match=next(iter(kwargs))):
+        ConnectionPoolConfiguration(**kwargs)
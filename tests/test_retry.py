@@ -0,0 +1,321 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import models
+from ansys.openapi.common import ApiException, SessionConfiguration
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from ansys.grantami.jobqueue import (
+    AsyncJob,
+    CircuitOpenError,
+    FixedPollingStrategy,
+    JobQueueApiClient,
+    JobQueueProcessingConfiguration,
+    RetryPolicy,
+)
+from ansys.grantami.jobqueue._retry import _get_retry_after, _is_idempotent
+from common import build_gsa_job
+
+JOBS_PATH = "/v1alpha/job-queue/jobs"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr("ansys.grantami.jobqueue._retry.time.sleep", calls.append)
+    return calls
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("ansys.grantami.jobqueue._retry.time.monotonic", lambda: now[0])
+    return now
+
+
+def failing(*outcomes):
+    """Return a function that raises or returns each outcome in turn."""
+    return Mock(side_effect=list(outcomes))
+
+
+def api_error(status_code, headers=None):
+    return ApiException(status_code, "Error", headers=CaseInsensitiveDict(headers or {}))
+
+
+@pytest.mark.parametrize(
+    ["method", "path", "expected"],
+    [
+        ("GET", "/v1alpha/job-queue/jobs/{id}", True),
+        ("delete", "/v1alpha/job-queue/jobs/{id}", True),
+        ("PATCH", "/v1alpha/job-queue/jobs/{id}", True),
+        ("POST", "/v1alpha/job-queue/files", True),
+        ("POST", "/v1alpha/job-queue/jobs/{id}:move-to-top", True),
+        ("POST", JOBS_PATH, False),
+        ("POST", "/v1alpha/job-queue/jobs/{id}:resubmit", False),
+    ],
+)
+def test_idempotency(method, path, expected):
+    assert _is_idempotent(method, path) is expected
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [("3", 3.0), ("-1", 0.0), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0), ("soon", None), (None, None)],
+)
+def test_retry_after(value, expected):
+    headers = {} if value is None else {"Retry-After": value}
+    assert _get_retry_after(api_error(503, headers)) == expected
+
+
+class TestRetries:
+    def test_transient_errors_are_retried_with_backoff(self, sleeps, monkeypatch):
+        monkeypatch.setattr("ansys.grantami.jobqueue._retry.random.uniform", lambda a, b: b)
+        func = failing(api_error(502), api_error(504), requests.exceptions.ReadTimeout(), "ok")
+
+        assert RetryPolicy(initial_delay=1)._call("GET", JOBS_PATH, func) == "ok"
+        assert sleeps == [1, 2, 4]
+
+    def test_retries_are_limited(self, sleeps):
+        func = failing(*[api_error(500)] * 5)
+
+        with pytest.raises(ApiException):
+            RetryPolicy(max_attempts=3)._call("GET", JOBS_PATH, func)
+        assert func.call_count == 3
+
+    def test_permanent_errors_are_not_retried(self, sleeps):
+        func = failing(api_error(404))
+
+        with pytest.raises(ApiException):
+            RetryPolicy()._call("GET", JOBS_PATH, func)
+        assert func.call_count == 1
+
+    def test_retry_after_is_honored(self, sleeps):
+        func = failing(api_error(429, {"Retry-After": "7"}), "ok")
+
+        RetryPolicy(max_delay=1)._call("GET", JOBS_PATH, func)
+
+        assert sleeps == [7.0]
+
+    def test_long_retry_after_is_not_honored(self, sleeps):
+        func = failing(api_error(503, {"Retry-After": "3600"}), "ok")
+
+        with pytest.raises(ApiException):
+            RetryPolicy()._call("GET", JOBS_PATH, func)
+        assert sleeps == []
+
+    @pytest.mark.parametrize(
+        ["error", "retried"],
+        [
+            (api_error(502), False),
+            (requests.exceptions.ReadTimeout(), False),
+            (api_error(503), True),
+            (api_error(429), True),
+            (requests.exceptions.ConnectTimeout(), True),
+            (
+                requests.exceptions.ConnectionError(
+                    MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+                ),
+                True,
+            ),
+        ],
+    )
+    def test_non_idempotent_requests(self, sleeps, error, retried):
+        func = failing(error, "ok")
+
+        if retried:
+            assert RetryPolicy()._call("POST", JOBS_PATH, func) == "ok"
+        else:
+            with pytest.raises(type(error)):
+                RetryPolicy()._call("POST", JOBS_PATH, func)
+
+    def test_exhausted_transport_retries_are_not_retried(self, sleeps):
+        func = failing(requests.exceptions.RetryError())
+
+        with pytest.raises(requests.exceptions.RetryError):
+            RetryPolicy()._call("GET", JOBS_PATH, func)
+        assert func.call_count == 1
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, sleeps, clock):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=3, reset_timeout=10)
+        for _ in range(3):
+            with pytest.raises(ApiException):
+                policy._call("GET", JOBS_PATH, failing(api_error(503)))
+        assert policy.is_open
+
+        func = Mock()
+        with pytest.raises(CircuitOpenError) as exc_info:
+            policy._call("GET", JOBS_PATH, func)
+        func.assert_not_called()
+        assert exc_info.value.retry_after == 10
+
+    def test_open_circuit_stops_retries(self, sleeps, clock):
+        policy = RetryPolicy(max_attempts=10, failure_threshold=2)
+        func = failing(*[api_error(503)] * 10)
+
+        with pytest.raises(CircuitOpenError):
+            policy._call("GET", JOBS_PATH, func)
+        assert func.call_count == 2
+
+    def test_successful_trial_closes_circuit(self, sleeps, clock):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=10)
+        with pytest.raises(ApiException):
+            policy._call("GET", JOBS_PATH, failing(api_error(503)))
+        clock[0] += 10
+
+        assert not policy.is_open
+        assert policy._call("GET", JOBS_PATH, failing("ok")) == "ok"
+        assert policy._call("GET", JOBS_PATH, failing("ok")) == "ok"
+
+    def test_failed_trial_reopens_circuit(self, sleeps, clock):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=10)
+        with pytest.raises(ApiException):
+            policy._call("GET", JOBS_PATH, failing(api_error(503)))
+        clock[0] += 10
+
+        with pytest.raises(ApiException):
+            policy._call("GET", JOBS_PATH, failing(api_error(503)))
+        assert policy.is_open
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            requests.exceptions.ChunkedEncodingError(),
+            ValueError("Invalid JSON"),
+            KeyboardInterrupt(),
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    def test_unexpected_trial_error_allows_another_trial(self, sleeps, clock, error):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1, reset_timeout=10)
+        with pytest.raises(ApiException):
+            policy._call("GET", JOBS_PATH, failing(api_error(503)))
+        clock[0] += 10
+
+        with pytest.raises(type(error)):
+            policy._call("GET", JOBS_PATH, failing(error))
+
+        assert policy._call("GET", JOBS_PATH, failing("ok")) == "ok"
+        assert not policy.is_open
+
+    def test_successes_reset_failure_count(self, sleeps, clock):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=2)
+        for outcome in [api_error(503), "ok", api_error(503), api_error(404)]:
+            try:
+                policy._call("GET", JOBS_PATH, failing(outcome))
+            except ApiException:
+                pass
+
+        assert not policy.is_open
+
+    @pytest.mark.parametrize("status_code", [408, 429, 500])
+    def test_reachable_server_errors_do_not_open_circuit(self, sleeps, clock, status_code):
+        policy = RetryPolicy(max_attempts=3, failure_threshold=2)
+        for _ in range(3):
+            with pytest.raises(ApiException):
+                policy._call("GET", JOBS_PATH, failing(*[api_error(status_code)] * 3))
+
+        assert not policy.is_open
+
+    def test_reachable_server_errors_reset_failure_count(self, sleeps, clock):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=2)
+        for status_code in [503, 500, 503]:
+            with pytest.raises(ApiException):
+                policy._call("GET", JOBS_PATH, failing(api_error(status_code)))
+
+        assert not policy.is_open
+
+    def test_reset(self, sleeps, clock):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=1)
+        with pytest.raises(ApiException):
+            policy._call("GET", JOBS_PATH, failing(api_error(503)))
+
+        policy.reset()
+
+        assert not policy.is_open
+
+
+class TestClient:
+    @pytest.fixture
+    def client(self):
+        client = JobQueueApiClient(
+            requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+        )
+        client.setup_client(models)
+        return client
+
+    def test_api_calls_are_retried(self, client, sleeps, requests_mock):
+        requests_mock.get(
+            client.api_url + "/v1alpha/job-queue/current-user",
+            [{"status_code": 503}, {"json": {"username": "User", "isAdmin": False}}],
+        )
+
+        user = client.job_queue_api.get_current_user()
+
+        assert user.username == "User"
+        assert len(sleeps) == 1
+
+    def test_job_creation_is_not_retried_after_server_error(self, client, sleeps, requests_mock):
+        create = requests_mock.post(client.api_url + JOBS_PATH, status_code=502)
+
+        with pytest.raises(ApiException):
+            client.call_api(JOBS_PATH, "POST")
+        assert create.call_count == 1
+
+    def test_job_polling_is_retried_by_policy(self, client, sleeps, requests_mock, monkeypatch):
+        job = AsyncJob.create_job(build_gsa_job("job-1"), client.job_queue_api)
+        monkeypatch.setattr(client, "create_job", lambda job_request: job)
+        client._processing_configuration = JobQueueProcessingConfiguration(
+            purge_job_age_in_milliseconds=86400000,
+            purge_interval_in_milliseconds=3600000,
+            polling_interval_in_milliseconds=100,
+            concurrency=1,
+        )
+        monkeypatch.setattr("ansys.grantami.jobqueue._connection.time.sleep", lambda _: None)
+        poll = requests_mock.get(client.api_url + JOBS_PATH + "/job-1", status_code=503)
+        client.retry_policy = RetryPolicy(max_attempts=3, failure_threshold=10)
+
+        with pytest.raises(ApiException):
+            client.create_job_and_wait(Mock(), FixedPollingStrategy(0.5))
+        assert poll.call_count == 3
+
+    def test_retries_can_be_disabled(self, client, sleeps, requests_mock):
+        jobs = requests_mock.get(client.api_url + JOBS_PATH, status_code=503)
+        client.retry_policy = None
+
+        with pytest.raises(ApiException):
+            client.call_api(JOBS_PATH, "GET")
+        assert jobs.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_attempts": 0}, {"initial_delay": -1}, {"failure_threshold": 0}, {"reset_timeout": 0}],
+)
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)
@@ -0,0 +1,363 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import json
+import re
+from unittest.mock import Mock
+import zipfile
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+from ansys.openapi.common import SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import (
+    ExcelExportJobRequest,
+    ExportRecord,
+    FixedPollingStrategy,
+    JobFile,
+    JobQueueApiClient,
+    JobQueueProcessingConfiguration,
+    TextImportJobRequest,
+)
+from ansys.grantami.jobqueue._models import _FileType
+from ansys.grantami.jobqueue._sharding import (
+    _get_unique_name,
+    _merge_summaries,
+    _split_export_request,
+    _split_text_file,
+)
+from common import build_gsa_job
+
+
+@pytest.fixture
+def job_request(tmp_path):
+    template = tmp_path / "template.xlsx"
+    template.write_bytes(b"template")
+    return ExcelExportJobRequest(
+        name="Export",
+        description="Sharded export",
+        template_file=template,
+        database_key="MI_Training",
+        records=[ExportRecord(i) for i in range(10)],
+    )
+
+
+@pytest.mark.parametrize(["shard_count", "sizes"], [(1, [10]), (3, [4, 3, 3]), (20, [1] * 10)])
+def test_split_export_request(job_request, shard_count, sizes):
+    shards = _split_export_request(job_request, shard_count)
+
+    assert [len(shard._records) for shard in shards] == sizes
+    assert [r for shard in shards for r in shard._records] == job_request._records
+    assert shards[0].name == f"Export (part 1 of {len(sizes)})"
+    assert all(shard._files[0].path == job_request._files[0].path for shard in shards)
+    assert all(shard.description == "Sharded export" for shard in shards)
+
+
+def test_unique_names():
+    names = {"Export.xlsx"}
+
+    assert _get_unique_name("image.png", names, 1) == "image.png"
+    assert _get_unique_name("Export.xlsx", names, 2) == "Export (part 2).xlsx"
+    assert _get_unique_name("Export.xlsx", names, 2) == "Export (part 2, 2).xlsx"
+    assert _get_unique_name("dir/Export.xlsx", names, 3) == "dir/Export.xlsx"
+
+
+def build_archive(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class TestCreateShardedExport:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr("ansys.grantami.jobqueue._connection.time.sleep", Mock())
+        client = JobQueueApiClient(
+            requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+        )
+        client.job_queue_api = Mock(spec=api.JobQueueApi)
+        client.job_queue_api.api_client = client
+        client.job_queue_api.upload_file.return_value = "template-id"
+        client._processing_configuration = JobQueueProcessingConfiguration(
+            purge_job_age_in_milliseconds=1000,
+            purge_interval_in_milliseconds=1000,
+            polling_interval_in_milliseconds=100,
+            concurrency=3,
+        )
+        return client
+
+    @pytest.fixture
+    def remote_jobs(self, client):
+        remote_jobs = {}
+
+        def create_job(body):
+            job_id = f"job-{len(remote_jobs) + 1}"
+            remote_jobs[job_id] = (body, models.GsaJobStatus.SUCCEEDED)
+            return build_gsa_job(job_id, name=body.name, job_type="ExcelExportJob")
+
+        def get_job(id):
+            body, status = remote_jobs[id]
+            return build_gsa_job(
+                id,
+                status=status,
+                position=None,
+                name=body.name,
+                job_type="ExcelExportJob",
+                output_file_names=[f"{body.name}.zip", f"{body.name}.log"],
+            )
+
+        client.job_queue_api.create_job.side_effect = create_job
+        client.job_queue_api.get_job.side_effect = get_job
+        return remote_jobs
+
+    @pytest.fixture
+    def outputs(self, client, requests_mock):
+        def handle_download(request, context):
+            job_number = re.search(r"/jobs/job-(\d+)/", request.path).group(1)
+            return build_archive(
+                {"Export.xlsx": f"data {job_number}", f"images/{job_number}.png": job_number}
+            )
+
+        output_files = re.compile(re.escape(client.api_url) + r"/.*/outputs:export")
+        return requests_mock.get(output_files, content=handle_download)
+
+    def test_outputs_are_merged(self, client, job_request, remote_jobs, outputs, tmp_path):
+        output_path = tmp_path / "merged.zip"
+
+        jobs = client.create_sharded_export_and_wait(job_request, output_path)
+
+        assert [job.id for job in jobs] == ["job-1", "job-2", "job-3"]
+        with zipfile.ZipFile(output_path) as archive:
+            assert archive.namelist() == [
+                "Export.xlsx",
+                "images/1.png",
+                "Export (part 2).xlsx",
+                "images/2.png",
+                "Export (part 3).xlsx",
+                "images/3.png",
+            ]
+            assert archive.read("Export (part 3).xlsx") == b"data 3"
+        assert sorted(tmp_path.iterdir()) == [output_path, tmp_path / "template.xlsx"]
+        assert all(".log" not in request.query for request in outputs.request_history)
+
+    def test_template_is_uploaded_once(self, client, job_request, remote_jobs, outputs, tmp_path):
+        client.create_sharded_export_and_wait(
+            job_request, tmp_path / "merged.zip", max_records_per_job=2
+        )
+
+        assert client.job_queue_api.upload_file.call_count == 1
+        assert len(remote_jobs) == 5
+        for body, _ in remote_jobs.values():
+            assert body.input_file_ids == ["template-id"]
+
+    def test_failed_jobs_raise_error(self, client, job_request, remote_jobs, outputs, tmp_path):
+        client.job_queue_api.create_job.side_effect = lambda body: (
+            remote_jobs.__setitem__(
+                f"job-{len(remote_jobs) + 1}", (body, models.GsaJobStatus.FAILED)
+            )
+            or build_gsa_job(f"job-{len(remote_jobs)}", name=body.name, job_type="ExcelExportJob")
+        )
+
+        with pytest.raises(ValueError, match="3 of 3 export jobs did not succeed"):
+            client.create_sharded_export_and_wait(job_request, tmp_path / "merged.zip")
+        assert not (tmp_path / "merged.zip").exists()
+
+    def test_timeout_raises_error(self, client, job_request, remote_jobs, tmp_path):
+        client.job_queue_api.get_job.side_effect = lambda id: build_gsa_job(id)
+
+        with pytest.raises(TimeoutError, match="3 of 3 export jobs"):
+            client.create_sharded_export_and_wait(
+                job_request,
+                tmp_path / "merged.zip",
+                polling_strategy=FixedPollingStrategy(timeout=0),
+            )
+
+    def test_multiple_templates_raise_error(self, client, job_request, remote_jobs, tmp_path):
+        job_request._add_file(tmp_path / "template.xlsx", _FileType.Template)
+
+        with pytest.raises(ValueError, match="exactly one template file, not 2"):
+            client.create_sharded_export_and_wait(job_request, tmp_path / "merged.zip")
+        assert client.job_queue_api.upload_file.call_count == 0
+
+    def test_invalid_max_records(self, client, job_request, tmp_path):
+        with pytest.raises(ValueError, match="max_records_per_job"):
+            client.create_sharded_export_and_wait(job_request, tmp_path, max_records_per_job=0)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+@pytest.mark.parametrize(
+    ["part_count", "header_lines", "expected"],
+    [
+        (1, 1, [b"id\tname\n1\ta\n2\tbb\n3\tccc\n4\td"]),
+        (2, 1, [b"id\tname\n1\ta\n2\tbb\n", b"id\tname\n3\tccc\n4\td"]),
+        (10, 1, [b"id\tname\n" + line for line in [b"1\ta\n", b"2\tbb\n", b"3\tccc\n", b"4\td"]]),
+        (2, 0, [b"id\tname\n1\ta\n2\tbb\n", b"3\tccc\n4\td"]),
+    ],
+)
+def test_split_text_file(tmp_path, chunk_size, part_count, header_lines, expected):
+    data_file = tmp_path / "data.txt"
+    data_file.write_bytes(b"id\tname\n1\ta\n2\tbb\n3\tccc\n4\td")
+    folder = tmp_path / "parts"
+    folder.mkdir()
+
+    parts = _split_text_file(data_file, part_count, header_lines, folder, chunk_size)
+
+    assert [part.read_bytes() for part in parts] == expected
+    assert parts[0] == folder / "data.part1.txt"
+
+
+def test_split_empty_text_file(tmp_path):
+    data_file = tmp_path / "data.txt"
+    data_file.write_bytes(b"header\n")
+
+    parts = _split_text_file(data_file, 4, 1, tmp_path)
+
+    assert [part.read_bytes() for part in parts] == [b"header\n"]
+
+
+def test_merge_summaries():
+    summaries = [
+        {"Finished": True, "Records": {"Created": 2, "Errors": []}, "Database": "MI", "Time": "1"},
+        None,
+        {"Finished": False, "Records": {"Created": 3, "Errors": ["e"]}, "Database": "MI"},
+        {"Finished": True, "Records": {"Updated": 1.5}, "Database": "MI", "Time": "2"},
+    ]
+
+    assert _merge_summaries(summaries) == {
+        "Finished": False,
+        "Records": {"Created": 5, "Errors": ["e"], "Updated": 1.5},
+        "Database": "MI",
+        "Time": ["1", "2"],
+    }
+    assert _merge_summaries([None]) is None
+
+
+class TestCreateSplitTextImport:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr("ansys.grantami.jobqueue._connection.time.sleep", Mock())
+        client = JobQueueApiClient(
+            requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+        )
+        client.job_queue_api = Mock(spec=api.JobQueueApi)
+        client.job_queue_api.api_client = client
+        client.job_queue_api.upload_file.side_effect = lambda file: f"id-{file.name}"
+        client._processing_configuration = JobQueueProcessingConfiguration(
+            purge_job_age_in_milliseconds=1000,
+            purge_interval_in_milliseconds=1000,
+            polling_interval_in_milliseconds=100,
+            concurrency=3,
+        )
+        return client
+
+    @pytest.fixture
+    def remote_jobs(self, client):
+        remote_jobs = {}
+
+        def create_job(body):
+            job_id = f"job-{len(remote_jobs) + 1}"
+            remote_jobs[job_id] = body
+            return build_gsa_job(job_id, name=body.name, job_type="TextImportJob")
+
+        def get_job(id):
+            summary = {"FinishedSuccessfully": True, "RecordsCreated": 2}
+            return build_gsa_job(
+                id,
+                status=models.GsaJobStatus.SUCCEEDED,
+                position=None,
+                name=remote_jobs[id].name,
+                job_type="TextImportJob",
+                job_specific_outputs={"summary": json.dumps(summary)},
+            )
+
+        client.job_queue_api.create_job.side_effect = create_job
+        client.job_queue_api.get_job.side_effect = get_job
+        return remote_jobs
+
+    @pytest.fixture
+    def job_request(self, tmp_path):
+        data_file = tmp_path / "data.txt"
+        data_file.write_text("header\n" + "".join(f"record {i}\n" for i in range(6)))
+        template = tmp_path / "template.xml"
+        template.write_text("template")
+        attachment = tmp_path / "image.png"
+        attachment.write_bytes(b"image")
+        return TextImportJobRequest(
+            name="Import",
+            description="Split import",
+            template_file=template,
+            data_files=[data_file],
+            attachment_files=[JobFile(attachment, "images/image.png")],
+        )
+
+    def test_one_job_per_part(self, client, job_request, remote_jobs):
+        jobs = client.create_split_text_import_and_wait(job_request)
+
+        assert [job.name for job in jobs] == [f"Import (part {i} of 3)" for i in range(1, 4)]
+        uploaded = [
+            call.kwargs["file"].name for call in client.job_queue_api.upload_file.call_args_list
+        ]
+        assert sorted(uploaded) == [
+            "data.part1.txt",
+            "data.part2.txt",
+            "data.part3.txt",
+            "image.png",
+            "template.xml",
+        ]
+        for index, body in enumerate(remote_jobs.values(), start=1):
+            assert body.input_file_ids == [
+                "id-template.xml",
+                f"id-data.part{index}.txt",
+                "id-image.png",
+            ]
+            paths = [file["filePath"] for file in json.loads(body.parameters)]
+            assert paths[1:] == ["data.txt", "images/image.png"]
+
+    def test_connection_pool_grows_with_uploads(self, client, job_request, remote_jobs):
+        client._grow_connection_pool = Mock()
+
+        client.create_split_text_import_and_wait(job_request)
+
+        client._grow_connection_pool.assert_any_call(2)
+
+    def test_summaries_are_merged(self, client, job_request, remote_jobs):
+        jobs = client.create_split_text_import_and_wait(job_request, max_jobs=2)
+
+        assert len(jobs) == 2
+        assert client.merge_import_summaries(jobs) == {
+            "FinishedSuccessfully": True,
+            "RecordsCreated": 4,
+        }
+
+    def test_multiple_data_files_raise_error(self, client, job_request, tmp_path):
+        job_request._add_file(tmp_path / "template.xml", _FileType.Data)
+
+        with pytest.raises(ValueError, match="single data file"):
+            client.create_split_text_import_and_wait(job_request)
+
+    def test_invalid_max_jobs(self, client, job_request):
+        with pytest.raises(ValueError, match="max_jobs"):
+            client.create_split_text_import_and_wait(job_request, max_jobs=0)
@@ -0,0 +1,216 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+import time
+
+from ansys.openapi.common import ApiException
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import ExcelImportJobRequest, JobStatus, JobType
+from ansys.grantami.jobqueue._simulator import SimulatedJobQueueServer
+from common import EXCEL_IMPORT_DATA_FILE, EXCEL_IMPORT_TEMPLATE_FILE
+
+JOBS_PATH = "/v1alpha/job-queue/jobs"
+
+
+def build_request(name="Job"):
+    return ExcelImportJobRequest(
+        name=name,
+        description=None,
+        template_file=EXCEL_IMPORT_TEMPLATE_FILE,
+        data_files=[EXCEL_IMPORT_DATA_FILE],
+    )
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition not met in time."
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def server():
+    with SimulatedJobQueueServer(concurrency=2, job_duration=60) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return server.connect()
+
+
+def test_connect(server, client):
+    assert client.processing_configuration.concurrency == 2
+    assert client.is_admin_user
+    assert server.request_counts["GET /v1alpha/schema/mi-version"] == 1
+
+
+def test_job_lifecycle():
+    with SimulatedJobQueueServer() as server:
+        client = server.connect()
+        job = client.create_job_and_wait(build_request())
+
+        assert job.status == JobStatus.Succeeded
+        assert job.output_information["summary"]["FinishedSuccessfully"] is True
+        assert job.get_file_content("Job.log") == b"\0" * 1024
+        assert server.request_counts["POST /v1alpha/job-queue/files"] == 2
+        assert server.bytes_uploaded > 0
+
+
+def test_concurrency_limits_running_jobs():
+    with SimulatedJobQueueServer(concurrency=2, job_duration=60) as server:
+        client = server.connect()
+        jobs = [client.create_job(build_request(f"Job {i}")) for i in range(4)]
+
+        assert [job.status for job in jobs] == [JobStatus.Running] * 2 + [JobStatus.Pending] * 2
+        assert [job.position for job in jobs[2:]] == [1, 2]
+
+
+def test_jobs_start_when_slots_free():
+    with SimulatedJobQueueServer(concurrency=1, job_duration=0.05) as server:
+        ids = server.add_jobs(3, status="Pending")
+        wait_until(lambda: server.get_job(ids[-1]).status == "Succeeded")
+
+        jobs = [server.get_job(job_id) for job_id in ids]
+
+    for previous, job in zip(jobs, jobs[1:]):
+        assert job.execution_time == pytest.approx(previous.completion_time)
+        assert job.completion_time - job.execution_time == pytest.approx(0.05)
+
+
+def test_job_outcome():
+    with SimulatedJobQueueServer(job_outcome=lambda job: job.name != "Bad") as server:
+        client = server.connect()
+        good = client.create_job(build_request("Good"))
+        bad = client.create_job(build_request("Bad"))
+
+        client.wait_for_jobs([good, bad])
+
+    assert good.status == JobStatus.Succeeded
+    assert bad.status == JobStatus.Failed
+
+
+def test_move_to_top():
+    with SimulatedJobQueueServer(job_duration=60) as server:
+        client = server.connect()
+        jobs = [client.create_job(build_request(f"Job {i}")) for i in range(3)]
+
+        jobs[2].move_to_top()
+        jobs[1].update()
+
+    assert (jobs[2].position, jobs[1].position) == (1, 2)
+
+
+def test_update_and_delete(client):
+    job = client.create_job(build_request())
+
+    job.update_name("Renamed")
+    assert client.jobs_where(name="renamed") == [job]
+
+    client.delete_jobs([job])
+    assert client.jobs == []
+    assert job.status == JobStatus.Deleted
+
+
+def test_filters(server, client):
+    server.add_jobs(3, job_type="ExcelExportJob")
+    server.add_jobs(2, status="Failed", submitter_name="Other")
+
+    assert len(client.jobs_where(job_type=JobType.ExcelExportJob)) == 3
+    assert len(client.jobs_where(status=JobStatus.Failed)) == 2
+    assert len(client.jobs_where(submitter_name="Other")) == 2
+    assert client.num_jobs == 5
+
+
+def test_pagination(server, client):
+    server.add_jobs(25, status="Pending")
+
+    response = client.job_queue_api.get_jobs(page_size=10, page_number=3)
+
+    assert len(response.results) == 5
+    assert response.total_result_count == 25
+
+
+def test_scheduled_jobs_wait():
+    with SimulatedJobQueueServer(
+        job_duration=lambda job: 0.2 if job.name == "First" else 0
+    ) as server:
+        client = server.connect()
+        first = client.create_job(build_request("First"))
+        job = client.create_job(build_request("Scheduled"))
+        job.update_scheduled_execution_date_time(
+            datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=0.5)
+        )
+
+        wait_until(lambda: server.get_job(job.id).status == "Succeeded")
+
+        simulated = server.get_job(job.id)
+        assert simulated.execution_time == pytest.approx(simulated.scheduled_time, abs=1e-6)
+        assert simulated.execution_time > server.get_job(first.id).completion_time
+
+
+def test_unknown_job_returns_not_found(client):
+    with pytest.raises(ApiException) as exc_info:
+        client.job_queue_api.get_job(id="unknown")
+
+    assert exc_info.value.status_code == 404
+
+
+def test_unknown_files_are_rejected(client):
+    with pytest.raises(ApiException) as exc_info:
+        client.call_api(
+            JOBS_PATH,
+            "POST",
+            body={"name": "Job", "type": "ExcelImportJob", "inputFileIds": ["unknown"]},
+        )
+
+    assert exc_info.value.status_code == 400
+
+
+def test_latency_is_injected():
+    def latency(endpoint):
+        return 0.1 if endpoint == "GET /v1alpha/job-queue/current-user" else 0.0
+
+    with SimulatedJobQueueServer(latency=latency) as server:
+        start = time.perf_counter()
+        requests.get(server.url + "/proxy/v1.svc/mi/v1alpha/job-queue/current-user")
+
+        assert time.perf_counter() - start >= 0.1
+
+
+def test_many_jobs(server, client):
+    server.add_jobs(10_000)
+    server.add_jobs(1_000, status="Pending")
+
+    jobs = client.jobs
+
+    assert len(jobs) == 11_000
+    assert jobs[0].position == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"output_file_size": -1}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        SimulatedJobQueueServer(**kwargs)
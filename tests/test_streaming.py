@@ -0,0 +1,426 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from email.parser import BytesParser
+from email.policy import HTTP
+import io
+import os
+import re
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+from ansys.openapi.common import ApiException, SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import (
+    AsyncJob,
+    FileDownloadError,
+    JobQueueApiClient,
+    OutputFileStream,
+    TextImportJobRequest,
+    TransferProgress,
+)
+from ansys.grantami.jobqueue._streaming import (
+    OUTPUT_FILE_PATH,
+    UPLOAD_PATH,
+    _MultipartFileStream,
+    _StreamingUpload,
+)
+from common import build_gsa_job
+
+SERVICE_LAYER_URL = "http://my_mi_server/mi_servicelayer"
+CHUNK_SIZE = 1000
+
+
+@pytest.fixture
+def large_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes(os.urandom(10 * CHUNK_SIZE + 17))
+    return path
+
+
+@pytest.fixture
+def client():
+    return JobQueueApiClient(requests.Session(), SERVICE_LAYER_URL, SessionConfiguration())
+
+
+def parse_body(content_type, body):
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return list(message.iter_parts())
+
+
+class TestMultipartFileStream:
+    @pytest.mark.parametrize("memory_map", [False, True])
+    @pytest.mark.parametrize("read_size", [1, 333, CHUNK_SIZE, -1])
+    def test_body_is_valid_multipart(self, large_file, memory_map, read_size):
+        with _MultipartFileStream(large_file, "file", CHUNK_SIZE, memory_map, None) as stream:
+            body = b"".join(iter(lambda: stream.read(read_size), b""))
+            content_type = stream.content_type
+
+        assert len(body) == len(stream)
+        (part,) = parse_body(content_type, body)
+        assert part.get_param("name", header="content-disposition") == "file"
+        assert part.get_filename() == "data.txt"
+        assert part.get_content_type() == "text/plain"
+        assert part.get_payload(decode=True) == large_file.read_bytes()
+
+    def test_file_is_read_in_chunks(self, large_file):
+        with _MultipartFileStream(large_file, "file", CHUNK_SIZE, False, None) as stream:
+            chunks = list(stream)
+
+        assert max(len(chunk) for chunk in chunks) <= CHUNK_SIZE
+
+    def test_stream_can_be_rewound(self, large_file):
+        with _MultipartFileStream(large_file, "file", CHUNK_SIZE, False, None) as stream:
+            first = stream.read()
+            assert stream.tell() == len(stream)
+            stream.seek(0)
+            second = stream.read()
+
+        assert first == second
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.touch()
+
+        with _MultipartFileStream(path, "file", CHUNK_SIZE, True, None) as stream:
+            (part,) = parse_body(stream.content_type, stream.read())
+
+        assert part.get_payload(decode=True) == b""
+
+    def test_progress_is_reported_for_each_chunk(self, large_file):
+        progress = []
+
+        with _MultipartFileStream(large_file, "file", CHUNK_SIZE, False, progress.append) as stream:
+            stream.read()
+
+        size = large_file.stat().st_size
+        assert len(progress) == 11
+        assert [p.bytes_transferred for p in progress] == sorted(
+            min((i + 1) * CHUNK_SIZE, size) for i in range(11)
+        )
+        assert all(p.total_bytes == size and p.file_name == "data.txt" for p in progress)
+
+    def test_invalid_chunk_size(self, large_file):
+        with pytest.raises(ValueError, match="chunk_size"):
+            _MultipartFileStream(large_file, "file", 0, False, None)
+
+
+@pytest.mark.parametrize(
+    ["elapsed_seconds", "expected"],
+    [(0.0, 0.0), (2.0, 500.0)],
+)
+def test_transfer_rate(elapsed_seconds, expected):
+    progress = TransferProgress("data.txt", 1000, 2000, elapsed_seconds)
+
+    assert progress.bytes_per_second == expected
+
+
+class TestStreamingUpload:
+    def test_file_is_uploaded(self, client, large_file, requests_mock):
+        received = {}
+
+        def handle_upload(request, context):
+            received["content_type"] = request.headers["Content-Type"]
+            received["body"] = request.body.read()
+            context.headers["Content-Type"] = "text/plain"
+            return "file-id"
+
+        requests_mock.post(client.api_url + UPLOAD_PATH, text=handle_upload)
+
+        file_id = _StreamingUpload(chunk_size=CHUNK_SIZE).upload_file(client, large_file)
+
+        assert file_id == "file-id"
+        (part,) = parse_body(received["content_type"], received["body"])
+        assert part.get_payload(decode=True) == large_file.read_bytes()
+
+    def test_errors_are_raised_after_retries(self, client, large_file, requests_mock, monkeypatch):
+        monkeypatch.setattr("ansys.grantami.jobqueue._retry.time.sleep", Mock())
+        upload = requests_mock.post(
+            client.api_url + UPLOAD_PATH, status_code=500, reason="Server Error"
+        )
+
+        with pytest.raises(ApiException) as exc_info:
+            _StreamingUpload(chunk_size=CHUNK_SIZE).upload_file(client, large_file)
+        assert exc_info.value.status_code == 500
+        assert upload.call_count == client.retry_policy.max_attempts
+
+
+class TestCreateJobWithStreaming:
+    @pytest.fixture
+    def job_request(self, tmp_path, large_file):
+        template = tmp_path / "template.xml"
+        template.write_text("<template/>")
+        return TextImportJobRequest(
+            name="Job", description=None, template_file=template, data_files=[large_file]
+        )
+
+    @pytest.fixture
+    def streaming_client(self, client, requests_mock):
+        client.job_queue_api = Mock(spec=api.JobQueueApi)
+        client.job_queue_api.api_client = client
+        client.job_queue_api.upload_file.return_value = "small-file-id"
+        client.job_queue_api.create_job.side_effect = lambda body: build_gsa_job()
+        requests_mock.post(
+            client.api_url + UPLOAD_PATH,
+            text="large-file-id",
+            headers={"Content-Type": "text/plain"},
+        )
+        client.upload_chunk_size = CHUNK_SIZE
+        return client
+
+    def test_only_large_files_are_streamed(self, streaming_client, job_request, requests_mock):
+        streaming_client.create_job(job_request)
+
+        assert streaming_client.job_queue_api.upload_file.call_count == 1
+        assert requests_mock.call_count == 1
+        assert {file.file_id for file in job_request._files} == {"small-file-id", "large-file-id"}
+
+    def test_streaming_can_be_disabled(self, streaming_client, job_request, requests_mock):
+        streaming_client.upload_chunk_size = None
+
+        streaming_client.create_job(job_request)
+
+        assert streaming_client.job_queue_api.upload_file.call_count == 2
+        assert requests_mock.call_count == 0
+
+    def test_invalid_chunk_size(self, client):
+        with pytest.raises(ValueError, match="upload_chunk_size"):
+            client.upload_chunk_size = 0
+
+
+class _FailingBody(io.BytesIO):
+    def read(self, *args, **kwargs):
+        if self.tell() > CHUNK_SIZE:
+            raise ConnectionError("Connection reset")
+        return super().read(*args, **kwargs)
+
+
+class TestOpenOutput:
+    CONTENT = os.urandom(5 * CHUNK_SIZE + 3)
+
+    @pytest.fixture
+    def job(self, client):
+        job_obj = build_gsa_job(
+            status=models.GsaJobStatus.SUCCEEDED,
+            position=None,
+            output_file_names=["Export.zip", "Export.log"],
+        )
+        return AsyncJob.create_job(job_obj, api.JobQueueApi(client))
+
+    @pytest.fixture
+    def output_url(self, client, job):
+        return client.api_url + OUTPUT_FILE_PATH.format(id=job.id) + "?fileName=Export.zip"
+
+    @pytest.fixture
+    def server(self, requests_mock, output_url):
+        return requests_mock.get(
+            output_url,
+            content=self.CONTENT,
+            headers={"Content-Length": str(len(self.CONTENT))},
+        )
+
+    def test_chunks_are_streamed(self, job, server):
+        with job.open_output("Export.zip") as stream:
+            assert isinstance(stream, OutputFileStream)
+            assert stream.size == len(self.CONTENT)
+            chunks = list(stream.iter_chunks(CHUNK_SIZE))
+
+        assert stream.closed
+        assert b"".join(chunks) == self.CONTENT
+        assert max(len(chunk) for chunk in chunks) <= CHUNK_SIZE
+        assert server.last_request.qs == {"filename": ["export.zip"]}
+
+    def test_progress_is_reported(self, job, server):
+        progress = []
+
+        with job.open_output("Export.zip", progress_callback=progress.append) as stream:
+            stream.read()
+
+        assert progress[-1].bytes_transferred == len(self.CONTENT)
+        assert progress[-1].total_bytes == len(self.CONTENT)
+
+    def test_get_file_content(self, job, server):
+        assert job.get_file_content("Export.zip") == self.CONTENT
+
+    @pytest.mark.parametrize("to_folder", [True, False])
+    def test_download_file(self, job, server, tmp_path, to_folder):
+        target = tmp_path / "Export.zip"
+        target.write_bytes(b"previous content")
+
+        job.download_file("Export.zip", tmp_path if to_folder else str(target))
+
+        assert target.read_bytes() == self.CONTENT
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failed_download_leaves_no_files(self, job, requests_mock, output_url, tmp_path):
+        requests_mock.get(output_url, body=_FailingBody(self.CONTENT))
+        target = tmp_path / "Export.zip"
+        target.write_bytes(b"previous content")
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            job.download_file("Export.zip", target)
+
+        assert target.read_bytes() == b"previous content"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_errors_are_raised(self, job, requests_mock, output_url):
+        requests_mock.get(output_url, status_code=404, reason="Not Found")
+
+        with pytest.raises(ApiException) as exc_info:
+            job.open_output("Export.zip")
+        assert exc_info.value.status_code == 404
+
+    def test_unknown_file_raises_key_error(self, job):
+        with pytest.raises(KeyError, match="Missing.zip"):
+            job.open_output("Missing.zip")
+
+
+class TestDownloadOutputs:
+    @pytest.fixture
+    def jobs(self, client):
+        jobs = []
+        for index in range(3):
+            job_obj = build_gsa_job(
+                status=models.GsaJobStatus.SUCCEEDED,
+                position=None,
+                output_file_names=[f"Export {index}.zip", f"Export {index}.log"],
+            )
+            jobs.append(AsyncJob.create_job(job_obj, api.JobQueueApi(client)))
+        return jobs
+
+    @pytest.fixture
+    def server(self, client, jobs, requests_mock):
+        def handle_download(request, context):
+            content = f"{request.path}?{request.query}".encode()
+            context.headers["Content-Length"] = str(len(content))
+            return content
+
+        def handle_head(request, context):
+            context.headers["Content-Length"] = str(len(handle_download(request, context)))
+            return b""
+
+        output_files = re.compile(re.escape(client.api_url) + r"/.*/outputs:export")
+        requests_mock.head(output_files, content=handle_head)
+        return requests_mock.get(output_files, content=handle_download)
+
+    def test_files_are_saved_per_job(self, client, jobs, server, tmp_path):
+        manifest = client.download_outputs(jobs, tmp_path, max_workers=4)
+
+        assert [(entry.job_id, entry.file_name) for entry in manifest] == [
+            (job.id, name) for job in jobs for name in job.output_file_names
+        ]
+        for entry in manifest:
+            assert entry.downloaded
+            assert entry.path == tmp_path / entry.job_id / entry.file_name
+            assert entry.path.stat().st_size == entry.size
+
+    def test_include_filters_files(self, client, jobs, server, tmp_path):
+        manifest = client.download_outputs(jobs, tmp_path, include="*.zip")
+
+        assert [entry.file_name for entry in manifest] == [f"Export {i}.zip" for i in range(3)]
+        assert server.call_count == 3
+
+    def test_existing_files_are_skipped(self, client, jobs, server, tmp_path):
+        client.download_outputs(jobs, tmp_path)
+        modified = tmp_path / jobs[0].id / "Export 0.log"
+        modified.write_bytes(b"different size")
+
+        manifest = client.download_outputs(jobs, tmp_path)
+
+        assert [entry.path for entry in manifest if entry.downloaded] == [modified]
+        assert modified.stat().st_size == manifest[1].size
+
+    def test_existing_files_are_not_requested(self, client, jobs, server, tmp_path):
+        client.download_outputs(jobs, tmp_path)
+        download_count = server.call_count
+
+        manifest = client.download_outputs(jobs, tmp_path)
+
+        assert not any(entry.downloaded for entry in manifest)
+        assert server.call_count == download_count
+
+    def test_size_of_download_is_used_if_head_is_not_supported(
+        self, client, jobs, server, tmp_path, requests_mock
+    ):
+        client.download_outputs(jobs, tmp_path)
+        output_files = re.compile(re.escape(client.api_url) + r"/.*/outputs:export")
+        requests_mock.head(output_files, status_code=405, reason="Method Not Allowed")
+        download_count = server.call_count
+
+        manifest = client.download_outputs(jobs, tmp_path)
+
+        assert not any(entry.downloaded for entry in manifest)
+        assert server.call_count == download_count + 6
+
+    def test_folders_are_preserved(self, client, jobs, server, tmp_path):
+        jobs[0]._output_files = ["Images\\Picture.png", "Thumbnails/Picture.png"]
+
+        manifest = client.download_outputs(jobs[:1], tmp_path)
+
+        assert [entry.path for entry in manifest] == [
+            tmp_path / jobs[0].id / "Images" / "Picture.png",
+            tmp_path / jobs[0].id / "Thumbnails" / "Picture.png",
+        ]
+
+    def test_duplicate_paths_raise_error(self, client, jobs, server, tmp_path):
+        jobs[0]._output_files = ["Export.zip", "export.ZIP"]
+
+        with pytest.raises(ValueError, match="would both be saved"):
+            client.download_outputs(jobs, tmp_path)
+        assert server.call_count == 0
+
+    def test_repeated_jobs_are_downloaded_once(self, client, jobs, server, tmp_path):
+        manifest = client.download_outputs(jobs[:1] * 2, tmp_path)
+
+        assert len(manifest) == 2
+        assert server.call_count == 2
+
+    @pytest.mark.parametrize("file_name", ["../Export.zip", "C:\\Export.zip", "/Export.zip", ""])
+    def test_unsafe_paths_raise_error(self, client, jobs, server, tmp_path, file_name):
+        jobs[0]._output_files = [file_name]
+
+        with pytest.raises(ValueError, match="cannot be saved"):
+            client.download_outputs(jobs, tmp_path)
+
+    def test_failures_are_collected(self, client, jobs, server, tmp_path, requests_mock):
+        url = client.api_url + OUTPUT_FILE_PATH.format(id=jobs[1].id)
+        requests_mock.get(url, status_code=500, reason="Server Error")
+        client.retry_policy = None
+
+        with pytest.raises(FileDownloadError) as exc_info:
+            client.download_outputs(jobs, tmp_path)
+
+        assert set(exc_info.value.errors) == {
+            tmp_path / jobs[1].id / name for name in jobs[1].output_file_names
+        }
+        assert all(isinstance(e, ApiException) for e in exc_info.value.errors.values())
+        assert len(exc_info.value.manifest) == 4
+
+    def test_deleted_jobs_raise_error(self, client, jobs, tmp_path):
+        jobs[0]._is_deleted = True
+
+        with pytest.raises(ValueError, match="deleted"):
+            client.download_outputs(jobs, tmp_path)
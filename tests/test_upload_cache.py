@@ -0,0 +1,222 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api
+from ansys.openapi.common import ApiException
+import pytest
+
+from ansys.grantami.jobqueue import (
+    JobFile,
+    JobRequest,
+    TextImportJobRequest,
+    UploadCache,
+    UploadCacheStatistics,
+)
+from ansys.grantami.jobqueue._models import _FileType, _JobFile
+
+
+@pytest.fixture
+def files(tmp_path):
+    template = tmp_path / "template.xml"
+    template.write_text("<template/>")
+    data = tmp_path / "data.txt"
+    data.write_text("data")
+    copy = tmp_path / "copy.txt"
+    copy.write_text("data")
+    return template, data, copy
+
+
+@pytest.fixture
+def api_client():
+    api_client = Mock(spec=api.JobQueueApi)
+    ids = iter(range(1000))
+    api_client.upload_file.side_effect = lambda file: f"id-{next(ids)}"
+    return api_client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("ansys.grantami.jobqueue._upload_cache.time.monotonic", lambda: now[0])
+    return now
+
+
+def make_request(template, data):
+    return TextImportJobRequest(
+        name="Job", description=None, template_file=template, data_files=[data]
+    )
+
+
+def cache_upload(api_client, cache, path):
+    return JobRequest._upload_file(api_client, _JobFile(path, _FileType.Data), cache)
+
+
+def test_identical_files_are_uploaded_once(files, api_client):
+    template, data, _ = files
+    cache = UploadCache()
+
+    assert make_request(template, data)._post_files(api_client, upload_cache=cache) == set()
+    reused = make_request(template, data)._post_files(api_client, upload_cache=cache)
+
+    assert api_client.upload_file.call_count == 2
+    assert reused == {"id-0", "id-1"}
+    assert cache.statistics == UploadCacheStatistics(hits=2, misses=2, invalidations=0, entries=2)
+
+
+def test_files_with_different_names_are_uploaded_separately(files, api_client):
+    template, data, copy = files
+    cache = UploadCache()
+
+    make_request(template, data)._post_files(api_client, upload_cache=cache)
+    request = make_request(template, copy)
+    reused = request._post_files(api_client, upload_cache=cache)
+
+    assert api_client.upload_file.call_count == 3
+    assert reused == {"id-0"}
+    assert [file.file_id for file in request._files] == ["id-0", "id-2"]
+
+
+def test_files_with_different_virtual_paths_are_uploaded_separately(files, api_client):
+    template, data, _ = files
+    cache = UploadCache()
+    request = TextImportJobRequest(
+        name="Job",
+        description=None,
+        template_file=template,
+        data_files=[data],
+        attachment_files=[JobFile(data, "first/data.txt"), JobFile(data, "second/data.txt")],
+    )
+
+    request._post_files(api_client, upload_cache=cache)
+
+    assert api_client.upload_file.call_count == 4
+    assert len({file.file_id for file in request._files}) == 4
+
+
+def test_modified_file_is_uploaded_again(files, api_client):
+    template, data, _ = files
+    cache = UploadCache()
+    make_request(template, data)._post_files(api_client, upload_cache=cache)
+
+    data.write_text("new data")
+    os.utime(data, ns=(0, 0))
+    request = make_request(template, data)
+    request._post_files(api_client, upload_cache=cache)
+
+    assert api_client.upload_file.call_count == 3
+    assert [file.file_id for file in request._files] == ["id-0", "id-2"]
+
+
+def test_expired_ids_are_not_reused(files, api_client, clock):
+    template, data, _ = files
+    cache = UploadCache(lifetime=60)
+    make_request(template, data)._post_files(api_client, upload_cache=cache)
+
+    clock[0] = 61
+    make_request(template, data)._post_files(api_client, upload_cache=cache)
+
+    assert api_client.upload_file.call_count == 4
+    assert cache.statistics.hits == 0
+
+
+def test_invalidate(files, api_client):
+    template, data, _ = files
+    cache = UploadCache()
+    make_request(template, data)._post_files(api_client, upload_cache=cache)
+
+    assert cache._invalidate(["id-0", "unknown"]) == 1
+    assert cache.statistics.invalidations == 1
+    assert cache.statistics.entries == 1
+
+
+def test_clear(files, api_client):
+    template, data, _ = files
+    cache = UploadCache()
+    make_request(template, data)._post_files(api_client, upload_cache=cache)
+
+    cache.clear()
+
+    assert cache.statistics == UploadCacheStatistics(hits=0, misses=0, invalidations=0, entries=0)
+
+
+def test_concurrent_uploads_of_same_file_are_shared(files, api_client):
+    _, data, _ = files
+    cache = UploadCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def upload_file(file):
+        started.set()
+        release.wait(5)
+        return f"id-{file.name}"
+
+    api_client.upload_file.side_effect = upload_file
+    first = threading.Thread(target=cache_upload, args=(api_client, cache, data))
+    second = threading.Thread(target=cache_upload, args=(api_client, cache, data))
+    first.start()
+    assert started.wait(5)
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join()
+    second.join()
+
+    assert api_client.upload_file.call_count == 1
+    assert cache.statistics == UploadCacheStatistics(hits=1, misses=1, invalidations=0, entries=1)
+
+
+def test_failed_upload_is_retried_by_next_caller(files, api_client):
+    _, data, _ = files
+    cache = UploadCache()
+    api_client.upload_file.side_effect = [ApiException(500, "Server Error"), "id-0"]
+
+    with pytest.raises(ApiException):
+        cache_upload(api_client, cache, data)
+    file_id, reused = cache_upload(api_client, cache, data)
+
+    assert (file_id, reused) == ("id-0", False)
+    assert cache.statistics.misses == 2
+
+
+def test_file_hashes_are_bounded(files, monkeypatch):
+    monkeypatch.setattr("ansys.grantami.jobqueue._upload_cache._MAX_DIGESTS", 2)
+    template, data, copy = files
+    cache = UploadCache()
+
+    for path in [template, data, template, copy]:
+        cache._get_content_key(path)
+
+    assert [stat_key[0] for stat_key in cache._digests] == [
+        str(template.resolve()),
+        str(copy.resolve()),
+    ]
+
+
+def test_invalid_lifetime():
+    with pytest.raises(ValueError, match="lifetime"):
+        UploadCache(lifetime=0)
@@ -0,0 +1,172 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+from unittest.mock import Mock
+
+from ansys.openapi.common import SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import Connection, JobQueueApiClient, ServerVersionCache
+
+URL = "http://my_mi_server/mi_servicelayer/proxy/v1.svc/mi"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("ansys.grantami.jobqueue._version_cache.time.time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ServerVersionCache(tmp_path / "cache" / "versions.json", ttl=60)
+
+
+def test_versions_are_cached(cache, clock):
+    assert cache.get(URL) is None
+
+    cache.set(URL, (25, 2))
+
+    assert cache.get(URL) == (25, 2)
+    assert ServerVersionCache(cache.path).get(URL) == (25, 2)
+
+
+def test_versions_expire(cache, clock):
+    cache.set(URL, (25, 2))
+    clock[0] += 60
+
+    assert cache.get(URL) is None
+
+
+def test_expired_entries_are_removed(cache, clock):
+    cache.set("http://other", (24, 2))
+    clock[0] += 30
+    cache.set(URL, (25, 2))
+    clock[0] += 40
+    cache.set(URL, (25, 2))
+
+    assert list(json.loads(cache.path.read_text())) == [URL]
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", '{"url": {"version": "x"}}'])
+def test_invalid_file_is_ignored(cache, clock, content):
+    cache.path.parent.mkdir()
+    cache.path.write_text(content.replace("url", URL))
+
+    assert cache.get(URL) is None
+    cache.set(URL, (25, 2))
+    assert cache.get(URL) == (25, 2)
+
+
+def test_clear(cache, clock):
+    cache.set(URL, (25, 2))
+
+    cache.clear()
+    cache.clear()
+
+    assert cache.get(URL) is None
+    assert not cache.path.exists()
+
+
+def test_invalid_ttl():
+    with pytest.raises(ValueError, match="ttl"):
+        ServerVersionCache(ttl=0)
+
+
+class TestConnectionCheck:
+    @pytest.fixture
+    def client(self):
+        return JobQueueApiClient(
+            requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+        )
+
+    @pytest.fixture
+    def get_version(self, monkeypatch):
+        get_version = Mock(return_value=(25, 2))
+        monkeypatch.setattr(
+            "ansys.grantami.jobqueue._connection._get_mi_server_version", get_version
+        )
+        return get_version
+
+    @pytest.fixture
+    def definition(self, client, requests_mock):
+        return requests_mock.get(f"{client.api_url}/swagger/v1/swagger.json", text="{}")
+
+    def test_version_is_added_to_cache(self, client, cache, get_version, definition):
+        Connection._test_connection(client, cache)
+
+        assert definition.call_count == 1
+        get_version.assert_called_once_with(client)
+        assert cache.get(client.api_url) == (25, 2)
+
+    def test_cached_version_skips_checks(self, client, cache, get_version, definition):
+        cache.set(client.api_url, (25, 2))
+
+        Connection._test_connection(client, cache)
+
+        assert definition.call_count == 0
+        get_version.assert_not_called()
+
+    def test_unsupported_cached_version_is_checked(self, client, cache, get_version, definition):
+        cache.set(client.api_url, (23, 2))
+
+        Connection._test_connection(client, cache)
+
+        assert definition.call_count == 1
+        assert cache.get(client.api_url) == (25, 2)
+
+    def test_missing_definition_is_not_cached(self, client, cache, get_version, requests_mock):
+        requests_mock.get(f"{client.api_url}/swagger/v1/swagger.json", status_code=404)
+
+        with pytest.raises(ConnectionError, match="Cannot find the Server API definition"):
+            Connection._test_connection(client, cache)
+        assert cache.get(client.api_url) is None
+
+    def test_definition_check_is_retried(self, client, get_version, requests_mock, monkeypatch):
+        monkeypatch.setattr("ansys.grantami.jobqueue._retry.time.sleep", lambda _: None)
+        definition = requests_mock.get(
+            f"{client.api_url}/swagger/v1/swagger.json",
+            [{"status_code": 503}, {"text": "{}"}],
+        )
+
+        Connection._test_connection(client)
+
+        assert definition.call_count == 2
+
+    def test_definition_check_is_reported_to_hooks(self, client, get_version, definition):
+        events = []
+        client.add_request_hook(events.append)
+
+        Connection._test_connection(client)
+
+        assert [(e.method, e.endpoint, e.status_code) for e in events] == [
+            ("GET", "/swagger/v1/swagger.json", 200)
+        ]
+
+    def test_unsupported_version_is_not_cached(self, client, cache, get_version, definition):
+        get_version.return_value = (23, 2)
+
+        with pytest.raises(ConnectionError, match="requires a more recent Granta MI version"):
+            Connection._test_connection(client, cache)
+        assert cache.get(client.api_url) is None
@@ -0,0 +1,341 @@
+# Copyright (C) 2024 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+import logging
+import queue
+import threading
+from unittest.mock import Mock
+
+from ansys.grantami.serverapi_openapi.v2025r2 import api, models
+from ansys.openapi.common import ApiException, SessionConfiguration
+import pytest
+import requests
+
+from ansys.grantami.jobqueue import (
+    JobEvent,
+    JobEventType,
+    JobQueueApiClient,
+    JobQueueProcessingConfiguration,
+    JobStatus,
+    JobWatcher,
+)
+from common import build_gsa_job
+
+SUBMITTED = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+STARTED = SUBMITTED + datetime.timedelta(minutes=1)
+
+# Long enough that the watcher thread never polls by itself during a test
+NEVER = 3600.0
+
+
+def build_job_obj(job_id, status=models.GsaJobStatus.PENDING, position=None):
+    if status == models.GsaJobStatus.PENDING and position is None:
+        position = 1
+    started = status not in (models.GsaJobStatus.PENDING, models.GsaJobStatus.CANCELLED)
+    return build_gsa_job(
+        job_id,
+        status=status,
+        position=position if status == models.GsaJobStatus.PENDING else None,
+        submission_date=SUBMITTED,
+        execution_date=STARTED if started else None,
+    )
+
+
+class EventRecorder:
+    def __init__(self):
+        self.events = queue.Queue()
+
+    def __call__(self, event):
+        self.events.put(event)
+
+    def get(self, count):
+        return [self.events.get(timeout=5) for _ in range(count)]
+
+    def assert_empty(self, timeout=0.1):
+        with pytest.raises(queue.Empty):
+            self.events.get(timeout=timeout)
+
+
+@pytest.fixture
+def client():
+    client = JobQueueApiClient(
+        requests.Session(), "http://my_mi_server/mi_servicelayer", SessionConfiguration()
+    )
+    client.job_queue_api = Mock(spec=api.JobQueueApi)
+    client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(results=[])
+    return client
+
+
+def set_jobs(client, *job_objs):
+    client.job_queue_api.get_jobs.return_value = models.GsaGetJobsResponse(results=list(job_objs))
+
+
+@pytest.fixture
+def recorder():
+    return EventRecorder()
+
+
+@pytest.fixture
+def watcher(client, recorder):
+    watcher = JobWatcher(client, interval=NEVER)
+    watcher.subscribe(recorder)
+    watcher.start()
+    yield watcher
+    watcher.stop()
+
+
+def event_summary(events):
+    return [(e.event_type, e.job.id, e.previous_status, e.previous_position) for e in events]
+
+
+class TestEvents:
+    def test_existing_jobs_raise_no_events(self, client, recorder):
+        set_jobs(
+            client, build_job_obj("job-1"), build_job_obj("job-2", models.GsaJobStatus.RUNNING)
+        )
+        with JobWatcher(client, interval=NEVER) as watcher:
+            watcher.subscribe(recorder)
+            client._refetch_jobs()
+            recorder.assert_empty()
+        assert client.job_queue_api.get_jobs.call_count == 2
+
+    def test_job_lifecycle(self, client, recorder, watcher):
+        for job_obj in [
+            build_job_obj("job-1", position=3),
+            build_job_obj("job-1", position=2),
+            build_job_obj("job-1", models.GsaJobStatus.RUNNING),
+            build_job_obj("job-1", models.GsaJobStatus.SUCCEEDED),
+        ]:
+            set_jobs(client, job_obj)
+            client._refetch_jobs()
+        set_jobs(client)
+        client._refetch_jobs()
+
+        assert event_summary(recorder.get(5)) == [
+            (JobEventType.Submitted, "job-1", None, None),
+            (JobEventType.PositionChanged, "job-1", JobStatus.Pending, 3),
+            (JobEventType.Started, "job-1", JobStatus.Pending, 2),
+            (JobEventType.Succeeded, "job-1", JobStatus.Running, None),
+            (JobEventType.Deleted, "job-1", JobStatus.Succeeded, None),
+        ]
+        recorder.assert_empty()
+
+    def test_job_completed_between_polls_is_started_first(self, client, recorder, watcher):
+        set_jobs(client, build_job_obj("job-1"))
+        client._refetch_jobs()
+        set_jobs(client, build_job_obj("job-1", models.GsaJobStatus.FAILED))
+        client._refetch_jobs()
+
+        assert event_summary(recorder.get(3)) == [
+            (JobEventType.Submitted, "job-1", None, None),
+            (JobEventType.Started, "job-1", JobStatus.Pending, 1),
+            (JobEventType.Failed, "job-1", JobStatus.Running, None),
+        ]
+
+    def test_cancelled_pending_job_is_not_started(self, client, recorder, watcher):
+        set_jobs(client, build_job_obj("job-1"))
+        client._refetch_jobs()
+        set_jobs(client, build_job_obj("job-1", models.GsaJobStatus.CANCELLED))
+        client._refetch_jobs()
+
+        assert event_summary(recorder.get(2)) == [
+            (JobEventType.Submitted, "job-1", None, None),
+            (JobEventType.Failed, "job-1", JobStatus.Pending, 1),
+        ]
+        recorder.assert_empty()
+
+    def test_unchanged_jobs_raise_no_events(self, client, recorder, watcher):
+        set_jobs(client, build_job_obj("job-1"))
+        client._refetch_jobs()
+        recorder.get(1)
+        client._refetch_jobs()
+        recorder.assert_empty()
+
+    def test_job_update_raises_events(self, client, recorder, watcher):
+        set_jobs(client, build_job_obj("job-1"))
+        client._refetch_jobs()
+        client.job_queue_api.get_job.return_value = build_job_obj(
+            "job-1", models.GsaJobStatus.RUNNING
+        )
+        client.job_queue_api.api_client = client
+        client.get_job_by_id("job-1").update()
+
+        events = recorder.get(2)
+        assert [e.event_type for e in events] == [JobEventType.Submitted, JobEventType.Started]
+
+    def test_deleted_jobs_are_reported_once(self, client, recorder, watcher):
+        set_jobs(client, build_job_obj("job-1"))
+        client._refetch_jobs()
+        set_jobs(client)
+        client.delete_jobs([client.get_job_by_id("job-1")])
+        client._refetch_jobs()
+
+        events = recorder.get(2)
+        assert [e.event_type for e in events] == [JobEventType.Submitted, JobEventType.Deleted]
+        assert events[1].job.status is JobStatus.Deleted
+        recorder.assert_empty()
+
+
+class TestSubscriptions:
+    def test_filter_by_event_type_and_job(self, client, watcher, recorder):
+        started = EventRecorder()
+        job_2 = EventRecorder()
+        watcher.subscribe(started, event_types=[JobEventType.Started])
+        watcher.subscribe(job_2, jobs=["job-2"])
+
+        set_jobs(client, build_job_obj("job-1"), build_job_obj("job-2"))
+        client._refetch_jobs()
+        set_jobs(
+            client,
+            build_job_obj("job-1", models.GsaJobStatus.RUNNING),
+            build_job_obj("job-2", models.GsaJobStatus.RUNNING),
+        )
+        client._refetch_jobs()
+
+        recorder.get(4)
+        assert event_summary(started.get(2)) == [
+            (JobEventType.Started, "job-1", JobStatus.Pending, 1),
+            (JobEventType.Started, "job-2", JobStatus.Pending, 1),
+        ]
+        assert [e.event_type for e in job_2.get(2)] == [
+            JobEventType.Submitted,
+            JobEventType.Started,
+        ]
+        started.assert_empty()
+        job_2.assert_empty()
+
+    def test_callback_exceptions_are_logged(self, client, watcher, recorder, caplog):
+        failing = Mock(side_effect=RuntimeError("Callback failed"))
+        watcher.subscribe(failing)
+        watcher.subscribe(recorder)
+
+        with caplog.at_level(logging.WARNING, logger="ansys.grantami.jobqueue"):
+            set_jobs(client, build_job_obj("job-1"))
+            client._refetch_jobs()
+            first, second = recorder.get(2)
+
+        assert isinstance(first, JobEvent)
+        assert failing.call_count == 1
+        assert "Callback failed" in caplog.text
+
+    def test_unsubscribe(self, client, watcher, recorder):
+        watcher.unsubscribe(recorder)
+        set_jobs(client, build_job_obj("job-1"))
+        client._refetch_jobs()
+        recorder.assert_empty()
+
+    def test_unsubscribe_unknown_callback(self, watcher):
+        with pytest.raises(ValueError, match="not subscribed"):
+            watcher.unsubscribe(lambda event: None)
+
+
+class TestLifecycle:
+    def test_watcher_polls_in_background(self, client, recorder):
+        polled = threading.Event()
+        set_jobs(client, build_job_obj("job-1"))
+
+        def get_jobs():
+            if client.job_queue_api.get_jobs.call_count > 1:
+                polled.set()
+            return models.GsaGetJobsResponse(results=[build_job_obj("job-1")])
+
+        with JobWatcher(client, interval=0.01) as watcher:
+            client.job_queue_api.get_jobs.side_effect = get_jobs
+            watcher.subscribe(recorder)
+            assert polled.wait(timeout=5)
+        recorder.assert_empty()
+
+    def test_poll_errors_are_logged(self, client, recorder, caplog):
+        polled = threading.Event()
+
+        def get_jobs():
+            # The first poll by the watcher thread is the second request
+            if client.job_queue_api.get_jobs.call_count > 2:
+                polled.set()
+                return models.GsaGetJobsResponse(results=[build_job_obj("job-1")])
+            raise ApiException(503, "Service Unavailable")
+
+        with JobWatcher(client, interval=0.01) as watcher:
+            watcher.subscribe(recorder)
+            with caplog.at_level(logging.WARNING, logger="ansys.grantami.jobqueue"):
+                client.job_queue_api.get_jobs.side_effect = get_jobs
+                assert polled.wait(timeout=5)
+                assert recorder.get(1)[0].event_type is JobEventType.Submitted
+        assert "failed to refresh the list of jobs" in caplog.text
+
+    def test_start_and_stop(self, client):
+        watcher = JobWatcher(client, interval=NEVER)
+        assert not watcher.is_running
+        watcher.start()
+        assert watcher.is_running
+        assert client._job_watchers == (watcher,)
+        with pytest.raises(RuntimeError, match="already running"):
+            watcher.start()
+        watcher.stop()
+        assert not watcher.is_running
+        assert client._job_watchers == ()
+        watcher.stop()
+
+    def test_watchers_are_registered_once(self, client):
+        watcher = JobWatcher(client, interval=NEVER)
+        other = JobWatcher(client, interval=NEVER)
+
+        client._register_job_watcher(watcher)
+        client._register_job_watcher(other)
+        client._register_job_watcher(watcher)
+        assert client._job_watchers == (watcher, other)
+
+        client._unregister_job_watcher(watcher)
+        client._unregister_job_watcher(watcher)
+        assert client._job_watchers == (other,)
+
+    def test_stop_from_callback(self, client):
+        stopped = threading.Event()
+        watcher = JobWatcher(client, interval=NEVER)
+
+        def stop(event):
+            watcher.stop()
+            stopped.set()
+
+        watcher.subscribe(stop)
+        watcher.start()
+        set_jobs(client, build_job_obj("job-1"))
+        client._refetch_jobs()
+        assert stopped.wait(timeout=5)
+        assert not watcher.is_running
+
+    def test_default_interval_from_processing_configuration(self, client):
+        client._processing_configuration = JobQueueProcessingConfiguration(
+            purge_job_age_in_milliseconds=1,
+            purge_interval_in_milliseconds=1,
+            polling_interval_in_milliseconds=2000,
+            concurrency=1,
+        )
+        watcher = JobWatcher(client)
+        with watcher:
+            assert watcher._thread._args == (2.0,)
+
+    @pytest.mark.parametrize("interval", [0, -1.0])
+    def test_invalid_interval(self, client, interval):
+        with pytest.raises(ValueError, match="interval"):
+            JobWatcher(client, interval=interval)